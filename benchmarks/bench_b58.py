@@ -0,0 +1,56 @@
+"""
+Compares solathon.core.b58 against the base58 package on public keys (32 bytes)
+and signatures (64 bytes), one at a time and in batches.
+
+Usage: python benchmarks/bench_b58.py
+"""
+from __future__ import annotations
+
+import os
+import timeit
+
+import base58
+
+from solathon.core import b58
+
+
+def per_call(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"backend: {b58.BACKEND}")
+    print(f"{'operation':<24} {'base58 (us)':>12} {'b58 (us)':>10} {'speedup':>8}")
+    for name, size in (("public key", 32), ("signature", 64)):
+        value = os.urandom(size)
+        encoded = base58.b58encode(value).decode("utf-8")
+        rows = [
+            (f"encode {name}", lambda: base58.b58encode(value), lambda: b58.b58encode(value)),
+            (f"decode {name}", lambda: base58.b58decode(encoded), lambda: b58.b58decode(encoded)),
+        ]
+        for label, reference, current in rows:
+            reference_time = per_call(reference, 20000)
+            current_time = per_call(current, 20000)
+            print(
+                f"{label:<24} {reference_time * 1e6:>12.2f} {current_time * 1e6:>10.2f} "
+                f"{reference_time / current_time:>7.1f}x"
+            )
+
+    keys = [os.urandom(32) for _ in range(10000)]
+    encoded_keys = [base58.b58encode(key).decode("utf-8") for key in keys]
+    rows = [
+        ("encode 10k keys", lambda: [base58.b58encode(key) for key in keys], lambda: b58.b58encode_many(keys)),
+        ("decode 10k keys", lambda: [base58.b58decode(key) for key in encoded_keys],
+         lambda: b58.b58decode_many(encoded_keys)),
+    ]
+    for label, reference, current in rows:
+        reference_time = per_call(reference, 3)
+        current_time = per_call(current, 3)
+        print(
+            f"{label:<24} {reference_time * 1e6:>12.0f} {current_time * 1e6:>10.0f} "
+            f"{reference_time / current_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measures scanning a JSON block for system program instructions with
+decode_block_system_instructions, against parsing every instruction of the system
+program with the construct layout after comparing base58 program ids.
+
+Usage: python benchmarks/bench_block_scan.py [transactions]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from solathon import Keypair, Transaction
+from solathon.core.b58 import b58decode, b58encode
+from solathon.core.instructions import AccountMeta, Instruction, set_compute_unit_price, transfer
+from solathon.core.layouts import SYSTEM_INSTRUCTIONS_LAYOUT
+from solathon.core.message import Message
+from solathon.core.system_program import decode_block_system_instructions
+from solathon.core.types.block import Block
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def json_transaction(transaction: Transaction) -> dict:
+    transaction.sign()
+    message = Message.from_buffer(transaction.compile_transaction())
+    return {
+        "meta": {
+            "err": None, "fee": 5000, "innerInstructions": [], "logMessages": [], "postBalances": [],
+            "postTokenBalances": [], "preBalances": [], "preTokenBalances": [], "rewards": None,
+        },
+        "transaction": {
+            "message": {
+                "accountKeys": [str(key) for key in message.account_keys],
+                "header": {
+                    "numRequiredSignatures": message.header.num_required_signatures,
+                    "numReadonlySignedAccounts": message.header.num_readonly_signed_accounts,
+                    "numReadonlyUnsignedAccounts": message.header.num_readonly_unsigned_accounts,
+                },
+                "instructions": [
+                    {"programIdIndex": instruction.program_id_index, "accounts": list(instruction.accounts),
+                     "data": instruction.data}
+                    for instruction in message.instructions
+                ],
+                "recentBlockhash": message.recent_blockhash,
+            },
+            "signatures": [b58encode(pair.signature) for pair in transaction.signatures],
+        },
+    }
+
+
+def build_block(count: int) -> dict:
+    # Mostly program transactions, a quarter of them with a transfer
+    rng = random.Random(0)
+    payers = [Keypair() for _ in range(32)]
+    accounts = [Keypair().public_key for _ in range(128)]
+    program = Keypair().public_key
+    transactions = []
+    for i in range(count):
+        payer = payers[i % len(payers)]
+        instructions = [
+            set_compute_unit_price(1000),
+            Instruction(
+                keys=[AccountMeta(account, False, True) for account in rng.sample(accounts, 6)],
+                program_id=program,
+                data=bytes(16),
+            ),
+        ]
+        if i % 4 == 0:
+            instructions.append(transfer(payer.public_key, rng.choice(accounts), i + 1))
+        transactions.append(json_transaction(
+            Transaction(instructions=instructions, signers=[payer], recent_blockhash=BLOCKHASH)
+        ))
+    return {
+        "blockHeight": 1, "blockTime": None, "blockhash": BLOCKHASH, "parentSlot": 0,
+        "previousBlockhash": BLOCKHASH, "transactions": transactions,
+    }
+
+
+def legacy_scan(block: Block) -> list:
+    found = []
+    for element in block.transactions:
+        message = element.transaction.message
+        for instruction in message.instructions:
+            if str(message.account_keys[instruction.program_id_index]) != "11111111111111111111111111111111":
+                continue
+            parsed = SYSTEM_INSTRUCTIONS_LAYOUT.parse(b58decode(instruction.data))
+            found.append((parsed, [str(message.account_keys[index]) for index in instruction.accounts]))
+    return found
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    block = Block(build_block(count))
+
+    start = time.perf_counter()
+    legacy = legacy_scan(block)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = decode_block_system_instructions(block)
+    current_time = time.perf_counter() - start
+    assert len(decoded) == len(legacy)
+
+    print(f"{count} transactions, {len(decoded)} system instructions")
+    print(f"  construct, by base58 program id: {legacy_time * 1000:8.1f} ms")
+    print(f"  decode_block_system_instructions: {current_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
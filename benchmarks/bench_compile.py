@@ -0,0 +1,125 @@
+"""
+Compares Transaction.compile_transaction against the previous string keyed
+implementation on transactions with many instructions and accounts.
+
+Usage: python benchmarks/bench_compile.py
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Dict, List, NamedTuple
+
+from base58 import b58decode, b58encode
+from nacl.public import PrivateKey as NaclPrivateKey
+
+from solathon import Keypair, PublicKey, Transaction
+from solathon.core.instructions import AccountMeta, Instruction, transfer
+from solathon.core.message import encode_length, to_uint8_bytes
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def legacy_compile(transaction: Transaction) -> bytes:
+    # The compile path keyed by base58 strings, kept here as the baseline
+    account_metas: List[AccountMeta] = []
+    program_ids: List[str] = []
+    for instruction in transaction.instructions:
+        account_metas.extend(
+            AccountMeta(a_m.public_key, a_m.is_signer, a_m.is_writable)
+            for a_m in instruction.keys
+        )
+        if str(instruction.program_id) not in program_ids:
+            program_ids.append(str(instruction.program_id))
+    for program_id in program_ids:
+        account_metas.append(AccountMeta(PublicKey(program_id), False, False))
+    account_metas.sort(key=lambda account: (not account.is_signer, not account.is_writable))
+
+    seen: Dict[str, int] = {}
+    uniq_metas: List[AccountMeta] = []
+    for sig in transaction.signatures:
+        public_key = str(sig.public_key)
+        if public_key in seen:
+            uniq_metas[seen[public_key]].is_signer = True
+        else:
+            uniq_metas.append(AccountMeta(sig.public_key, True, True))
+            seen[public_key] = len(uniq_metas) - 1
+    for a_m in account_metas:
+        public_key = str(a_m.public_key)
+        if public_key in seen:
+            idx = seen[public_key]
+            uniq_metas[idx].is_writable = uniq_metas[idx].is_writable or a_m.is_writable
+        else:
+            uniq_metas.append(a_m)
+            seen[public_key] = len(uniq_metas) - 1
+
+    signed_keys: List[str] = []
+    unsigned_keys: List[str] = []
+    header = [0, 0, 0]
+    for a_m in uniq_metas:
+        if a_m.is_signer:
+            signed_keys.append(str(a_m.public_key))
+            header[0] += 1
+            header[1] += int(not a_m.is_writable)
+        else:
+            header[2] += int(not a_m.is_writable)
+            unsigned_keys.append(str(a_m.public_key))
+    account_keys = [PublicKey(key) for key in signed_keys + unsigned_keys]
+    account_indices = {str(key): i for i, key in enumerate(account_keys)}
+
+    InstructionFormat = NamedTuple("InstructionFormat", [
+        ("program_idx", bytes), ("accounts_length", bytes), ("accounts", bytes),
+        ("data_length", bytes), ("data", bytes),
+    ])
+    encoded_instructions = []
+    for instr in transaction.instructions:
+        accounts = [account_indices[str(a_m.public_key)] for a_m in instr.keys]
+        data = b58decode(b58encode(instr.data))
+        encoded_instructions.append(b"".join(InstructionFormat(
+            to_uint8_bytes(account_indices[str(instr.program_id)]),
+            encode_length(len(accounts)), bytes(accounts),
+            encode_length(len(data)), data,
+        )))
+    return b"".join([
+        bytes(header),
+        encode_length(len(account_keys)),
+        b"".join(bytes(key) for key in account_keys),
+        b58decode(BLOCKHASH),
+        encode_length(len(encoded_instructions)),
+        *encoded_instructions,
+    ])
+
+
+def build_transaction(num_instructions: int, num_accounts: int) -> Transaction:
+    signers = [Keypair(NaclPrivateKey(bytes([i + 1]) * 32)) for i in range(2)]
+    accounts = [Keypair(NaclPrivateKey(bytes([i + 10]) * 32)).public_key for i in range(num_accounts)]
+    program = Keypair(NaclPrivateKey(bytes([255]) * 32)).public_key
+    instructions = []
+    for i in range(num_instructions):
+        if i % 2:
+            instructions.append(transfer(signers[i % 2].public_key, accounts[i % num_accounts], i))
+        else:
+            instructions.append(Instruction(
+                keys=[AccountMeta(accounts[(i + j) % num_accounts], False, j == 0) for j in range(4)],
+                program_id=program,
+                data=bytes(range(32)),
+            ))
+    return Transaction(instructions=instructions, signers=signers, recent_blockhash=BLOCKHASH)
+
+
+def main() -> None:
+    print(f"{'instructions':>12} {'accounts':>8} {'legacy (ms)':>12} {'current (ms)':>12} {'speedup':>8}")
+    for num_instructions, num_accounts in [(2, 2), (16, 16), (64, 32), (256, 64)]:
+        transaction = build_transaction(num_instructions, num_accounts)
+        assert legacy_compile(transaction) == transaction.compile_transaction()
+
+        number = max(2000 // num_instructions, 5)
+        legacy = min(timeit.repeat(lambda: legacy_compile(transaction), number=number, repeat=5)) / number
+        current = min(timeit.repeat(transaction.compile_transaction, number=number, repeat=5)) / number
+        print(
+            f"{num_instructions:>12} {num_accounts:>8} {legacy * 1000:>12.3f} "
+            f"{current * 1000:>12.3f} {legacy / current:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
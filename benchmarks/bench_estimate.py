@@ -0,0 +1,54 @@
+"""
+Measures estimate_transaction against compiling, signing and serializing a
+transaction to learn its size.
+
+Usage: python benchmarks/bench_estimate.py [transactions]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from solathon import Keypair, Transaction
+from solathon.compute_budget import estimate_transaction
+from solathon.core.instructions import set_compute_unit_limit, set_compute_unit_price, transfer
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    payer = Keypair()
+    receivers = [Keypair().public_key for _ in range(8)]
+    instructions = [
+        set_compute_unit_limit(10_000),
+        set_compute_unit_price(5_000),
+        *[transfer(payer.public_key, receiver, 1) for receiver in receivers],
+    ]
+
+    start = time.perf_counter()
+    for _ in range(count):
+        transaction = Transaction(instructions=instructions, signers=[payer], recent_blockhash=BLOCKHASH)
+        transaction.sign()
+        size = len(transaction.serialize(verify_signatures=False))
+    report("sign and serialize", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        transaction = Transaction(instructions=instructions, signers=[payer], recent_blockhash=BLOCKHASH)
+        transaction.compile_transaction()
+    report("compile only", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        estimate = estimate_transaction(instructions, [payer])
+    report("estimate_transaction", count, time.perf_counter() - start)
+    assert estimate.size == size
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures fetching Solana Pay transaction requests from a local stand-in merchant
+server: a new connection per request as fetch_transaction used to open, the
+shared connection pool, and fetch_transactions fetching links concurrently.
+
+The server answers after `delay` milliseconds, to stand in for a remote merchant.
+
+Usage: python benchmarks/bench_fetch_transaction.py [requests] [delay_ms]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from base64 import b64encode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from solathon import Keypair, Transaction
+from solathon.core.instructions import transfer
+from solathon.solana_pay import fetch_transaction, fetch_transactions
+from solathon.solana_pay.fetch_transaction import HEADERS
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def serve(delay: float) -> ThreadingHTTPServer:
+    # Partially signed by the merchant, so fetching needs no RPC request
+    wallet, merchant = Keypair(), Keypair()
+    transaction = Transaction(
+        instructions=[transfer(wallet.public_key, merchant.public_key, 1)],
+        signers=[wallet.public_key, merchant],
+        fee_payer=wallet.public_key,
+        recent_blockhash=BLOCKHASH,
+    )
+    transaction.signatures[1].signature = merchant.sign(transaction.compile_transaction()).signature
+    body = json.dumps({"transaction": b64encode(transaction.serialize(verify_signatures=False)).decode()}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately, which Nagle would delay on kept alive connections
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 128
+
+    server = Server(("127.0.0.1", 0), Handler)
+    server.wallet = wallet.public_key
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000
+    server = serve(delay)
+    link = f"http://127.0.0.1:{server.server_address[1]}/pay"
+    account = server.wallet
+
+    start = time.perf_counter()
+    for _ in range(count):
+        # What each call did before: a new client, and a new connection, per request
+        http = httpx.Client()
+        http.post(url=link, headers=HEADERS, json={"account": str(account)}).json()
+        http.close()
+    report("new connection per request", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        fetch_transaction(None, account, link)
+    report("fetch_transaction pooled", count, time.perf_counter() - start)
+
+    for workers in (8, 32):
+        start = time.perf_counter()
+        fetch_transactions(None, account, [link] * count, max_workers=workers)
+        report(f"fetch_transactions ({workers})", count, time.perf_counter() - start)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures keypairs per second of KeypairBatch.generate and KeypairBatch.derive by
+worker count, against building a Keypair object for every key.
+
+Usage: python benchmarks/bench_keypair.py [keypairs]
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from solathon import Keypair
+from solathon.keypair import KeypairBatch, derive_private_key
+from nacl.public import PrivateKey as NaclPrivateKey
+
+SEED = bytes(range(64))
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<36} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    start = time.perf_counter()
+    keypairs = [Keypair() for _ in range(count)]
+    report("Keypair()", count, time.perf_counter() - start)
+    del keypairs
+
+    start = time.perf_counter()
+    for index in range(count // 10):
+        Keypair(NaclPrivateKey(derive_private_key(SEED, f"m/44'/501'/{index}'/0'")))
+    report("derive_private_key + Keypair", count // 10, time.perf_counter() - start)
+
+    for use_processes in (False, True):
+        for workers in (1, 2, 4):
+            kind = "processes" if use_processes else "threads"
+            start = time.perf_counter()
+            KeypairBatch.generate(count, max_workers=workers, use_processes=use_processes)
+            report(f"generate, {workers} {kind}", count, time.perf_counter() - start)
+            start = time.perf_counter()
+            KeypairBatch.derive(SEED, count, max_workers=workers, use_processes=use_processes)
+            report(f"derive, {workers} {kind}", count, time.perf_counter() - start)
+
+    tracemalloc.start()
+    keypairs = [Keypair() for _ in range(10000)]
+    objects_size, _ = tracemalloc.get_traced_memory()
+    del keypairs
+    tracemalloc.stop()
+    tracemalloc.start()
+    batch = KeypairBatch.generate(10000, max_workers=1)
+    batch_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\n10000 keypairs: Keypair objects {objects_size / 1024:8.0f} KiB, KeypairBatch {batch_size / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
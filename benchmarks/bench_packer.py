@@ -0,0 +1,59 @@
+"""
+Measures packing transfers into transactions with pack_instructions, against
+trial compiling the transaction after every added instruction.
+
+Usage: python benchmarks/bench_packer.py [instructions]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import List
+
+from solathon import Keypair, Transaction
+from solathon.core.instructions import Instruction, transfer
+from solathon.core.message import encode_length
+from solathon.packer import pack_instructions
+from solathon.transaction import PACKET_DATA_SIZE, SIGNATURE_LENGTH
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def trial_pack(instructions: List[Instruction], payer: Keypair) -> List[Transaction]:
+    # Add instructions one at a time, compiling to check the size every time
+    transactions: List[Transaction] = []
+    current: List[Instruction] = []
+    for instruction in instructions:
+        candidate = Transaction(instructions=[*current, instruction], signers=[payer], recent_blockhash=BLOCKHASH)
+        size = len(encode_length(1)) + SIGNATURE_LENGTH + len(candidate.compile_transaction())
+        if size > PACKET_DATA_SIZE:
+            transactions.append(Transaction(instructions=current, signers=[payer], recent_blockhash=BLOCKHASH))
+            current = [instruction]
+        else:
+            current.append(instruction)
+    if current:
+        transactions.append(Transaction(instructions=current, signers=[payer], recent_blockhash=BLOCKHASH))
+    return transactions
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payer = Keypair()
+    instructions = [transfer(payer.public_key, Keypair().public_key, i + 1) for i in range(count)]
+
+    start = time.perf_counter()
+    trial = trial_pack(instructions, payer)
+    trial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    packed = pack_instructions(instructions, [payer], BLOCKHASH)
+    packed_time = time.perf_counter() - start
+    assert [len(t.instructions) for t in packed] == [len(t.instructions) for t in trial]
+
+    print(f"{count} transfers into {len(packed)} transactions")
+    print(f"  trial compile:     {trial_time * 1000:8.1f} ms")
+    print(f"  pack_instructions: {packed_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Compares the memoryview based wire parser against the previous list based one,
+on single transactions of growing size and on whole blocks of base64 encoded
+transactions as returned by getBlock.
+
+Usage: python benchmarks/bench_parse.py
+"""
+from __future__ import annotations
+
+import timeit
+from base64 import b64decode, b64encode
+from typing import List
+
+from base58 import b58encode
+from nacl.public import PrivateKey as NaclPrivateKey
+
+from solathon import Keypair, Transaction
+from solathon.core.instructions import AccountMeta, Instruction, transfer
+from solathon.core.message import CompiledInstruction, Message, MessageHeader, decode_length
+from solathon.transaction import decode_transactions
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def legacy_message_from_buffer(buffer: bytes) -> Message:
+    # The list and pop(0) based parser, kept here as the baseline
+    buffer_array = list(buffer)
+    num_required_signatures = buffer_array.pop(0)
+    num_readonly_signed_accounts = buffer_array.pop(0)
+    num_readonly_unsigned_accounts = buffer_array.pop(0)
+
+    account_count = decode_length(buffer_array)
+    account_keys = []
+    for _ in range(account_count):
+        account_keys.append(bytes(buffer_array[:32]))
+        buffer_array = buffer_array[32:]
+
+    recent_blockhash = b58encode(bytes(buffer_array[:32])).decode("utf-8")
+    buffer_array = buffer_array[32:]
+
+    instruction_count = decode_length(buffer_array)
+    instructions = []
+    for _ in range(instruction_count):
+        program_id_index = buffer_array.pop(0)
+        account_count = decode_length(buffer_array)
+        accounts = buffer_array[:account_count]
+        buffer_array = buffer_array[account_count:]
+        data_length = decode_length(buffer_array)
+        data = bytes(buffer_array[:data_length])
+        buffer_array = buffer_array[data_length:]
+        instructions.append(CompiledInstruction(accounts, program_id_index, data))
+
+    header = MessageHeader(
+        num_required_signatures, num_readonly_signed_accounts, num_readonly_unsigned_accounts
+    )
+    return Message(header, account_keys, instructions, recent_blockhash)
+
+
+def legacy_split_signatures(buffer: bytes) -> bytes:
+    buffer_array = list(buffer)
+    signature_length = decode_length(buffer_array)
+    for _ in range(signature_length):
+        buffer_array = buffer_array[64:]
+    return bytes(buffer_array)
+
+
+def build_transaction(num_instructions: int, seed: int = 0) -> Transaction:
+    signers = [Keypair(NaclPrivateKey(bytes([seed % 250 + i + 1]) * 32)) for i in range(2)]
+    accounts = [Keypair(NaclPrivateKey(bytes([i + 10]) * 32)).public_key for i in range(8)]
+    program = Keypair(NaclPrivateKey(bytes([255]) * 32)).public_key
+    instructions = []
+    for i in range(num_instructions):
+        if i % 2:
+            instructions.append(transfer(signers[i % 2].public_key, accounts[i % 8], i + seed))
+        else:
+            instructions.append(Instruction(
+                keys=[AccountMeta(accounts[(i + j) % 8], False, j == 0) for j in range(4)],
+                program_id=program,
+                data=bytes(range(16)),
+            ))
+    transaction = Transaction(instructions=instructions, signers=signers, recent_blockhash=BLOCKHASH)
+    transaction.sign()
+    return transaction
+
+
+def bench_messages() -> None:
+    print(f"{'instructions':>12} {'bytes':>6} {'legacy (us)':>12} {'current (us)':>12} {'speedup':>8}")
+    for num_instructions in [2, 8, 32, 128]:
+        message = build_transaction(num_instructions).compile_transaction()
+        assert legacy_message_from_buffer(message).serialize() == message
+
+        number = max(4000 // num_instructions, 10)
+        legacy = min(timeit.repeat(lambda: legacy_message_from_buffer(message), number=number, repeat=5)) / number
+        current = min(timeit.repeat(lambda: Message.from_buffer(message), number=number, repeat=5)) / number
+        print(
+            f"{num_instructions:>12} {len(message):>6} {legacy * 1e6:>12.1f} "
+            f"{current * 1e6:>12.1f} {legacy / current:>7.1f}x"
+        )
+
+
+def bench_block(size: int = 2000) -> None:
+    # A block as returned by getBlock with the base64 encoding
+    block: List[List[str]] = [
+        [b64encode(build_transaction(2 + i % 8, i).serialize()).decode("utf-8"), "base64"]
+        for i in range(size)
+    ]
+
+    def legacy() -> None:
+        for data, _ in block:
+            legacy_message_from_buffer(legacy_split_signatures(b64decode(data)))
+
+    def current_messages() -> None:
+        for data, _ in block:
+            buffer = b64decode(data)
+            Message.decode_at(memoryview(buffer), 1 + 64 * buffer[0])
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=3))
+    messages_time = min(timeit.repeat(current_messages, number=1, repeat=3))
+    transactions_time = min(timeit.repeat(lambda: decode_transactions(block), number=1, repeat=3))
+    print(f"\nblock of {size} transactions")
+    print(f"  legacy messages:       {legacy_time * 1000:8.1f} ms ({size / legacy_time:8.0f} tx/s)")
+    print(f"  current messages:      {messages_time * 1000:8.1f} ms ({size / messages_time:8.0f} tx/s)")
+    print(f"  decode_transactions:   {transactions_time * 1000:8.1f} ms ({size / transactions_time:8.0f} tx/s)")
+
+
+def main() -> None:
+    bench_messages()
+    bench_block()
+
+
+if __name__ == "__main__":
+    main()
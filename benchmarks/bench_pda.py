@@ -0,0 +1,85 @@
+"""
+Measures program derived address derivation: the previous uncached bump search,
+the cached find_program_address on repeated seeds, and find_program_addresses by
+worker count on associated token accounts of distinct owners.
+
+Usage: python benchmarks/bench_pda.py [addresses]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from hashlib import sha256
+from typing import List, Tuple
+
+from solathon import Keypair, PublicKey
+from solathon.core.layouts import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from solathon.publickey import PDA_MARKER, _D, _P, _find_program_address, find_program_addresses
+
+MINT = PublicKey("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+
+
+def legacy_is_on_curve(value: bytes) -> bool:
+    # The curve check as it was, a square root candidate computed with pow
+    y = int.from_bytes(value, "little") & ((1 << 255) - 1)
+    y2 = y * y % _P
+    u = (y2 - 1) % _P
+    v = (_D * y2 + 1) % _P
+    v3 = v * v * v % _P
+    x = u * v3 * pow(u * v3 * v3 * v % _P, (_P - 5) // 8, _P) % _P
+    vx2 = v * x * x % _P
+    return vx2 == u or vx2 == (-u) % _P
+
+
+def legacy_find_program_address(seeds: List[bytes], program_id: PublicKey) -> Tuple[PublicKey, int]:
+    # find_program_address as it was, hashing every seed again for every bump
+    for bump in range(255, -1, -1):
+        hasher = sha256()
+        for seed in [*seeds, bytes([bump])]:
+            hasher.update(seed)
+        hasher.update(bytes(program_id))
+        hasher.update(PDA_MARKER)
+        address = hasher.digest()
+        if not legacy_is_on_curve(address):
+            return PublicKey(address), bump
+    raise ValueError("Unable to find a viable program address bump seed")
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<36} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    owners = [Keypair().public_key for _ in range(count)]
+    items = [([bytes(owner), bytes(TOKEN_PROGRAM_ID), bytes(MINT)], ASSOCIATED_TOKEN_PROGRAM_ID) for owner in owners]
+
+    start = time.perf_counter()
+    for seeds, program_id in items:
+        legacy_find_program_address(seeds, program_id)
+    report("legacy, uncached", count, time.perf_counter() - start)
+
+    _find_program_address.cache_clear()
+    start = time.perf_counter()
+    for seeds, program_id in items:
+        PublicKey.find_program_address(seeds, program_id)
+    report("find_program_address, cold", count, time.perf_counter() - start)
+
+    # An indexer sees the same few thousand hot accounts over and over
+    rng = random.Random(0)
+    hot = [items[rng.randrange(min(count, 2000))] for _ in range(count)]
+    start = time.perf_counter()
+    for seeds, program_id in hot:
+        PublicKey.find_program_address(seeds, program_id)
+    report("find_program_address, 2000 hot keys", count, time.perf_counter() - start)
+
+    for workers in (1, 2, 4, 8):
+        _find_program_address.cache_clear()
+        start = time.perf_counter()
+        find_program_addresses(items, max_workers=workers)
+        report(f"find_program_addresses, {workers} workers", count, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
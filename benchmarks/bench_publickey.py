@@ -0,0 +1,99 @@
+"""
+Measures the memory and CPU saved by the slotted PublicKey with its cached
+base58 string, and by interning keys while decoding large blocks.
+
+Usage: python benchmarks/bench_publickey.py [transactions]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from base64 import b64encode
+from typing import Callable, List
+
+import base58
+
+from solathon import Keypair, PublicKey, Transaction
+from solathon.core.instructions import AccountMeta, Instruction, transfer
+from solathon.publickey import PublicKeyPool
+from solathon.transaction import decode_transactions
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+class LegacyPublicKey:
+    # The previous PublicKey: a __dict__ per instance, base58 computed every time
+    def __init__(self, value: bytes):
+        self.byte_value = bytes(value)
+
+    def __str__(self) -> str:
+        return base58.b58encode(self.byte_value).decode("utf-8")
+
+
+def measure(build: Callable[[], object]) -> tuple[float, int]:
+    # Timed without tracing, which slows allocations down
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def build_block(count: int) -> List[str]:
+    # Popular programs and accounts repeat across the transactions of a block
+    rng = random.Random(0)
+    payers = [Keypair() for _ in range(64)]
+    accounts = [Keypair().public_key for _ in range(256)]
+    program = Keypair().public_key
+    block = []
+    for i in range(count):
+        payer = payers[i % len(payers)]
+        transaction = Transaction(
+            instructions=[
+                transfer(payer.public_key, rng.choice(accounts), i + 1),
+                Instruction(
+                    keys=[AccountMeta(account, False, j == 0) for j, account in enumerate(rng.sample(accounts, 8))],
+                    program_id=program,
+                    data=bytes(8),
+                ),
+            ],
+            signers=[payer],
+            recent_blockhash=BLOCKHASH,
+        )
+        transaction.sign()
+        block.append(b64encode(transaction.serialize()).decode("utf-8"))
+    return block
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    raw_keys = [Keypair().public_key.byte_value for _ in range(10000)]
+    _, legacy_size = measure(lambda: [LegacyPublicKey(key) for key in raw_keys])
+    _, current_size = measure(lambda: [PublicKey(key) for key in raw_keys])
+    print(f"10000 keys: legacy {legacy_size / 1024:8.0f} KiB, slotted {current_size / 1024:8.0f} KiB")
+
+    legacy_key = LegacyPublicKey(raw_keys[0])
+    current_key = PublicKey(raw_keys[0])
+    legacy_str = min(timeit.repeat(lambda: str(legacy_key), number=20000, repeat=3)) / 20000
+    current_str = min(timeit.repeat(lambda: str(current_key), number=20000, repeat=3)) / 20000
+    print(f"str(): legacy {legacy_str * 1e6:6.2f} us, cached {current_str * 1e6:6.2f} us")
+
+    block = build_block(count)
+    plain_time, plain_size = measure(lambda: decode_transactions(block))
+    pool_time, pool_size = measure(lambda: decode_transactions(block, key_pool=PublicKeyPool()))
+    print(f"\nblock of {count} transactions")
+    print(f"  without pool: {plain_time * 1000:8.1f} ms {plain_size / 1024 / 1024:8.2f} MiB")
+    print(f"  with pool:    {pool_time * 1000:8.1f} ms {pool_size / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures Solana Pay QR code rendering throughput: the original renderer that
+reloads the logo on every call, create_qr in each format, and create_qrs.
+
+Usage: python benchmarks/bench_qr.py [codes] [workers]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from io import BytesIO
+
+import qrcode
+from PIL import Image
+from qrcode.image.styles.moduledrawers.pil import RoundedModuleDrawer
+
+from solathon.solana_pay.create_qr import LOGO_PATH, create_qr, create_qrs
+
+URL = (
+    "solana:mvines9iiHiQTysrwkJjGf2gb9Ex9jXJX8ns3qwf2kN?amount=0.01&label=Store"
+    "&reference=6DgHPm8gQp2mvQs5wuYTbJCH5KkkdJ7i4P76M31aegCQ&memo=invoice-{}"
+)
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def uncached_qr(link: str) -> BytesIO:
+    # The previous create_qr: the logo is opened and resized, and the image copied, every time
+    qr = qrcode.QRCode(box_size=10, border=2)
+    qr.add_data(link)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white",
+                        module_drawer=RoundedModuleDrawer()).convert('RGB')
+    logo = Image.open(LOGO_PATH)
+    logo_width = int(img.width * 0.2)
+    logo = logo.resize((logo_width, int(logo.size[1] * (logo_width / float(logo.size[0])))))
+    img.paste(logo, ((img.size[0] - logo.size[0]) // 2, (img.size[1] - logo.size[1]) // 2))
+    img_pil = Image.new("RGB", img.size, "white")
+    img_pil.paste(img)
+    stream = BytesIO()
+    img_pil.save(stream, format='PNG')
+    return stream
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    links = [URL.format(i) for i in range(count)]
+
+    start = time.perf_counter()
+    for link in links:
+        uncached_qr(link)
+    report("uncached png", count, time.perf_counter() - start)
+
+    for format in ("png", "svg", "terminal"):
+        start = time.perf_counter()
+        for link in links:
+            create_qr(link, format=format)
+        report(f"create_qr {format}", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    create_qrs(links, max_workers=workers)
+    report(f"create_qrs png ({workers} workers)", count, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
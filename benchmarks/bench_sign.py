@@ -0,0 +1,72 @@
+"""
+Measures signatures per second of sign_many by worker count, against signing
+one transaction at a time with a SigningKey rebuilt for every signature.
+
+Usage: python benchmarks/bench_sign.py [transactions]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import List
+
+from nacl.signing import SigningKey
+
+from solathon import Keypair, Transaction
+from solathon.core.instructions import transfer
+from solathon.transaction import sign_many
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def build_transactions(count: int) -> List[Transaction]:
+    payers = [Keypair() for _ in range(8)]
+    receiver = Keypair().public_key
+    return [
+        Transaction(
+            instructions=[transfer(payers[i % 8].public_key, receiver, i + 1)],
+            signers=[payers[i % 8]],
+            recent_blockhash=BLOCKHASH,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_sign(transactions: List[Transaction]) -> None:
+    # Transaction.sign as it was, with a new SigningKey for every signature
+    for transaction in transactions:
+        message = transaction.compile_transaction()
+        for idx, signer in enumerate(transaction.signers):
+            signing_key = SigningKey(bytes(signer.key_pair))
+            transaction.signatures[idx].signature = signing_key.sign(message).signature
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:8.2f} s {count / elapsed:12.0f} sig/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    transactions = build_transactions(count)
+
+    start = time.perf_counter()
+    legacy_sign(transactions)
+    report("legacy, sequential", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for transaction in transactions:
+        transaction.sign()
+    report("Transaction.sign", count, time.perf_counter() - start)
+
+    for use_processes in (False, True):
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            sign_many(transactions, max_workers=workers, use_processes=use_processes)
+            kind = "processes" if use_processes else "threads"
+            report(f"sign_many, {workers} {kind}", count, time.perf_counter() - start)
+
+    assert all(transaction.verify_signatures() for transaction in transactions[:100])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Measures building system program instructions with the precompiled struct
+encoders against the construct layouts, on a million transfers by default.
+
+Usage: python benchmarks/bench_system_instructions.py [instructions]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from solathon import Keypair
+from solathon.core.instructions import AccountMeta, Instruction, create_account, transfer
+from solathon.core.layouts import SYSTEM_INSTRUCTIONS_LAYOUT, SYSTEM_PROGRAM_ID, InstructionType
+from solathon.core.system_program import encode_create_account, encode_transfer
+
+
+def legacy_transfer(from_public_key, to_public_key, lamports: int) -> Instruction:
+    # transfer as it was, building the data with the construct layout
+    data = SYSTEM_INSTRUCTIONS_LAYOUT.build(dict(type=InstructionType.TRANSFER, args=dict(lamports=lamports)))
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=from_public_key, is_signer=True, is_writable=True),
+            AccountMeta(public_key=to_public_key, is_signer=False, is_writable=True),
+        ],
+        program_id=SYSTEM_PROGRAM_ID,
+        data=data,
+    )
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<36} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sender = Keypair().public_key
+    receiver = Keypair().public_key
+
+    start = time.perf_counter()
+    for lamports in range(count):
+        SYSTEM_INSTRUCTIONS_LAYOUT.build(dict(type=InstructionType.TRANSFER, args=dict(lamports=lamports)))
+    report("transfer data, construct", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for lamports in range(count):
+        encode_transfer(lamports)
+    report("transfer data, struct", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for lamports in range(count):
+        legacy_transfer(sender, receiver, lamports)
+    report("transfer instruction, construct", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for lamports in range(count):
+        transfer(sender, receiver, lamports)
+    report("transfer instruction, struct", count, time.perf_counter() - start)
+
+    program_id = bytes(receiver)
+    start = time.perf_counter()
+    for lamports in range(count // 10):
+        SYSTEM_INSTRUCTIONS_LAYOUT.build(dict(
+            type=InstructionType.CREATE_ACCOUNT,
+            args=dict(lamports=lamports, space=165, program_id=program_id),
+        ))
+    report("create_account data, construct", count // 10, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for lamports in range(count // 10):
+        encode_create_account(lamports, 165, program_id)
+    report("create_account data, struct", count // 10, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for lamports in range(count // 10):
+        create_account(sender, receiver, lamports, 165, receiver)
+    report("create_account instruction", count // 10, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
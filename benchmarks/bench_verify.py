@@ -0,0 +1,67 @@
+"""
+Measures verifications per second of verify_many by worker count, against
+building a VerifyKey for every signature, and the cost of serialize with and
+without re-verification.
+
+Usage: python benchmarks/bench_verify.py [signatures]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from nacl.signing import VerifyKey
+
+from solathon import Keypair, Transaction
+from solathon.core.instructions import transfer
+from solathon.transaction import sign_many
+from solathon.utils import verify_many
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<36} {elapsed:8.2f} s {count / elapsed:12.0f} /s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # A few hot keys, as in blocks dominated by a handful of fee payers
+    signers = [Keypair() for _ in range(16)]
+    items = []
+    for i in range(count):
+        signer = signers[i % len(signers)]
+        message = i.to_bytes(8, "little") * 30
+        items.append((signer.public_key, message, signer.sign(message).signature))
+
+    start = time.perf_counter()
+    for public_key, message, signature in items:
+        VerifyKey(bytes(public_key)).verify(message, signature)
+    report("VerifyKey per signature", count, time.perf_counter() - start)
+
+    for use_processes in (False, True):
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            assert all(verify_many(items, max_workers=workers, use_processes=use_processes))
+            kind = "processes" if use_processes else "threads"
+            report(f"verify_many, {workers} {kind}", count, time.perf_counter() - start)
+
+    receiver = Keypair().public_key
+    transactions = [
+        Transaction(
+            instructions=[transfer(signers[i % 16].public_key, receiver, i + 1)],
+            signers=[signers[i % 16]],
+            recent_blockhash=BLOCKHASH,
+        )
+        for i in range(count // 4)
+    ]
+    sign_many(transactions)
+    for verify_signatures in (True, False):
+        start = time.perf_counter()
+        for transaction in transactions:
+            transaction.serialize(verify_signatures=verify_signatures)
+        report(f"serialize(verify_signatures={verify_signatures})", len(transactions), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,4 +5,9 @@ from .async_client import AsyncClient
 from .publickey import PublicKey
 from .keypair import Keypair
 from .transaction import Transaction
+from .address_lookup_table import AddressLookupTableAccount, AddressLookupTableCache
+from .blockhash_cache import BlockhashCache
+from .nonce_pool import NoncePool
+from .confirmation import ConfirmationTracker
+from .sender import TransactionSender
 from .solana_pay import *
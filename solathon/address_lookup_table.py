@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from base64 import b64decode
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+from .client import Client
+from .async_client import AsyncClient
+from .core.layouts import LOOKUP_TABLE_META_LAYOUT, LOOKUP_TABLE_META_SIZE
+from .core.message import PUBLIC_KEY_LENGTH, MessageV0
+from .core.types import Commitment
+from .publickey import PublicKey
+from .utils import RPCRequestError, validate_commitment
+
+# Deactivation slot of a table which has not been deactivated
+U64_MAX = 2 ** 64 - 1
+
+
+def _table_key(address: PublicKey | Text) -> bytes:
+    return bytes(address if isinstance(address, PublicKey) else PublicKey(address))
+
+
+@dataclass
+class AddressLookupTableAccount:
+    key: PublicKey
+    addresses: List[PublicKey] = field(default_factory=list)
+    deactivation_slot: int = U64_MAX
+    last_extended_slot: int = 0
+    last_extended_slot_start_index: int = 0
+    authority: Optional[PublicKey] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.deactivation_slot == U64_MAX
+
+    @staticmethod
+    def from_account_data(key: PublicKey | Text, data: bytes) -> AddressLookupTableAccount:
+        """
+        Decodes the data of a lookup table account.
+
+        Args:
+            key (PublicKey | str): The address of the lookup table.
+            data (bytes): The raw account data.
+
+        Returns:
+            AddressLookupTableAccount: The lookup table.
+        """
+        if len(data) < LOOKUP_TABLE_META_SIZE or (len(data) - LOOKUP_TABLE_META_SIZE) % PUBLIC_KEY_LENGTH:
+            raise ValueError("Invalid address lookup table account data")
+        meta = LOOKUP_TABLE_META_LAYOUT.parse(data)
+        view = memoryview(data)
+        return AddressLookupTableAccount(
+            key=key if isinstance(key, PublicKey) else PublicKey(key),
+            addresses=[
+                PublicKey(view[offset:offset + PUBLIC_KEY_LENGTH])
+                for offset in range(LOOKUP_TABLE_META_SIZE, len(data), PUBLIC_KEY_LENGTH)
+            ],
+            deactivation_slot=meta.deactivation_slot,
+            last_extended_slot=meta.last_extended_slot,
+            last_extended_slot_start_index=meta.last_extended_slot_start_index,
+            authority=PublicKey(meta.authority) if meta.has_authority else None,
+        )
+
+
+class AddressLookupTableCache:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        commitment: Optional[Commitment] = None,
+    ):
+        """
+        Keeps fetched address lookup tables in memory, keyed by table address along
+        with the slot they were fetched at.
+
+        A cached table is reused for any request at or below its slot. Tables only
+        grow, so a table missing an index being resolved is fetched again.
+
+        Args:
+            client (Client | AsyncClient): The client used to fetch lookup tables.
+            commitment (Commitment, optional): The level of commitment desired when fetching tables.
+        """
+        self.client = client
+        self.commitment = validate_commitment(commitment) if commitment else None
+        self._tables: Dict[bytes, Tuple[int, AddressLookupTableAccount]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_async(self) -> bool:
+        return asyncio.iscoroutinefunction(self.client.get_account_info)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def put(self, table: AddressLookupTableAccount, slot: int) -> None:
+        """
+        Caches a table fetched at the given slot, unless a newer copy is cached.
+        """
+        key = bytes(table.key)
+        with self._lock:
+            cached = self._tables.get(key)
+            if cached is None or cached[0] <= slot:
+                self._tables[key] = (slot, table)
+
+    def cached(
+        self, address: PublicKey | Text, min_slot: Optional[int] = None
+    ) -> Optional[AddressLookupTableAccount]:
+        """
+        Returns the cached table if it was fetched at or after `min_slot`.
+        """
+        entry = self._tables.get(_table_key(address))
+        if entry is None or (min_slot is not None and entry[0] < min_slot):
+            return None
+        return entry[1]
+
+    def invalidate(self, address: PublicKey | Text | None = None) -> None:
+        """
+        Drops one cached table, or all of them.
+        """
+        with self._lock:
+            if address is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(_table_key(address), None)
+
+    def _params(self, address: PublicKey | Text, min_slot: Optional[int]) -> List[Any]:
+        config: Dict[Text, Any] = {"encoding": "base64"}
+        if self.commitment:
+            config["commitment"] = self.commitment
+        if min_slot is not None:
+            config["minContextSlot"] = min_slot
+        return [str(address), config]
+
+    def _store(self, address: PublicKey | Text, response) -> AddressLookupTableAccount:
+        if "error" in response:
+            raise RPCRequestError(
+                f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+            )
+        if "result" in response:
+            response = response["result"]
+        if response["value"] is None:
+            raise RPCRequestError(f"Address lookup table not found: {address}")
+        table = AddressLookupTableAccount.from_account_data(
+            address, b64decode(response["value"]["data"][0])
+        )
+        self.put(table, response["context"]["slot"])
+        return table
+
+    def get(
+        self, address: PublicKey | Text, min_slot: Optional[int] = None
+    ) -> AddressLookupTableAccount:
+        """
+        Returns a lookup table, fetching it when it is not cached at `min_slot` or later.
+
+        Args:
+            address (PublicKey | str): The address of the lookup table.
+            min_slot (int, optional): The minimum slot the table must have been fetched at.
+
+        Returns:
+            AddressLookupTableAccount: The lookup table.
+        """
+        if self.is_async:
+            raise TypeError("Use get_async with an AsyncClient")
+        table = self.cached(address, min_slot)
+        if table is None:
+            response = self.client.build_and_send_request(
+                "getAccountInfo", self._params(address, min_slot))
+            table = self._store(address, response)
+        return table
+
+    async def get_async(
+        self, address: PublicKey | Text, min_slot: Optional[int] = None
+    ) -> AddressLookupTableAccount:
+        """
+        Asynchronous counterpart of `get`.
+        """
+        table = self.cached(address, min_slot)
+        if table is None:
+            if not self.is_async:
+                return await asyncio.to_thread(self.get, address, min_slot)
+            response = await self.client.build_and_send_request_async(
+                "getAccountInfo", self._params(address, min_slot))
+            table = self._store(address, response)
+        return table
+
+    @staticmethod
+    def _is_complete(message: MessageV0, tables: List[AddressLookupTableAccount]) -> List[bool]:
+        return [
+            max([*lookup.writable_indexes, *lookup.readonly_indexes], default=-1) < len(table.addresses)
+            for lookup, table in zip(message.address_table_lookups, tables)
+        ]
+
+    def resolve(self, message: MessageV0, min_slot: Optional[int] = None) -> List[AddressLookupTableAccount]:
+        """
+        Fetches the tables a version 0 message looks up, for `Transaction.populate`
+        or `MessageV0.resolve_account_keys`.
+
+        Args:
+            message (MessageV0): The message to resolve.
+            min_slot (int, optional): The minimum slot the tables must have been fetched at.
+
+        Returns:
+            List[AddressLookupTableAccount]: One table per lookup of the message.
+        """
+        tables = [self.get(lookup.account_key, min_slot) for lookup in message.address_table_lookups]
+        for i, complete in enumerate(self._is_complete(message, tables)):
+            if not complete:
+                address = message.address_table_lookups[i].account_key
+                self.invalidate(address)
+                tables[i] = self.get(address, min_slot)
+        return tables
+
+    async def resolve_async(
+        self, message: MessageV0, min_slot: Optional[int] = None
+    ) -> List[AddressLookupTableAccount]:
+        """
+        Asynchronous counterpart of `resolve`.
+        """
+        tables = list(await asyncio.gather(*[
+            self.get_async(lookup.account_key, min_slot) for lookup in message.address_table_lookups
+        ]))
+        for i, complete in enumerate(self._is_complete(message, tables)):
+            if not complete:
+                address = message.address_table_lookups[i].account_key
+                self.invalidate(address)
+                tables[i] = await self.get_async(address, min_slot)
+        return tables
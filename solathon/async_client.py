@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from .utils import validate_commitment
-from typing import Any, List, Text, Union, Optional, Dict
+from typing import TYPE_CHECKING, Any, List, Text, Union, Optional, Dict
 from .publickey import PublicKey
 from .core.http import AsyncHTTPClient
 from .core.types import RPCResponse
-from .transaction import Transaction
+from .transaction import Transaction, _simulation_bytes
 from .utils import validate_commitment
 from .publickey import PublicKey
 from .transaction import Transaction
@@ -14,6 +14,9 @@ from .core.types import (
     RPCResponse,
 )
 
+if TYPE_CHECKING:
+    from .blockhash_cache import BlockhashCache
+
 ENDPOINTS = (
     "https://api.mainnet-beta.solana.com",
     "https://api.devnet.solana.com",
@@ -22,13 +25,19 @@ ENDPOINTS = (
 
 
 class AsyncClient:
-    def __init__(self, endpoint: Text, local: bool = False):
+    def __init__(
+        self,
+        endpoint: Text,
+        local: bool = False,
+        blockhash_cache: Optional[BlockhashCache] = None,
+    ):
         """
         Initializes an AsyncClient object.
 
         Args:
         - endpoint (str): The endpoint URL for the Solana RPC server.
         - local (bool): Whether to use a local development endpoint or not. Defaults to False.
+        - blockhash_cache (BlockhashCache, optional): Cache serving blockhashes to `send_transaction`. Defaults to None.
 
         Raises:
         - ValueError: If the endpoint is not valid and not a local development endpoint.
@@ -41,6 +50,7 @@ class AsyncClient:
             )
         self.http = AsyncHTTPClient(endpoint)
         self.endpoint = endpoint
+        self.blockhash_cache = blockhash_cache
 
     async def refresh_http(self) -> None:
         """
@@ -315,18 +325,26 @@ class AsyncClient:
             "getMinimumBalanceForRentExemption", [acct_length]
         )
 
-    async def get_multiple_accounts(self, pubkeys: List) -> RPCResponse:
+    async def get_multiple_accounts(
+        self, pubkeys: List[PublicKey | Text], commitment: Optional[Commitment] = None
+    ) -> RPCResponse:
         """
         Sends a request to the Solana RPC endpoint to retrieve multiple accounts
         associated with the given public keys.
 
         Args:
-            pubkeys (list): A list of public keys associated with the accounts to retrieve.
+            pubkeys (List[PublicKey | str]): The public keys of the accounts to retrieve, at most 100.
+            commitment (Commitment, optional): The level of commitment desired when querying state.
 
         Returns:
-            RPCResponse: The response from the Solana RPC endpoint.
+            RPCResponse: The response from the Solana RPC endpoint, None for accounts which do not exist.
         """
-        return await self.build_and_send_request_async("getMultipleAccounts", [pubkeys])
+        config: Dict[str, Any] = {"encoding": "base64"}
+        if commitment:
+            config["commitment"] = validate_commitment(commitment)
+        return await self.build_and_send_request_async(
+            "getMultipleAccounts", [[str(pubkey) for pubkey in pubkeys], config]
+        )
 
     async def get_program_accounts(self, public_key: PublicKey) -> RPCResponse:
         """
@@ -340,13 +358,21 @@ class AsyncClient:
         """
         return await self.build_and_send_request_async("getProgramAccounts", [public_key])
 
-    async def get_latest_blockhash(self) -> RPCResponse:
+    async def get_latest_blockhash(
+        self, commitment: Optional[Commitment] = None
+    ) -> RPCResponse:
         """
         Returns a recent blockhash from the ledger.
 
+        Args:
+            commitment (Commitment, optional): The level of commitment desired when querying state.
+
         :return: RPCResponse object containing the recent blockhash.
         """
-        return await self.build_and_send_request_async("getLatestBlockhash", [None])
+        commitment = validate_commitment(commitment) if commitment else None
+        return await self.build_and_send_request_async(
+            "getLatestBlockhash", [{"commitment": commitment} if commitment else None]
+        )
 
     async def get_recent_performance_samples(self) -> RPCResponse:
         """
@@ -357,17 +383,53 @@ class AsyncClient:
         """
         return await self.build_and_send_request_async("getRecentPerformanceSamples", [None])
 
-    async def get_signatures_for_address(self, acct_address: Text) -> RPCResponse:
+    async def get_recent_prioritization_fees(
+        self, accounts: Optional[List[PublicKey | Text]] = None
+    ) -> RPCResponse:
         """
-        Returns signatures for a given account address.
+        Returns the prioritization fees paid per compute unit in recent slots.
 
-        :param acct_address: The account address to get signatures for.
-        :type acct_address: str
-        :return: The RPC response containing the signatures for the account address.
-        :rtype: RPCResponse
+        Args:
+            accounts (List[PublicKey | str], optional): Up to 128 accounts, the fees returned are the
+                minimum fee paid by transactions locking all of them as writable.
+
+        Returns:
+            RPCResponse: The response from the RPC endpoint.
+        """
+        params: List[Any] = [[str(account) for account in accounts] if accounts else None]
+        return await self.build_and_send_request_async("getRecentPrioritizationFees", params)
+
+    async def get_signatures_for_address(
+        self,
+        acct_address: Text,
+        limit: Optional[int] = None,
+        before: Optional[Text] = None,
+        until: Optional[Text] = None,
+    ) -> RPCResponse:
         """
+        Returns signatures for a given account address, newest first.
+
+        Args:
+            acct_address (str): The account address to get signatures for.
+            limit (int, optional): Maximum number of signatures, up to 1000.
+            before (str, optional): Start searching backwards from this signature.
+            until (str, optional): Search until this signature.
+
+        Returns:
+            RPCResponse: The RPC response containing the signatures for the account address.
+        """
+        params: List[Any] = [acct_address]
+        options: Dict[str, Any] = {}
+        if limit is not None:
+            options["limit"] = limit
+        if before is not None:
+            options["before"] = before
+        if until is not None:
+            options["until"] = until
+        if options:
+            params.append(options)
         return await self.build_and_send_request_async(
-            "getSignaturesForAddress", [acct_address]
+            "getSignaturesForAddress", params
         )
 
     async def get_signature_statuses(self, transaction_sigs: List[Text]) -> RPCResponse:
@@ -462,17 +524,27 @@ class AsyncClient:
         return response
 
 
-    async def get_transaction(self, signature: Text) -> RPCResponse:
+    async def get_transaction(
+        self,
+        signature: Text,
+        max_supported_transaction_version: Optional[int] = 0,
+        commitment: Optional[Commitment] = None,
+    ) -> RPCResponse:
         """
         Sends a request to the Solana RPC endpoint to retrieve a transaction by its signature.
 
         Args:
             signature (Text): The signature of the transaction to retrieve.
+            max_supported_transaction_version (int, optional): Set the max transaction version to return in responses.
+            commitment (Commitment, optional): The level of commitment desired when querying state.
 
         Returns:
             RPCResponse: The response from the Solana RPC endpoint.
         """
-        return await self.build_and_send_request_async("getTransaction", [signature])
+        config: Dict[str, Any] = {"maxSupportedTransactionVersion": max_supported_transaction_version}
+        if commitment:
+            config["commitment"] = validate_commitment(commitment)
+        return await self.build_and_send_request_async("getTransaction", [signature, config])
 
     # Non "get" methods
     async def request_airdrop(
@@ -503,14 +575,77 @@ class AsyncClient:
             RPCResponse: The response from the Solana network.
         """
         if not transaction.recent_blockhash:
-            transaction.recent_blockhash = (await self.get_latest_blockhas())[
-                "result"
-            ].blockhash
+            if self.blockhash_cache is not None:
+                transaction.recent_blockhash = (
+                    await self.blockhash_cache.get_async()
+                ).blockhash
+            else:
+                transaction.recent_blockhash = (await self.get_latest_blockhash())[
+                    "result"
+                ]["value"]["blockhash"]
 
         transaction.sign()
 
         return await self.build_and_send_request_async(
-            "sendTransaction", [transaction.serialize(), {"encoding": "base64"}]
+            "sendTransaction", [transaction.serialize(verify_signatures=False), {"encoding": "base64"}]
+        )
+
+    async def simulate_transaction(
+        self,
+        transaction: Transaction,
+        sig_verify: bool = False,
+        replace_recent_blockhash: bool = False,
+        accounts: Optional[List[PublicKey | Text]] = None,
+        commitment: Optional[Commitment] = None,
+    ) -> RPCResponse:
+        """
+        Simulates a transaction, returning its logs, error and compute units consumed.
+
+        Unless `sig_verify` is set, the transaction does not need to be signed, missing
+        signatures are sent as zeros.
+
+        Args:
+            transaction (Transaction): The transaction to simulate.
+            sig_verify (bool, optional): Whether the signatures are verified, the transaction is signed
+                first if needed. Defaults to False.
+            replace_recent_blockhash (bool, optional): Whether the node replaces the recent blockhash with
+                its latest one, no blockhash is fetched then. Defaults to False.
+            accounts (List[PublicKey | str], optional): Accounts to return the state of after the simulation.
+            commitment (Commitment, optional): The level of commitment desired when simulating.
+
+        Returns:
+            RPCResponse: The response from the RPC endpoint, `SimulatedTransaction` converts its value.
+
+        Raises:
+            ValueError: If both `sig_verify` and `replace_recent_blockhash` are set.
+        """
+        if sig_verify and replace_recent_blockhash:
+            raise ValueError("sig_verify and replace_recent_blockhash cannot be used together")
+        if not (transaction.recent_blockhash or transaction.nonce_info or replace_recent_blockhash):
+            if self.blockhash_cache is not None:
+                transaction.recent_blockhash = (
+                    await self.blockhash_cache.get_async()
+                ).blockhash
+            else:
+                transaction.recent_blockhash = (await self.get_latest_blockhash())[
+                    "result"
+                ]["value"]["blockhash"]
+
+        config: Dict[str, Any] = {
+            "encoding": "base64",
+            "sigVerify": sig_verify,
+            "replaceRecentBlockhash": replace_recent_blockhash,
+        }
+        if commitment:
+            config["commitment"] = validate_commitment(commitment)
+        if accounts is not None:
+            config["accounts"] = {
+                "encoding": "base64",
+                "addresses": [str(account) for account in accounts],
+            }
+
+        return await self.build_and_send_request_async(
+            "simulateTransaction", [_simulation_bytes(transaction, sig_verify), config]
         )
 
     async def build_and_send_request_async(
@@ -529,3 +664,25 @@ class AsyncClient:
         data: Dict[Text, Any] = self.http.build_data(method=method, params=params)
         res: RPCResponse = await self.http.send(data)
         return res
+
+    async def build_and_send_batch_request_async(
+        self, method: Text, params: List[List[Any]]
+    ) -> List[RPCResponse]:
+        """
+        Builds and sends many requests to the same RPC method in one JSON-RPC batch.
+
+        Errors are not raised, so that a failed request does not fail the others.
+
+        Args:
+            method (str): The RPC method to call.
+            params (List[List[Any]]): The parameters of each request.
+
+        Returns:
+            List[RPCResponse]: The response to each request, in order.
+        """
+        if not params:
+            return []
+        data: List[Dict[str, Any]] = [
+            self.http.build_data(method=method, params=request_params) for request_params in params
+        ]
+        return await self.http.send_batch(data)
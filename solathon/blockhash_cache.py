@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from .client import Client
+from .async_client import AsyncClient
+from .core.types import BlockHash, Commitment, RPCResponse
+from .utils import DEFAULT_MS_PER_SLOT, RPCRequestError, validate_commitment
+
+# A blockhash stays valid for 150 blocks after the block it was fetched at
+BLOCKHASH_VALIDITY_BLOCKS = 150
+
+
+class BlockhashCache:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        refresh_interval: float = 10.0,
+        commitment: Optional[Commitment] = None,
+        expiry_margin: int = 50,
+    ):
+        """
+        Keeps a recent blockhash in memory so that it can be shared by many
+        transactions and clients instead of being fetched for every one of them.
+
+        The blockhash is refreshed on demand when it is older than `refresh_interval`
+        or estimated to be within `expiry_margin` blocks of its last valid block
+        height, or periodically in the background after `start` (threads for a
+        `Client`) or `start_async` (an asyncio task for an `AsyncClient`).
+
+        Args:
+            client (Client | AsyncClient): The client used to fetch blockhashes.
+            refresh_interval (float, optional): Maximum age of the cached blockhash in seconds. Defaults to 10.0.
+            commitment (Commitment, optional): The level of commitment desired when fetching the blockhash.
+            expiry_margin (int, optional): Number of blocks before expiry at which the blockhash is refreshed. Defaults to 50.
+        """
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.commitment = validate_commitment(commitment) if commitment else None
+        self.expiry_margin = expiry_margin
+        self.last_error: Optional[Exception] = None
+
+        self._blockhash: Optional[BlockHash] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_async(self) -> bool:
+        return asyncio.iscoroutinefunction(self.client.get_latest_blockhash)
+
+    def estimated_blocks_left(self) -> int:
+        """
+        Estimates how many blocks the cached blockhash stays valid for, based on
+        the time elapsed since it was fetched.
+
+        Returns:
+            int: The estimated number of blocks left, 0 if nothing is cached.
+        """
+        if self._blockhash is None:
+            return 0
+        elapsed_blocks = int((time.monotonic() - self._fetched_at) * 1000 / DEFAULT_MS_PER_SLOT)
+        return BLOCKHASH_VALIDITY_BLOCKS - elapsed_blocks
+
+    def is_stale(self) -> bool:
+        """
+        Returns whether the cached blockhash must be refreshed before use.
+        """
+        return (
+            self._blockhash is None
+            or time.monotonic() - self._fetched_at > self.refresh_interval
+            or self.estimated_blocks_left() <= self.expiry_margin
+        )
+
+    def _store(self, response) -> BlockHash:
+        if isinstance(response, BlockHash):
+            blockhash = response
+        else:
+            if "error" in response:
+                raise RPCRequestError(
+                    f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+                )
+            blockhash = BlockHash(response["result"]["value"])
+        self._blockhash = blockhash
+        self._fetched_at = time.monotonic()
+        return blockhash
+
+    def update(self, response: RPCResponse | BlockHash) -> BlockHash:
+        """
+        Stores a blockhash fetched elsewhere, for example within a JSON-RPC batch.
+
+        Args:
+            response (RPCResponse | BlockHash): A `getLatestBlockhash` response or the blockhash.
+
+        Returns:
+            BlockHash: The stored blockhash.
+        """
+        with self._lock:
+            return self._store(response)
+
+    def refresh(self) -> BlockHash:
+        """
+        Fetches a new blockhash through a `Client`.
+
+        Returns:
+            BlockHash: The new blockhash.
+        """
+        if self.is_async:
+            raise TypeError("Use refresh_async with an AsyncClient")
+        with self._lock:
+            return self._store(self.client.get_latest_blockhash(commitment=self.commitment))
+
+    async def refresh_async(self) -> BlockHash:
+        """
+        Fetches a new blockhash through an `AsyncClient`, or through a `Client`
+        in a worker thread.
+
+        Returns:
+            BlockHash: The new blockhash.
+        """
+        if not self.is_async:
+            return await asyncio.to_thread(self.refresh)
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            return self._store(await self.client.get_latest_blockhash(commitment=self.commitment))
+
+    def get(self) -> BlockHash:
+        """
+        Returns the cached blockhash, refreshing it first when it is stale.
+
+        Returns:
+            BlockHash: A blockhash safe to sign transactions with.
+        """
+        if self.is_async:
+            raise TypeError("Use get_async with an AsyncClient")
+        if self.is_stale():
+            with self._lock:
+                # Another thread may have refreshed while we waited for the lock
+                if self.is_stale():
+                    return self._store(self.client.get_latest_blockhash(commitment=self.commitment))
+        return self._blockhash
+
+    async def get_async(self) -> BlockHash:
+        """
+        Asynchronous counterpart of `get`.
+        """
+        if self.is_stale():
+            if not self.is_async:
+                return await asyncio.to_thread(self.get)
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                if self.is_stale():
+                    return self._store(
+                        await self.client.get_latest_blockhash(commitment=self.commitment)
+                    )
+        return self._blockhash
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            self._stop_event.wait(self.refresh_interval / 2)
+
+    def start(self) -> None:
+        """
+        Starts refreshing the blockhash on a background daemon thread.
+        """
+        if self.is_async:
+            raise TypeError("Use start_async with an AsyncClient")
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="solathon-blockhash-cache", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _run_async(self) -> None:
+        while True:
+            try:
+                await self.refresh_async()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            await asyncio.sleep(self.refresh_interval / 2)
+
+    def start_async(self) -> asyncio.Task:
+        """
+        Starts refreshing the blockhash in a background task on the running event loop.
+
+        Returns:
+            asyncio.Task: The refresh task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_async())
+        return self._task
+
+    async def stop_async(self) -> None:
+        """
+        Cancels the background task.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
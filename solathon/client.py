@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, Text, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Text, Union
 
 from .utils import RPCRequestError, validate_commitment
 from .publickey import PublicKey
 from .core.http import HTTPClient
-from .transaction import Transaction
+from .transaction import Transaction, _simulation_bytes
 from .core.types import (
     BlockHash,
     BlockHashType,
@@ -14,6 +14,8 @@ from .core.types import (
     LargestAccountsType,
     PubKeyIdentity,
     PubKeyIdentityType,
+    PrioritizationFee,
+    PrioritizationFeeType,
     RPCResponse,
     AccountInfo,
     AccountInfoType,
@@ -41,6 +43,8 @@ from .core.types import (
     RecentPerformanceSamplesType,
     SignatureStatus,
     SignatureStatusType,
+    SimulatedTransaction,
+    SimulatedTransactionType,
     Supply,
     SupplyType,
     TransactionSignature,
@@ -49,6 +53,9 @@ from .core.types import (
     TransactionElementType,
 )
 
+if TYPE_CHECKING:
+    from .blockhash_cache import BlockhashCache
+
 ENDPOINTS = (
     "https://api.mainnet-beta.solana.com",
     "https://api.devnet.solana.com",
@@ -58,7 +65,11 @@ ENDPOINTS = (
 
 class Client:
     def __init__(
-        self, endpoint: Text, local: bool = False, clean_response: bool = True
+        self,
+        endpoint: Text,
+        local: bool = False,
+        clean_response: bool = True,
+        blockhash_cache: Optional[BlockhashCache] = None,
     ):
         """
         Initializes a new instance of the Client class.
@@ -67,6 +78,7 @@ class Client:
             endpoint (str): The endpoint to connect to.
             local (bool, optional): Whether to use a local development endpoint. Defaults to False.
             clean_response (bool, optional): Whether to clean the response from the RPC endpoint. Defaults to True.
+            blockhash_cache (BlockhashCache, optional): Cache serving blockhashes to `send_transaction`. Defaults to None.
 
         Raises:
             ValueError: If the endpoint is not valid and local is False.
@@ -80,6 +92,7 @@ class Client:
         self.http = HTTPClient(endpoint)
         self.endpoint = endpoint
         self.clean_response = clean_response
+        self.blockhash_cache = blockhash_cache
 
     def refresh_http(self) -> None:
         """
@@ -466,20 +479,29 @@ class Client:
         )
 
     def get_multiple_accounts(
-        self, pubkeys: List[str]
-    ) -> RPCResponse[List[AccountInfoType]] | List[AccountInfo]:
+        self, pubkeys: List[PublicKey | Text], commitment: Optional[Commitment] = None
+    ) -> RPCResponse[List[Optional[AccountInfoType]]] | List[Optional[AccountInfo]]:
         """
         Returns the multiple accounts.
 
         Args:
-            pubkeys (list): The public keys.
+            pubkeys (List[PublicKey | str]): The public keys, at most 100.
+            commitment (Commitment, optional): The level of commitment desired when querying state.
 
         Returns:
-            RPCResponse: The response from the RPC endpoint.
+            RPCResponse: The response from the RPC endpoint, None for accounts which do not exist.
         """
-        response = self.build_and_send_request("getMultipleAccounts", pubkeys)
+        config: Dict[str, Any] = {"encoding": "base64"}
+        if commitment:
+            config["commitment"] = validate_commitment(commitment)
+        response = self.build_and_send_request(
+            "getMultipleAccounts", [[str(pubkey) for pubkey in pubkeys], config]
+        )
         if self.clean_response:
-            return [AccountInfo(account) for account in response["value"]]
+            return [
+                None if account is None else AccountInfo(account)
+                for account in response["value"]
+            ]
         return response
 
     def get_program_accounts(
@@ -512,7 +534,9 @@ class Client:
             RPCResponse: The response from the RPC endpoint.
         """
         commitment = validate_commitment(commitment) if commitment else None
-        response = self.build_and_send_request("getLatestBlockhash", [commitment])
+        response = self.build_and_send_request(
+            "getLatestBlockhash", [{"commitment": commitment} if commitment else None]
+        )
         if self.clean_response:
             return BlockHash(response["value"])
         return response
@@ -539,6 +563,25 @@ class Client:
             return [RecentPerformanceSamples(sample) for sample in response]
         return response
 
+    def get_recent_prioritization_fees(
+        self, accounts: Optional[List[PublicKey | Text]] = None
+    ) -> RPCResponse[List[PrioritizationFeeType]] | List[PrioritizationFee]:
+        """
+        Returns the prioritization fees paid per compute unit in recent slots.
+
+        Args:
+            accounts (List[PublicKey | str], optional): Up to 128 accounts, the fees returned are the
+                minimum fee paid by transactions locking all of them as writable.
+
+        Returns:
+            RPCResponse: The response from the RPC endpoint.
+        """
+        params: List[Any] = [[str(account) for account in accounts] if accounts else None]
+        response = self.build_and_send_request("getRecentPrioritizationFees", params)
+        if self.clean_response:
+            return [PrioritizationFee(fee) for fee in response]
+        return response
+
     def get_signatures_for_address(
         self,
         acct_address: Text,
@@ -574,20 +617,28 @@ class Client:
         return response
 
     def get_signature_statuses(
-        self, transaction_sigs: List[Text]
-    ) -> RPCResponse[List[SignatureStatusType]] | List[SignatureStatus]:
+        self, transaction_sigs: List[Text], search_transaction_history: bool = False
+    ) -> RPCResponse[List[SignatureStatusType]] | List[SignatureStatus | None]:
         """
         Returns the signature statuses for the specified transaction signatures.
 
         Args:
-            transaction_sigs (List[str]): The transaction signatures.
+            transaction_sigs (List[str]): The transaction signatures, at most 256 per request.
+            search_transaction_history (bool, optional): Whether to search the ledger history beyond the recent status cache. Defaults to False.
 
         Returns:
-            RPCResponse: The response from the RPC endpoint.
+            RPCResponse: The response from the RPC endpoint. Unknown signatures are returned as None.
         """
-        response = self.build_and_send_request("getSignatureStatuses", transaction_sigs)
+        params: List[Any] = [transaction_sigs]
+        if search_transaction_history:
+            params.append({"searchTransactionHistory": True})
+
+        response = self.build_and_send_request("getSignatureStatuses", params)
         if self.clean_response:
-            return [SignatureStatus(status) for status in response["value"]]
+            return [
+                SignatureStatus(status) if status is not None else None
+                for status in response["value"]
+            ]
         return response
 
     def get_slot(self) -> RPCResponse[int] | int:
@@ -749,6 +800,28 @@ class Client:
 
         return res
 
+    def build_and_send_batch_request(
+        self, method: Text, params: List[List[Any]]
+    ) -> List[RPCResponse]:
+        """
+        Builds and sends many requests to the same RPC method in one JSON-RPC batch.
+
+        Errors are not raised, so that a failed request does not fail the others.
+
+        Args:
+            method (str): The RPC method to call.
+            params (List[List[Any]]): The parameters of each request.
+
+        Returns:
+            List[RPCResponse]: The response to each request, in order.
+        """
+        if not params:
+            return []
+        data: List[Dict[str, Any]] = [
+            self.http.build_data(method=method, params=request_params) for request_params in params
+        ]
+        return self.http.send_batch(data)
+
     # Non "get" methods
     def request_airdrop(
         self, public_key: PublicKey | Text, lamports: int
@@ -779,8 +852,11 @@ class Client:
         recent_blockhash = transaction.recent_blockhash
 
         if recent_blockhash is None:
-            blockhash_resp = self.get_latest_blockhash()
-            recent_blockhash = blockhash_resp.blockhash
+            if self.blockhash_cache is not None:
+                recent_blockhash = self.blockhash_cache.get().blockhash
+            else:
+                blockhash_resp = self.get_latest_blockhash()
+                recent_blockhash = blockhash_resp.blockhash
         
         if options:
             options = options
@@ -791,5 +867,62 @@ class Client:
         transaction.sign()
 
         return self.build_and_send_request(
-            "sendTransaction", [transaction.serialize(), options]
+            "sendTransaction", [transaction.serialize(verify_signatures=False), options]
+        )
+
+    def simulate_transaction(
+        self,
+        transaction: Transaction,
+        sig_verify: bool = False,
+        replace_recent_blockhash: bool = False,
+        accounts: Optional[List[PublicKey | Text]] = None,
+        commitment: Optional[Commitment] = None,
+    ) -> RPCResponse[SimulatedTransactionType] | SimulatedTransaction:
+        """
+        Simulates a transaction, returning its logs, error and compute units consumed.
+
+        Unless `sig_verify` is set, the transaction does not need to be signed, missing
+        signatures are sent as zeros.
+
+        Args:
+            transaction (Transaction): The transaction to simulate.
+            sig_verify (bool, optional): Whether the signatures are verified, the transaction is signed
+                first if needed. Defaults to False.
+            replace_recent_blockhash (bool, optional): Whether the node replaces the recent blockhash with
+                its latest one, no blockhash is fetched then. Defaults to False.
+            accounts (List[PublicKey | str], optional): Accounts to return the state of after the simulation.
+            commitment (Commitment, optional): The level of commitment desired when simulating.
+
+        Returns:
+            RPCResponse: The response from the RPC endpoint.
+
+        Raises:
+            ValueError: If both `sig_verify` and `replace_recent_blockhash` are set.
+        """
+        if sig_verify and replace_recent_blockhash:
+            raise ValueError("sig_verify and replace_recent_blockhash cannot be used together")
+        if not (transaction.recent_blockhash or transaction.nonce_info or replace_recent_blockhash):
+            if self.blockhash_cache is not None:
+                transaction.recent_blockhash = self.blockhash_cache.get().blockhash
+            else:
+                transaction.recent_blockhash = self.get_latest_blockhash().blockhash
+
+        config: Dict[str, Any] = {
+            "encoding": "base64",
+            "sigVerify": sig_verify,
+            "replaceRecentBlockhash": replace_recent_blockhash,
+        }
+        if commitment:
+            config["commitment"] = validate_commitment(commitment)
+        if accounts is not None:
+            config["accounts"] = {
+                "encoding": "base64",
+                "addresses": [str(account) for account in accounts],
+            }
+
+        response = self.build_and_send_request(
+            "simulateTransaction", [_simulation_bytes(transaction, sig_verify), config]
         )
+        if self.clean_response:
+            return SimulatedTransaction(response["value"])
+        return response
@@ -0,0 +1,511 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Sequence, Text, Tuple
+
+from .client import Client
+from .async_client import AsyncClient
+from .core.instructions import Instruction, set_compute_unit_limit
+from .core.layouts import COMPUTE_BUDGET_PROGRAM_ID, ComputeBudgetInstructionType
+from .core.message import compiled_instruction_size, encoded_length_size
+from .core.types import PrioritizationFee, SimulatedTransaction
+from .keypair import Keypair
+from .publickey import PublicKey
+from .transaction import PACKET_DATA_SIZE, PKSigPair, Transaction, transaction_size
+from .utils import DEFAULT_MS_PER_SLOT, RPCRequestError
+
+if TYPE_CHECKING:
+    from .address_lookup_table import AddressLookupTableAccount
+
+# getRecentPrioritizationFees accepts at most 128 accounts
+MAX_PRIORITIZATION_FEE_ACCOUNTS = 128
+MAX_COMPUTE_UNIT_LIMIT = 1_400_000
+# Without set_compute_unit_limit, every other instruction is given this many units
+DEFAULT_INSTRUCTION_COMPUTE_UNIT_LIMIT = 200_000
+LAMPORTS_PER_SIGNATURE = 5000
+MICRO_LAMPORTS_PER_LAMPORT = 1_000_000
+# Share of the simulated compute units added on top of them by default
+DEFAULT_COMPUTE_UNIT_MARGIN = 0.1
+
+# Programs verifying signatures given in their instruction data, which are charged
+# as transaction signatures. The first data byte is the number of signatures.
+PRECOMPILE_PROGRAM_IDS: FrozenSet[bytes] = frozenset(
+    PublicKey(program_id).byte_value for program_id in (
+        "Ed25519SigVerify111111111111111111111111111",
+        "KeccakSecp256k11111111111111111111111111111",
+        "Secp256r1SigVerify1111111111111111111111111",
+    )
+)
+
+
+def percentile(values: Sequence[int], pct: float) -> int:
+    """
+    Returns the nearest-rank percentile of the given values.
+
+    Args:
+        values (Sequence[int]): The values, in any order.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        int: The percentile, 0 when there are no values.
+    """
+    if not 0 <= pct <= 100:
+        raise ValueError("Percentile must be between 0 and 100")
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def writable_accounts(
+    transaction: Transaction | Iterable[Instruction],
+    fee_payer: Optional[PublicKey] = None,
+) -> List[Text]:
+    """
+    Returns the accounts a transaction locks as writable, fee payer included.
+
+    Args:
+        transaction (Transaction | Iterable[Instruction]): A transaction or its instructions.
+        fee_payer (PublicKey, optional): The fee payer when only instructions are given.
+
+    Returns:
+        List[str]: The distinct writable accounts in order of appearance.
+    """
+    if isinstance(transaction, Transaction):
+        instructions = transaction.instructions
+        fee_payer = transaction.fee_payer or (
+            transaction.signatures[0].public_key if transaction.signatures else None
+        )
+    else:
+        instructions = transaction
+
+    accounts: Dict[Text, None] = {}
+    if fee_payer is not None:
+        accounts[str(fee_payer)] = None
+    for instruction in instructions:
+        for account_meta in instruction.keys:
+            if account_meta.is_writable:
+                accounts[str(account_meta.public_key)] = None
+    return list(accounts)
+
+
+class PriorityFeeEstimator:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        cache_slots: int = 5,
+    ):
+        """
+        Estimates compute unit prices from `getRecentPrioritizationFees` over the
+        writable accounts of a transaction.
+
+        Fees are cached per set of accounts for `cache_slots` slots, so that many
+        transactions touching the same accounts share one request.
+
+        Args:
+            client (Client | AsyncClient): The client used to fetch recent fees.
+            cache_slots (int, optional): Number of slots a fetched fee sample is reused for. Defaults to 5.
+        """
+        self.client = client
+        self.cache_slots = cache_slots
+        self._cache: Dict[FrozenSet[Text], Tuple[float, List[int]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_ttl(self) -> float:
+        return self.cache_slots * DEFAULT_MS_PER_SLOT / 1000
+
+    def _cached(self, key: FrozenSet[Text]) -> Optional[List[int]]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.cache_ttl:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+    def _store(self, key: FrozenSet[Text], response) -> List[int]:
+        if isinstance(response, dict):
+            if "error" in response:
+                raise RPCRequestError(
+                    f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+                )
+            response = [PrioritizationFee(fee) for fee in response["result"]]
+        fees = [fee.prioritization_fee for fee in response]
+        with self._lock:
+            self._cache[key] = (time.monotonic(), fees)
+        return fees
+
+    @staticmethod
+    def _key(accounts: List[Text]) -> FrozenSet[Text]:
+        if len(accounts) > MAX_PRIORITIZATION_FEE_ACCOUNTS:
+            raise ValueError(
+                f"At most {MAX_PRIORITIZATION_FEE_ACCOUNTS} accounts can be used to estimate fees"
+            )
+        return frozenset(accounts)
+
+    def get_fees(self, accounts: List[PublicKey | Text]) -> List[int]:
+        """
+        Returns the recent prioritization fees for a set of accounts, in micro-lamports
+        per compute unit.
+
+        Args:
+            accounts (List[PublicKey | str]): The writable accounts.
+
+        Returns:
+            List[int]: One fee per recent slot.
+        """
+        accounts = [str(account) for account in accounts]
+        key = self._key(accounts)
+        fees = self._cached(key)
+        if fees is None:
+            fees = self._store(key, self.client.get_recent_prioritization_fees(accounts))
+        return fees
+
+    async def get_fees_async(self, accounts: List[PublicKey | Text]) -> List[int]:
+        """
+        Asynchronous counterpart of `get_fees` for an `AsyncClient`.
+        """
+        accounts = [str(account) for account in accounts]
+        key = self._key(accounts)
+        fees = self._cached(key)
+        if fees is None:
+            if asyncio.iscoroutinefunction(self.client.get_recent_prioritization_fees):
+                response = await self.client.get_recent_prioritization_fees(accounts)
+            else:
+                response = await asyncio.to_thread(
+                    self.client.get_recent_prioritization_fees, accounts
+                )
+            fees = self._store(key, response)
+        return fees
+
+    def estimate(
+        self,
+        transaction: Transaction | Iterable[Instruction],
+        pct: float = 50,
+        fee_payer: Optional[PublicKey] = None,
+    ) -> int:
+        """
+        Estimates the compute unit price for a transaction.
+
+        Args:
+            transaction (Transaction | Iterable[Instruction]): A transaction or its instructions.
+            pct (float, optional): The percentile of recent fees to pay. Defaults to 50.
+            fee_payer (PublicKey, optional): The fee payer when only instructions are given.
+
+        Returns:
+            int: The compute unit price in micro-lamports, for `set_compute_unit_price`.
+        """
+        return percentile(self.get_fees(writable_accounts(transaction, fee_payer)), pct)
+
+    async def estimate_async(
+        self,
+        transaction: Transaction | Iterable[Instruction],
+        pct: float = 50,
+        fee_payer: Optional[PublicKey] = None,
+    ) -> int:
+        """
+        Asynchronous counterpart of `estimate`.
+        """
+        fees = await self.get_fees_async(writable_accounts(transaction, fee_payer))
+        return percentile(fees, pct)
+
+    def estimate_percentiles(
+        self,
+        transaction: Transaction | Iterable[Instruction],
+        percentiles: Sequence[float] = (25, 50, 75, 95),
+        fee_payer: Optional[PublicKey] = None,
+    ) -> Dict[float, int]:
+        """
+        Estimates the compute unit price for a transaction at several percentiles.
+
+        Returns:
+            Dict[float, int]: The compute unit price in micro-lamports for each percentile.
+        """
+        fees = self.get_fees(writable_accounts(transaction, fee_payer))
+        return {pct: percentile(fees, pct) for pct in percentiles}
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+@dataclass
+class TransactionEstimate:
+    size: int
+    num_signatures: int
+    num_accounts: int
+    compute_unit_limit: int
+    compute_unit_price: int
+    base_fee: int
+    priority_fee: int
+
+    @property
+    def fee(self) -> int:
+        return self.base_fee + self.priority_fee
+
+    @property
+    def fits(self) -> bool:
+        return self.size <= PACKET_DATA_SIZE
+
+
+_SET_COMPUTE_UNIT_LIMIT = bytes([ComputeBudgetInstructionType.SET_COMPUTE_UNIT_LIMIT])
+_SET_COMPUTE_UNIT_PRICE = bytes([ComputeBudgetInstructionType.SET_COMPUTE_UNIT_PRICE])
+
+
+def _key_bytes(public_key: PublicKey | Keypair | Text) -> bytes:
+    if isinstance(public_key, Keypair):
+        return public_key.public_key.byte_value
+    if isinstance(public_key, PublicKey):
+        return public_key.byte_value
+    return PublicKey(public_key).byte_value
+
+
+def estimate_transaction(
+    transaction: Transaction | Iterable[Instruction],
+    signers: Sequence[Keypair | PublicKey] = (),
+    address_lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+    lamports_per_signature: int = LAMPORTS_PER_SIGNATURE,
+) -> TransactionEstimate:
+    """
+    Computes the exact wire size and the fee of a transaction locally, without
+    compiling, signing or any request. Accounts are deduplicated, and loaded from
+    lookup tables, the same way as by `compile_transaction`.
+
+    The fee is the base fee of every signature, precompile signatures included, plus
+    the compute unit price times the compute unit limit, from the compute budget
+    instructions or the default of 200,000 units per instruction.
+
+    Args:
+        transaction (Transaction | Iterable[Instruction]): A transaction or its instructions.
+        signers (Sequence[Keypair | PublicKey], optional): The signers when only instructions are given, fee payer first.
+        address_lookup_tables (List[AddressLookupTableAccount], optional): Tables of a version 0 transaction
+            when only instructions are given.
+        lamports_per_signature (int, optional): The base fee per signature. Defaults to 5000.
+
+    Returns:
+        TransactionEstimate: The size, signature and account counts, compute budget and fees.
+    """
+    if isinstance(transaction, Transaction):
+        signers = [pair.public_key for pair in transaction.signatures]
+        address_lookup_tables = transaction.address_lookup_tables
+        instructions = transaction.instructions
+        nonce_info = transaction.nonce_info
+        if nonce_info and (not instructions or instructions[0] != nonce_info.nonce_instruction):
+            instructions = [nonce_info.nonce_instruction, *instructions]
+    else:
+        instructions = transaction
+
+    # Bit 1 marks signers, bit 2 writable accounts
+    flags: Dict[bytes, int] = {}
+    for signer in signers:
+        flags[_key_bytes(signer)] = 3
+    invoked = set()
+    instructions_size = 0
+    num_instructions = 0
+    precompile_signatures = 0
+    compute_unit_limit: Optional[int] = None
+    compute_unit_price = 0
+    num_compute_budget = 0
+    compute_budget_program = COMPUTE_BUDGET_PROGRAM_ID.byte_value
+    for instruction in instructions:
+        for meta in instruction.keys:
+            key = _key_bytes(meta.public_key)
+            flags[key] = flags.get(key, 0) | (meta.is_signer and 1) | (meta.is_writable and 2)
+        program = _key_bytes(instruction.program_id)
+        flags.setdefault(program, 0)
+        invoked.add(program)
+        data = instruction.data
+        instructions_size += compiled_instruction_size(len(instruction.keys), len(data))
+        num_instructions += 1
+        if program == compute_budget_program:
+            num_compute_budget += 1
+            if data[:1] == _SET_COMPUTE_UNIT_LIMIT:
+                compute_unit_limit = int.from_bytes(data[1:5], "little")
+            elif data[:1] == _SET_COMPUTE_UNIT_PRICE:
+                compute_unit_price = int.from_bytes(data[1:9], "little")
+        elif program in PRECOMPILE_PROGRAM_IDS and data:
+            precompile_signatures += data[0]
+
+    num_signatures = sum(value & 1 for value in flags.values())
+    num_static = len(flags)
+    lookups_size: Optional[int] = None
+    if address_lookup_tables is not None:
+        # Non signer accounts which are not invoked are loaded from the first table holding them
+        loadable = {key: value for key, value in flags.items() if not value & 1 and key not in invoked}
+        lookups_size = 0
+        num_lookups = 0
+        for table in address_lookup_tables:
+            num_writable = num_readonly = 0
+            for address in dict.fromkeys(_key_bytes(address) for address in table.addresses):
+                value = loadable.pop(address, None)
+                if value is None:
+                    continue
+                if value & 2:
+                    num_writable += 1
+                else:
+                    num_readonly += 1
+            if num_writable or num_readonly:
+                num_lookups += 1
+                num_static -= num_writable + num_readonly
+                lookups_size += (
+                    32 + encoded_length_size(num_writable) + num_writable
+                    + encoded_length_size(num_readonly) + num_readonly
+                )
+        lookups_size += encoded_length_size(num_lookups)
+
+    if compute_unit_limit is None:
+        compute_unit_limit = min(
+            (num_instructions - num_compute_budget) * DEFAULT_INSTRUCTION_COMPUTE_UNIT_LIMIT, MAX_COMPUTE_UNIT_LIMIT
+        )
+    return TransactionEstimate(
+        size=transaction_size(num_signatures, num_static, num_instructions, instructions_size, lookups_size),
+        num_signatures=num_signatures,
+        num_accounts=len(flags),
+        compute_unit_limit=compute_unit_limit,
+        compute_unit_price=compute_unit_price,
+        base_fee=(num_signatures + precompile_signatures) * lamports_per_signature,
+        priority_fee=-(-compute_unit_price * compute_unit_limit // MICRO_LAMPORTS_PER_LAMPORT),
+    )
+
+
+@dataclass
+class ComputeUnitRecommendation:
+    compute_unit_limit: Optional[int]
+    units_consumed: int
+    simulation: SimulatedTransaction
+
+    @property
+    def ok(self) -> bool:
+        return self.simulation.err is None
+
+
+def recommend_compute_unit_limit(units_consumed: int, margin: float = DEFAULT_COMPUTE_UNIT_MARGIN) -> int:
+    """
+    Returns the compute unit limit for a transaction consuming the given units, with a
+    margin on top, capped at 1,400,000.
+
+    Args:
+        units_consumed (int): The compute units consumed, from a simulation.
+        margin (float, optional): The share of units added on top. Defaults to 0.1.
+    """
+    if margin < 0:
+        raise ValueError("Compute unit margin cannot be negative")
+    # Rounded first so that float error does not add a unit, as with 3000 * 0.1
+    return min(units_consumed + math.ceil(round(units_consumed * margin, 6)), MAX_COMPUTE_UNIT_LIMIT)
+
+
+def _simulation_transaction(transaction: Transaction) -> Transaction:
+    # A copy with the highest compute unit limit, so that the simulation is not
+    # cut short by the limit being right-sized
+    limit = set_compute_unit_limit(MAX_COMPUTE_UNIT_LIMIT)
+    instructions: List[Instruction] = []
+    has_limit = False
+    compute_budget_program = COMPUTE_BUDGET_PROGRAM_ID.byte_value
+    for instruction in transaction.instructions:
+        if (
+            _key_bytes(instruction.program_id) == compute_budget_program
+            and instruction.data[:1] == _SET_COMPUTE_UNIT_LIMIT
+        ):
+            instruction = limit
+            has_limit = True
+        instructions.append(instruction)
+    if not has_limit:
+        # An advance nonce instruction must stay first, or compiling adds it again
+        nonce_info = transaction.nonce_info
+        advances_nonce = bool(nonce_info and instructions and instructions[0] == nonce_info.nonce_instruction)
+        instructions.insert(1 if advances_nonce else 0, limit)
+    return Transaction(
+        instructions=instructions,
+        signers=transaction.signers or [],
+        signatures=[PKSigPair(public_key=pair.public_key) for pair in transaction.signatures],
+        fee_payer=transaction.fee_payer,
+        recent_blockhash=transaction.recent_blockhash,
+        nonce_info=transaction.nonce_info,
+        address_lookup_tables=transaction.address_lookup_tables,
+    )
+
+
+def _recommendation(response, margin: float) -> ComputeUnitRecommendation:
+    if isinstance(response, dict):
+        if "error" in response:
+            raise RPCRequestError(
+                f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+            )
+        response = SimulatedTransaction(response["result"]["value"])
+    return ComputeUnitRecommendation(
+        compute_unit_limit=(
+            recommend_compute_unit_limit(response.units_consumed, margin) if response.err is None else None
+        ),
+        units_consumed=response.units_consumed,
+        simulation=response,
+    )
+
+
+def recommend_compute_unit_limits(
+    client: Client,
+    transactions: Sequence[Transaction],
+    margin: float = DEFAULT_COMPUTE_UNIT_MARGIN,
+    max_workers: int = 8,
+) -> List[ComputeUnitRecommendation]:
+    """
+    Simulates transactions concurrently and recommends a compute unit limit for each,
+    from the units they consume plus a margin.
+
+    Each transaction is simulated as a copy whose compute unit limit is the highest,
+    with the recent blockhash replaced by the node and without signature verification,
+    so neither a blockhash nor signatures are needed and the transactions are not changed.
+
+    Args:
+        client (Client): The client used to simulate.
+        transactions (Sequence[Transaction]): The transactions.
+        margin (float, optional): The share of consumed units added on top. Defaults to 0.1.
+        max_workers (int, optional): Simulations sent at once. Defaults to 8.
+
+    Returns:
+        List[ComputeUnitRecommendation]: One per transaction, in order. The limit is None when the simulation failed.
+    """
+    if margin < 0:
+        raise ValueError("Compute unit margin cannot be negative")
+
+    def simulate(transaction: Transaction) -> ComputeUnitRecommendation:
+        response = client.simulate_transaction(
+            _simulation_transaction(transaction), replace_recent_blockhash=True
+        )
+        return _recommendation(response, margin)
+
+    if max_workers <= 1 or len(transactions) <= 1:
+        return [simulate(transaction) for transaction in transactions]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(transactions))) as executor:
+        return list(executor.map(simulate, transactions))
+
+
+async def recommend_compute_unit_limits_async(
+    client: AsyncClient,
+    transactions: Sequence[Transaction],
+    margin: float = DEFAULT_COMPUTE_UNIT_MARGIN,
+    max_concurrency: int = 8,
+) -> List[ComputeUnitRecommendation]:
+    """
+    Asynchronous counterpart of `recommend_compute_unit_limits` for an `AsyncClient`,
+    with at most `max_concurrency` simulations in flight.
+    """
+    if margin < 0:
+        raise ValueError("Compute unit margin cannot be negative")
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def simulate(transaction: Transaction) -> ComputeUnitRecommendation:
+        async with semaphore:
+            response = await client.simulate_transaction(
+                _simulation_transaction(transaction), replace_recent_blockhash=True
+            )
+        return _recommendation(response, margin)
+
+    return list(await asyncio.gather(*(simulate(transaction) for transaction in transactions)))
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Text
+
+from .client import Client
+from .async_client import AsyncClient
+from .core.types import Commitment, RPCResponse, SignatureStatus
+from .utils import RPCRequestError, validate_commitment
+
+# getSignatureStatuses accepts at most 256 signatures per request
+MAX_SIGNATURE_STATUSES = 256
+
+COMMITMENT_LEVELS: Dict[str, int] = {
+    "processed": 0,
+    "recent": 0,
+    "confirmed": 1,
+    "single": 1,
+    "singleGossip": 1,
+    "finalized": 2,
+    "root": 2,
+    "max": 2,
+}
+
+
+class TransactionExpiredError(Exception):
+    def __init__(self, signature: Text, last_valid_block_height: int):
+        self.signature = signature
+        self.last_valid_block_height = last_valid_block_height
+        self.message = (
+            f"Signature {signature} has expired: block height exceeded "
+            f"{last_valid_block_height}"
+        )
+        super().__init__(self.message)
+
+
+def commitment_reached(status: SignatureStatus, commitment: Commitment) -> bool:
+    """
+    Checks whether a signature status has reached the given commitment level.
+
+    Args:
+        status (SignatureStatus): The status returned by `getSignatureStatuses`.
+        commitment (Commitment): The desired level of commitment.
+
+    Returns:
+        bool: True if the status is at or above the commitment level.
+    """
+    if status.confirmation_status is None:
+        # Nodes which don't report a confirmation status only return
+        # null confirmations once the block is rooted
+        level = COMMITMENT_LEVELS["finalized"] if status.confirmations is None else 0
+    else:
+        level = COMMITMENT_LEVELS[status.confirmation_status]
+    return level >= COMMITMENT_LEVELS[commitment]
+
+
+@dataclass
+class PendingSignature:
+    signature: Text
+    future: Future
+    commitment: Commitment
+    last_valid_block_height: Optional[int] = None
+
+
+class ConfirmationTracker:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        commitment: Commitment = "confirmed",
+        min_interval: float = 0.4,
+        max_interval: float = 5.0,
+        backoff: float = 1.5,
+    ):
+        """
+        Tracks the confirmation of many signatures by polling `getSignatureStatuses`
+        in batches of up to 256 signatures. Use `poll`, `wait` and `start` with a
+        `Client`, and `poll_async` and `wait_async` with an `AsyncClient`.
+
+        The polling interval starts at `min_interval` and grows by `backoff` after
+        every poll in which no signature was resolved, up to `max_interval`.
+
+        Args:
+            client (Client | AsyncClient): The client used to poll the cluster.
+            commitment (Commitment, optional): Default commitment signatures are resolved at. Defaults to "confirmed".
+            min_interval (float, optional): Shortest delay between polls in seconds. Defaults to 0.4.
+            max_interval (float, optional): Longest delay between polls in seconds. Defaults to 5.0.
+            backoff (float, optional): Growth factor of the delay when nothing resolves. Defaults to 1.5.
+        """
+        self.client = client
+        self.commitment = validate_commitment(commitment)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.last_error: Optional[Exception] = None
+
+        self._pending: Dict[Text, PendingSignature] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(
+        self,
+        signature: Text,
+        last_valid_block_height: Optional[int] = None,
+        commitment: Optional[Commitment] = None,
+    ) -> Future:
+        """
+        Starts tracking a signature.
+
+        Args:
+            signature (str): The transaction signature.
+            last_valid_block_height (int, optional): Last block height at which the transaction's blockhash is valid.
+                When given, the future fails with `TransactionExpiredError` once the cluster passes it.
+            commitment (Commitment, optional): Commitment to resolve at, defaults to the tracker commitment.
+
+        Returns:
+            Future: Resolved with the `SignatureStatus` once the commitment is reached,
+                failed transactions resolve as well and carry the error in `err`.
+        """
+        commitment = validate_commitment(commitment) if commitment else self.commitment
+        with self._lock:
+            if signature in self._pending:
+                return self._pending[signature].future
+            future: Future = Future()
+            self._pending[signature] = PendingSignature(
+                signature, future, commitment, last_valid_block_height
+            )
+        self.interval = self.min_interval
+        return future
+
+    def track_many(
+        self,
+        signatures: Iterable[Text],
+        last_valid_block_height: Optional[int] = None,
+        commitment: Optional[Commitment] = None,
+    ) -> List[Future]:
+        """
+        Starts tracking many signatures sharing the same blockhash expiry.
+
+        Returns:
+            List[Future]: One future per signature, in the same order.
+        """
+        return [
+            self.track(signature, last_valid_block_height, commitment)
+            for signature in signatures
+        ]
+
+    def untrack(self, signature: Text) -> None:
+        """
+        Stops tracking a signature and cancels its future.
+        """
+        with self._lock:
+            entry = self._pending.pop(signature, None)
+        if entry is not None:
+            entry.future.cancel()
+
+    def _get_block_height(self) -> int:
+        response = self.client.get_block_height()
+        if self.client.clean_response:
+            return response
+        return response["result"]
+
+    def _get_statuses(self, signatures: List[Text]) -> List[SignatureStatus | None]:
+        response = self.client.get_signature_statuses(signatures)
+        if self.client.clean_response:
+            return response
+        return [
+            SignatureStatus(status) if status is not None else None
+            for status in response["result"]["value"]
+        ]
+
+    @staticmethod
+    def _unwrap(response: RPCResponse):
+        if "error" in response:
+            raise RPCRequestError(
+                f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+            )
+        return response["result"]
+
+    async def _get_block_height_async(self) -> int:
+        return self._unwrap(await self.client.get_block_height())
+
+    async def _get_statuses_async(
+        self, signatures: List[Text]
+    ) -> List[SignatureStatus | None]:
+        response = self._unwrap(await self.client.get_signature_statuses(signatures))
+        return [
+            SignatureStatus(status) if status is not None else None
+            for status in response["value"]
+        ]
+
+    def _settle(
+        self,
+        entries: List[PendingSignature],
+        statuses: List[SignatureStatus | None],
+        block_height: Optional[int],
+    ) -> int:
+        resolved = 0
+        for entry, status in zip(entries, statuses):
+            if entry.future.done():
+                resolved += 1
+            elif status is not None:
+                if not commitment_reached(status, entry.commitment):
+                    continue
+                entry.future.set_result(status)
+                resolved += 1
+            elif (
+                block_height is not None
+                and entry.last_valid_block_height is not None
+                and block_height > entry.last_valid_block_height
+            ):
+                entry.future.set_exception(TransactionExpiredError(
+                    entry.signature, entry.last_valid_block_height
+                ))
+                resolved += 1
+            else:
+                continue
+
+            with self._lock:
+                self._pending.pop(entry.signature, None)
+        return resolved
+
+    def _adjust_interval(self, resolved: int) -> None:
+        if resolved:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def _snapshot(self) -> List[PendingSignature]:
+        with self._lock:
+            return list(self._pending.values())
+
+    def poll(self) -> int:
+        """
+        Polls the status of every tracked signature once.
+
+        Returns:
+            int: The number of signatures resolved by this poll.
+        """
+        entries = self._snapshot()
+        if not entries:
+            return 0
+
+        # Fetched before the statuses so an unknown signature below this height
+        # can no longer land.
+        block_height: Optional[int] = None
+        if any(entry.last_valid_block_height is not None for entry in entries):
+            block_height = self._get_block_height()
+
+        resolved = 0
+        for start in range(0, len(entries), MAX_SIGNATURE_STATUSES):
+            chunk = entries[start:start + MAX_SIGNATURE_STATUSES]
+            statuses = self._get_statuses([entry.signature for entry in chunk])
+            resolved += self._settle(chunk, statuses, block_height)
+
+        self._adjust_interval(resolved)
+        return resolved
+
+    async def poll_async(self) -> int:
+        """
+        Polls the status of every tracked signature once through an `AsyncClient`,
+        requesting all batches concurrently.
+
+        Returns:
+            int: The number of signatures resolved by this poll.
+        """
+        entries = self._snapshot()
+        if not entries:
+            return 0
+
+        block_height: Optional[int] = None
+        if any(entry.last_valid_block_height is not None for entry in entries):
+            block_height = await self._get_block_height_async()
+
+        chunks = [
+            entries[start:start + MAX_SIGNATURE_STATUSES]
+            for start in range(0, len(entries), MAX_SIGNATURE_STATUSES)
+        ]
+        statuses = await asyncio.gather(*[
+            self._get_statuses_async([entry.signature for entry in chunk])
+            for chunk in chunks
+        ])
+
+        resolved = sum(
+            self._settle(chunk, chunk_statuses, block_height)
+            for chunk, chunk_statuses in zip(chunks, statuses)
+        )
+        self._adjust_interval(resolved)
+        return resolved
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Polls until every tracked signature is resolved.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if nothing is left pending.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            self.poll()
+            if not self._pending:
+                break
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+        return True
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Asynchronous counterpart of `wait`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            await self.poll_async()
+            if not self._pending:
+                break
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                await asyncio.sleep(min(self.interval, remaining))
+            else:
+                await asyncio.sleep(self.interval)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self._pending:
+                try:
+                    self.poll()
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+                    self._adjust_interval(0)
+            self._stop_event.wait(self.interval)
+
+    def start(self) -> None:
+        """
+        Starts polling on a background daemon thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="solathon-confirmation-tracker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, cancel_pending: bool = False) -> None:
+        """
+        Stops the background thread.
+
+        Args:
+            cancel_pending (bool, optional): Whether to cancel the futures still pending. Defaults to False.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if cancel_pending:
+            for entry in self._snapshot():
+                entry.future.cancel()
+            with self._lock:
+                self._pending.clear()
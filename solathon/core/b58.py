@@ -0,0 +1,95 @@
+"""Base58 codec for keys, signatures and blockhashes"""
+from __future__ import annotations
+
+from typing import Iterable, List
+
+try:
+    # Optional compiled codec, https://pypi.org/project/based58
+    import based58 as _based58
+except ImportError:
+    _based58 = None
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+BACKEND = "based58" if _based58 is not None else "python"
+
+# Encoding emits two digits per division, from a table of every digit pair
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+_PAIR_BASE = 58 ** 2
+_QUAD_BASE = 58 ** 4
+
+_DIGITS = bytearray(b"\xff" * 256)
+for _index, _char in enumerate(ALPHABET.encode("ascii")):
+    _DIGITS[_char] = _index
+_DIGITS = bytes(_DIGITS)
+
+
+def _encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    chunks: List[str] = []
+    while number:
+        number, remainder = divmod(number, _QUAD_BASE)
+        high, low = divmod(remainder, _PAIR_BASE)
+        chunks.append(_PAIRS[high] + _PAIRS[low])
+    encoded = "".join(reversed(chunks)).lstrip("1")
+    # Every leading zero byte is encoded as a leading "1"
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + encoded
+
+
+def _decode(value: bytes) -> bytes:
+    digits = value.translate(_DIGITS)
+    if b"\xff" in digits:
+        raise ValueError(f"Invalid base58 character in {value!r}")
+    number = 0
+    for digit in digits:
+        number = number * 58 + digit
+    return (
+        b"\0" * (len(value) - len(value.lstrip(b"1")))
+        + number.to_bytes((number.bit_length() + 7) // 8, "big")
+    )
+
+
+def b58encode(data: bytes) -> str:
+    """
+    Encodes bytes, such as a public key or a signature, to a base58 string.
+    """
+    if _based58 is not None:
+        return _based58.b58encode(bytes(data)).decode("ascii")
+    return _encode(bytes(data))
+
+
+def b58decode(value: str | bytes) -> bytes:
+    """
+    Decodes a base58 string to bytes.
+
+    Raises:
+        ValueError: If the string contains a character outside of the base58 alphabet.
+    """
+    if isinstance(value, str):
+        try:
+            value = value.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"Invalid base58 character in {value!r}")
+    # Trailing whitespace is ignored, as by the base58 package
+    value = value.rstrip()
+    if _based58 is not None:
+        try:
+            return _based58.b58decode(value)
+        except Exception as e:
+            raise ValueError(f"Invalid base58 string {value!r}") from e
+    return _decode(value)
+
+
+def b58encode_many(values: Iterable[bytes]) -> List[str]:
+    """
+    Encodes many values, such as all the account keys of a block.
+    """
+    if _based58 is not None:
+        return [_based58.b58encode(bytes(value)).decode("ascii") for value in values]
+    return [_encode(bytes(value)) for value in values]
+
+
+def b58decode_many(values: Iterable[str | bytes]) -> List[bytes]:
+    """
+    Decodes many base58 strings.
+    """
+    return [b58decode(value) for value in values]
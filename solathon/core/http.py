@@ -11,6 +11,15 @@ from .. import __version__
 from ..publickey import PublicKey
 from .types import RPCResponse
 
+def _order_batch(data: List[Dict[str, Any]], responses: Any) -> List[RPCResponse]:
+    # A batch rejected as a whole is answered with a single error
+    if isinstance(responses, dict):
+        return [responses] * len(data)
+    by_id = {response.get("id"): response for response in responses}
+    missing = {"error": {"code": -32603, "message": "No response to the request in the batch"}}
+    return [by_id.get(request["id"], missing) for request in data]
+
+
 class HTTPClient:
     """HTTP Client to interact with Solana JSON RPC"""
 
@@ -32,6 +41,12 @@ class HTTPClient:
                 url=self.endpoint, headers=self.headers, json=data)
         return res.json()
 
+    def send_batch(self, data: List[Dict[str, Any]]) -> List[RPCResponse]:
+        # Sends many requests in one JSON-RPC batch, responses may come back in any order
+        res = self.client.post(
+                url=self.endpoint, headers=self.headers, json=data)
+        return _order_batch(data, res.json())
+
     def build_data(self, method: str, params: List[Any]) -> Dict[str, Any]:
         self.request_id += 1
         params: List[Any] = [
@@ -58,7 +73,8 @@ class AsyncHTTPClient:
     """Asynchronous HTTP Client to interact with Solana JSON RPC"""
 
     def __init__(self, endpoint: str):
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        if sys.platform == "win32":
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
         self.endpoint = endpoint
         version = sys.version_info
         self.headers = {
@@ -77,6 +93,11 @@ class AsyncHTTPClient:
                 url=self.endpoint, headers=self.headers, json=data)
         return res.json()
 
+    async def send_batch(self, data: List[Dict[str, Any]]) -> List[RPCResponse]:
+        res = await self.client.post(
+                url=self.endpoint, headers=self.headers, json=data)
+        return _order_batch(data, res.json())
+
     def build_data(self, method: str, params: List[Any]) -> Dict[str, Any]:
         self.request_id += 1
         params: List[Any] = [
@@ -1,13 +1,37 @@
 # Developer reference: https://github.com/solana-labs/solana/blob/master/sdk/program/src/system_instruction.rs
 from __future__ import annotations
 
-from typing import NamedTuple, List
+from typing import NamedTuple, List, Optional, Tuple
 from dataclasses import dataclass
 from ..publickey import PublicKey
 from ..core.layouts import (
     InstructionType,
+    ComputeBudgetInstructionType,
+    AddressLookupTableInstructionType,
     SYSTEM_INSTRUCTIONS_LAYOUT,
-    SYSTEM_PROGRAM_ID
+    COMPUTE_BUDGET_INSTRUCTIONS_LAYOUT,
+    ADDRESS_LOOKUP_TABLE_INSTRUCTIONS_LAYOUT,
+    SYSTEM_PROGRAM_ID,
+    COMPUTE_BUDGET_PROGRAM_ID,
+    ADDRESS_LOOKUP_TABLE_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    MEMO_PROGRAM_ID,
+    SYSVAR_RECENT_BLOCKHASHES_PUBKEY,
+    SYSVAR_RENT_PUBKEY,
+    NONCE_ACCOUNT_LENGTH,
+)
+from ..core.system_program import (
+    encode_create_account,
+    encode_create_account_with_seed,
+    encode_assign,
+    encode_transfer,
+    encode_allocate,
+    encode_allocate_with_seed,
+    encode_advance_nonce_account,
+    encode_withdraw_nonce_account,
+    encode_initialize_nonce_account,
+    encode_authorize_nonce_account,
 )
 
 
@@ -56,15 +80,7 @@ def create_account(
             is_writable=True
         ),
     ]
-    data: bytes = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(
-            type=InstructionType.CREATE_ACCOUNT,
-            args=dict(
-                lamports=lamports, space=space,
-                program_id=bytes(program_id)
-            ),
-        )
-    )
+    data: bytes = encode_create_account(lamports, space, bytes(program_id))
     return Instruction(
         keys=account_metas,
         program_id=SYSTEM_PROGRAM_ID,
@@ -94,17 +110,8 @@ def create_account_with_seed(
         ),
     ]
     
-    data: bytes = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(
-            type=InstructionType.CREATE_ACCOUNT_WITH_SEED,
-            args=dict(
-                base=bytes(base_public_key),
-                seed=seed,
-                lamports=lamports,
-                space=space,
-                program_id=bytes(program_id),
-            ),
-        )
+    data: bytes = encode_create_account_with_seed(
+        bytes(base_public_key), seed, lamports, space, bytes(program_id)
     )
 
     if base_public_key != from_public_key:
@@ -123,11 +130,7 @@ def assign(
         program_id: PublicKey
 ) -> Instruction:
 
-    data = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(type=InstructionType.ASSIGN,
-             args=dict(program_id=bytes(program_id)
-                       ))
-    )
+    data = encode_assign(bytes(program_id))
     return Instruction(
         keys=[
             AccountMeta(
@@ -161,12 +164,7 @@ def transfer(
             is_writable=True
         ),
     ]
-    data: bytes = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(
-            type=InstructionType.TRANSFER,
-            args=dict(lamports=lamports)
-        )
-    )
+    data: bytes = encode_transfer(lamports)
     return Instruction(
         keys=account_metas,
         program_id=SYSTEM_PROGRAM_ID,
@@ -179,9 +177,7 @@ def allocate(
         space: int
 ) -> Instruction:
 
-    data: bytes = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(type=InstructionType.ALLOCATE, args=dict(space=space))
-    )
+    data: bytes = encode_allocate(space)
     return Instruction(
         keys=[AccountMeta(
             public_key=account_public_key,
@@ -201,16 +197,8 @@ def allocate_with_seed(
     program_id: PublicKey
 ) -> Instruction:
 
-    data: bytes = SYSTEM_INSTRUCTIONS_LAYOUT.build(
-        dict(
-            type=InstructionType.ALLOCATE_WITH_SEED,
-            args=dict(
-                base=bytes(base_public_key),
-                seed=seed,
-                space=space,
-                program_id=bytes(program_id),
-            ),
-        )
+    data: bytes = encode_allocate_with_seed(
+        bytes(base_public_key), seed, space, bytes(program_id)
     )
     return Instruction(
         keys=[AccountMeta(
@@ -221,3 +209,269 @@ def allocate_with_seed(
         program_id=SYSTEM_PROGRAM_ID,
         data=data,
     )
+
+
+def initialize_nonce_account(
+        nonce_account: PublicKey,
+        nonce_authority: PublicKey
+) -> Instruction:
+
+    data: bytes = encode_initialize_nonce_account(bytes(nonce_authority))
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=nonce_account, is_signer=False, is_writable=True),
+            AccountMeta(public_key=SYSVAR_RECENT_BLOCKHASHES_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(public_key=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+        ],
+        program_id=SYSTEM_PROGRAM_ID,
+        data=data,
+    )
+
+
+def create_nonce_account(
+        from_public_key: PublicKey,
+        nonce_account: PublicKey,
+        nonce_authority: PublicKey,
+        lamports: int
+) -> List[Instruction]:
+    # The nonce account signs its creation, lamports must cover its rent exemption
+    return [
+        create_account(from_public_key, nonce_account, lamports, NONCE_ACCOUNT_LENGTH, SYSTEM_PROGRAM_ID),
+        initialize_nonce_account(nonce_account, nonce_authority),
+    ]
+
+
+def advance_nonce_account(
+        nonce_account: PublicKey,
+        nonce_authority: PublicKey
+) -> Instruction:
+
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=nonce_account, is_signer=False, is_writable=True),
+            AccountMeta(public_key=SYSVAR_RECENT_BLOCKHASHES_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(public_key=nonce_authority, is_signer=True, is_writable=False),
+        ],
+        program_id=SYSTEM_PROGRAM_ID,
+        data=encode_advance_nonce_account(),
+    )
+
+
+def withdraw_nonce_account(
+        nonce_account: PublicKey,
+        nonce_authority: PublicKey,
+        to_public_key: PublicKey,
+        lamports: int
+) -> Instruction:
+
+    data: bytes = encode_withdraw_nonce_account(lamports)
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=nonce_account, is_signer=False, is_writable=True),
+            AccountMeta(public_key=to_public_key, is_signer=False, is_writable=True),
+            AccountMeta(public_key=SYSVAR_RECENT_BLOCKHASHES_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(public_key=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(public_key=nonce_authority, is_signer=True, is_writable=False),
+        ],
+        program_id=SYSTEM_PROGRAM_ID,
+        data=data,
+    )
+
+
+def authorize_nonce_account(
+        nonce_account: PublicKey,
+        nonce_authority: PublicKey,
+        new_authority: PublicKey
+) -> Instruction:
+
+    data: bytes = encode_authorize_nonce_account(bytes(new_authority))
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=nonce_account, is_signer=False, is_writable=True),
+            AccountMeta(public_key=nonce_authority, is_signer=True, is_writable=False),
+        ],
+        program_id=SYSTEM_PROGRAM_ID,
+        data=data,
+    )
+
+
+# Developer reference: https://github.com/solana-labs/solana/blob/master/sdk/src/compute_budget.rs
+def request_heap_frame(bytes_: int) -> Instruction:
+
+    data: bytes = COMPUTE_BUDGET_INSTRUCTIONS_LAYOUT.build(
+        dict(
+            type=ComputeBudgetInstructionType.REQUEST_HEAP_FRAME,
+            args=dict(bytes=bytes_)
+        )
+    )
+    return Instruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=data,
+    )
+
+
+def set_compute_unit_limit(units: int) -> Instruction:
+
+    data: bytes = COMPUTE_BUDGET_INSTRUCTIONS_LAYOUT.build(
+        dict(
+            type=ComputeBudgetInstructionType.SET_COMPUTE_UNIT_LIMIT,
+            args=dict(units=units)
+        )
+    )
+    return Instruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=data,
+    )
+
+
+def set_compute_unit_price(micro_lamports: int) -> Instruction:
+
+    data: bytes = COMPUTE_BUDGET_INSTRUCTIONS_LAYOUT.build(
+        dict(
+            type=ComputeBudgetInstructionType.SET_COMPUTE_UNIT_PRICE,
+            args=dict(micro_lamports=micro_lamports)
+        )
+    )
+    return Instruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=data,
+    )
+
+
+# Developer reference: https://github.com/solana-labs/solana-program-library/blob/master/memo/program/src/processor.rs
+def memo(text: str, signers: Optional[List[PublicKey]] = None) -> Instruction:
+    return Instruction(
+        keys=[
+            AccountMeta(public_key=signer, is_signer=True, is_writable=False)
+            for signer in signers or []
+        ],
+        program_id=MEMO_PROGRAM_ID,
+        data=text.encode("utf-8"),
+    )
+
+
+# Developer reference: https://github.com/solana-labs/solana-program-library/blob/master/associated-token-account/program/src/lib.rs
+def get_associated_token_address(
+        owner: PublicKey,
+        mint: PublicKey,
+        token_program_id: PublicKey = TOKEN_PROGRAM_ID
+) -> PublicKey:
+    address, _ = PublicKey.find_program_address(
+        [bytes(owner), bytes(token_program_id), bytes(mint)],
+        ASSOCIATED_TOKEN_PROGRAM_ID,
+    )
+    return address
+
+
+# Developer reference: https://github.com/solana-labs/solana/blob/master/sdk/program/src/address_lookup_table/instruction.rs
+def derive_lookup_table_address(
+        authority: PublicKey,
+        recent_slot: int
+) -> Tuple[PublicKey, int]:
+    return PublicKey.find_program_address(
+        [bytes(authority), recent_slot.to_bytes(8, byteorder="little")],
+        ADDRESS_LOOKUP_TABLE_PROGRAM_ID,
+    )
+
+
+def create_lookup_table(
+        authority: PublicKey,
+        payer: PublicKey,
+        recent_slot: int
+) -> Tuple[Instruction, PublicKey]:
+    lookup_table, bump_seed = derive_lookup_table_address(authority, recent_slot)
+    account_metas: List[AccountMeta] = [
+        AccountMeta(public_key=lookup_table, is_signer=False, is_writable=True),
+        AccountMeta(public_key=authority, is_signer=True, is_writable=False),
+        AccountMeta(public_key=payer, is_signer=True, is_writable=True),
+        AccountMeta(public_key=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
+    ]
+    data: bytes = ADDRESS_LOOKUP_TABLE_INSTRUCTIONS_LAYOUT.build(
+        dict(
+            type=AddressLookupTableInstructionType.CREATE_LOOKUP_TABLE,
+            args=dict(recent_slot=recent_slot, bump_seed=bump_seed)
+        )
+    )
+    instruction = Instruction(
+        keys=account_metas,
+        program_id=ADDRESS_LOOKUP_TABLE_PROGRAM_ID,
+        data=data,
+    )
+    return instruction, lookup_table
+
+
+def extend_lookup_table(
+        lookup_table: PublicKey,
+        authority: PublicKey,
+        addresses: List[PublicKey],
+        payer: Optional[PublicKey] = None
+) -> Instruction:
+    account_metas: List[AccountMeta] = [
+        AccountMeta(public_key=lookup_table, is_signer=False, is_writable=True),
+        AccountMeta(public_key=authority, is_signer=True, is_writable=False),
+    ]
+    # The payer funds the extra rent, it is not needed if the table already holds enough lamports
+    if payer is not None:
+        account_metas.extend([
+            AccountMeta(public_key=payer, is_signer=True, is_writable=True),
+            AccountMeta(public_key=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
+        ])
+    data: bytes = ADDRESS_LOOKUP_TABLE_INSTRUCTIONS_LAYOUT.build(
+        dict(
+            type=AddressLookupTableInstructionType.EXTEND_LOOKUP_TABLE,
+            args=dict(new_addresses=[bytes(address) for address in addresses])
+        )
+    )
+    return Instruction(
+        keys=account_metas,
+        program_id=ADDRESS_LOOKUP_TABLE_PROGRAM_ID,
+        data=data,
+    )
+
+
+def _lookup_table_authority_instruction(
+        instruction_type: AddressLookupTableInstructionType,
+        lookup_table: PublicKey,
+        authority: PublicKey,
+) -> Instruction:
+    account_metas: List[AccountMeta] = [
+        AccountMeta(public_key=lookup_table, is_signer=False, is_writable=True),
+        AccountMeta(public_key=authority, is_signer=True, is_writable=False),
+    ]
+    data: bytes = ADDRESS_LOOKUP_TABLE_INSTRUCTIONS_LAYOUT.build(
+        dict(type=instruction_type, args=None)
+    )
+    return Instruction(
+        keys=account_metas,
+        program_id=ADDRESS_LOOKUP_TABLE_PROGRAM_ID,
+        data=data,
+    )
+
+
+def freeze_lookup_table(lookup_table: PublicKey, authority: PublicKey) -> Instruction:
+    return _lookup_table_authority_instruction(
+        AddressLookupTableInstructionType.FREEZE_LOOKUP_TABLE, lookup_table, authority
+    )
+
+
+def deactivate_lookup_table(lookup_table: PublicKey, authority: PublicKey) -> Instruction:
+    return _lookup_table_authority_instruction(
+        AddressLookupTableInstructionType.DEACTIVATE_LOOKUP_TABLE, lookup_table, authority
+    )
+
+
+def close_lookup_table(
+        lookup_table: PublicKey,
+        authority: PublicKey,
+        recipient: PublicKey
+) -> Instruction:
+    instruction = _lookup_table_authority_instruction(
+        AddressLookupTableInstructionType.CLOSE_LOOKUP_TABLE, lookup_table, authority
+    )
+    instruction.keys.append(
+        AccountMeta(public_key=recipient, is_signer=False, is_writable=True)
+    )
+    return instruction
@@ -4,11 +4,13 @@ from __future__ import annotations
 from enum import IntEnum
 from construct import (
     Bytes,
+    Int8ul,
     Int32ul,
     Int64ul,
     PaddedString,
     Padding,
     Pass,
+    PrefixedArray,
     Switch,
     Struct,
 )
@@ -30,7 +32,28 @@ class InstructionType(IntEnum):
     TRANSFER_WITH_SEED = 11
 
 
+class ComputeBudgetInstructionType(IntEnum):
+    REQUEST_HEAP_FRAME = 1
+    SET_COMPUTE_UNIT_LIMIT = 2
+    SET_COMPUTE_UNIT_PRICE = 3
+
+
+class AddressLookupTableInstructionType(IntEnum):
+    CREATE_LOOKUP_TABLE = 0
+    FREEZE_LOOKUP_TABLE = 1
+    EXTEND_LOOKUP_TABLE = 2
+    DEACTIVATE_LOOKUP_TABLE = 3
+    CLOSE_LOOKUP_TABLE = 4
+
+
 SYSTEM_PROGRAM_ID: PublicKey = PublicKey("11111111111111111111111111111111")
+COMPUTE_BUDGET_PROGRAM_ID: PublicKey = PublicKey("ComputeBudget111111111111111111111111111111")
+ADDRESS_LOOKUP_TABLE_PROGRAM_ID: PublicKey = PublicKey("AddressLookupTab1e1111111111111111111111111")
+TOKEN_PROGRAM_ID: PublicKey = PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+ASSOCIATED_TOKEN_PROGRAM_ID: PublicKey = PublicKey("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+MEMO_PROGRAM_ID: PublicKey = PublicKey("MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr")
+SYSVAR_RECENT_BLOCKHASHES_PUBKEY: PublicKey = PublicKey("SysvarRecentB1ockHashes11111111111111111111")
+SYSVAR_RENT_PUBKEY: PublicKey = PublicKey("SysvarRent111111111111111111111111111111111")
 
 PUBLIC_KEY_LAYOUT: Bytes = Bytes(32)
 
@@ -79,7 +102,7 @@ ASSIGN_WITH_SEED_LAYOUT = Struct(
 TRANSFER_WITH_SEED_LAYOUT = Struct(
     "lamports" / Int64ul,
     "from_seed" / RUST_STRING_LAYOUT,
-    "from_ower" / PUBLIC_KEY_LAYOUT,
+    "from_owner" / PUBLIC_KEY_LAYOUT,
 )
 
 SYSTEM_INSTRUCTIONS_LAYOUT = Struct(
@@ -103,3 +126,67 @@ SYSTEM_INSTRUCTIONS_LAYOUT = Struct(
         },
     ),
 )
+
+REQUEST_HEAP_FRAME_LAYOUT = Struct("bytes" / Int32ul)
+
+SET_COMPUTE_UNIT_LIMIT_LAYOUT = Struct("units" / Int32ul)
+
+SET_COMPUTE_UNIT_PRICE_LAYOUT = Struct("micro_lamports" / Int64ul)
+
+COMPUTE_BUDGET_INSTRUCTIONS_LAYOUT = Struct(
+    "type" / Int8ul,
+    "args"
+    / Switch(
+        lambda this: this.type,
+        {
+            ComputeBudgetInstructionType.REQUEST_HEAP_FRAME: REQUEST_HEAP_FRAME_LAYOUT,
+            ComputeBudgetInstructionType.SET_COMPUTE_UNIT_LIMIT: SET_COMPUTE_UNIT_LIMIT_LAYOUT,
+            ComputeBudgetInstructionType.SET_COMPUTE_UNIT_PRICE: SET_COMPUTE_UNIT_PRICE_LAYOUT,
+        },
+    ),
+)
+
+CREATE_LOOKUP_TABLE_LAYOUT = Struct("recent_slot" / Int64ul, "bump_seed" / Int8ul)
+
+EXTEND_LOOKUP_TABLE_LAYOUT = Struct(
+    "new_addresses" / PrefixedArray(Int64ul, PUBLIC_KEY_LAYOUT)
+)
+
+ADDRESS_LOOKUP_TABLE_INSTRUCTIONS_LAYOUT = Struct(
+    "type" / Int32ul,
+    "args"
+    / Switch(
+        lambda this: this.type,
+        {
+            AddressLookupTableInstructionType.CREATE_LOOKUP_TABLE: CREATE_LOOKUP_TABLE_LAYOUT,
+            AddressLookupTableInstructionType.FREEZE_LOOKUP_TABLE: Pass,  # No args
+            AddressLookupTableInstructionType.EXTEND_LOOKUP_TABLE: EXTEND_LOOKUP_TABLE_LAYOUT,
+            AddressLookupTableInstructionType.DEACTIVATE_LOOKUP_TABLE: Pass,  # No args
+            AddressLookupTableInstructionType.CLOSE_LOOKUP_TABLE: Pass,  # No args
+        },
+    ),
+)
+
+# Fixed size header of a lookup table account, the addresses follow it
+LOOKUP_TABLE_META_SIZE = 56
+
+LOOKUP_TABLE_META_LAYOUT = Struct(
+    "type" / Int32ul,
+    "deactivation_slot" / Int64ul,
+    "last_extended_slot" / Int64ul,
+    "last_extended_slot_start_index" / Int8ul,
+    "has_authority" / Int8ul,
+    "authority" / PUBLIC_KEY_LAYOUT,
+    Padding(2),
+)
+
+# Size of a nonce account: version, state, authority, durable nonce and lamports per signature
+NONCE_ACCOUNT_LENGTH = 80
+
+NONCE_ACCOUNT_LAYOUT = Struct(
+    "version" / Int32ul,
+    "state" / Int32ul,
+    "authority" / PUBLIC_KEY_LAYOUT,
+    "nonce" / PUBLIC_KEY_LAYOUT,
+    "lamports_per_signature" / Int64ul,
+)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import List, NamedTuple
-from base58 import b58decode, b58encode
-from ..publickey import PublicKey
+from typing import List, NamedTuple, Tuple
+from functools import lru_cache
+from ..publickey import PublicKey, PublicKeyPool
+from .b58 import b58decode, b58encode
 
 PUBLIC_KEY_LENGTH = 32
+# The highest bit of the first byte is set for versioned messages
+VERSION_PREFIX_MASK = 0x80
 
 
 def decode_length(value: bytes) -> int:
@@ -19,6 +22,24 @@ def decode_length(value: bytes) -> int:
     return len_value
 
 
+def decode_length_at(buffer: bytes | memoryview, offset: int) -> Tuple[int, int]:
+    """
+    Decodes a compact-u16 length without consuming the buffer.
+
+    Returns:
+        Tuple[int, int]: The length and the position right after it.
+    """
+    len_value: int = 0
+    size: int = 0
+    while True:
+        elem = buffer[offset]
+        offset += 1
+        len_value |= (elem & 0x7f) << (size * 7)
+        size += 1
+        if (elem & 0x80) == 0:
+            return len_value, offset
+
+
 def encode_length(value: int) -> bytes:
     elems, rem_len = [], value
     while True:
@@ -32,14 +53,70 @@ def encode_length(value: int) -> bytes:
     return bytes(elems)
 
 
+def encoded_length_size(value: int) -> int:
+    # Number of bytes of encode_length(value)
+    return 1 if value < 0x80 else 2 if value < 0x4000 else 3
+
+
+def compiled_instruction_size(num_accounts: int, data_length: int) -> int:
+    # Program id index, account indexes and data, each list prefixed with its length
+    return (
+        1 + encoded_length_size(num_accounts) + num_accounts
+        + encoded_length_size(data_length) + data_length
+    )
+
+
+# Transactions signed in bulk share a handful of recent blockhashes
+@lru_cache(maxsize=256)
+def _decode_blockhash(blockhash: str) -> bytes:
+    return b58decode(blockhash)
+
+
 def to_uint8_bytes(val: int) -> bytes:
     return val.to_bytes(1, byteorder="little")
 
 
-class CompiledInstruction(NamedTuple):
+class _CompiledInstructionFields(NamedTuple):
     accounts: bytes | List[int]
     program_id_index: int
-    data: bytes
+    raw_data: bytes
+
+
+class CompiledInstruction(_CompiledInstructionFields):
+    """
+    An instruction of a message, its program and accounts given as indexes of the
+    message account keys.
+
+    `data` is the base58 encoded instruction data, as it has always been, and
+    `raw_data` the bytes that are serialized. Either can be given, base58 strings
+    are decoded once when the instruction is created.
+    """
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        accounts: bytes | List[int],
+        program_id_index: int,
+        data: bytes | str | None = None,
+        raw_data: bytes | None = None,
+    ) -> CompiledInstruction:
+        if raw_data is None:
+            raw_data = b58decode(data) if isinstance(data, str) else bytes(data or b"")
+        return super().__new__(cls, accounts, program_id_index, raw_data)
+
+    @property
+    def data(self) -> str:
+        return b58encode(self.raw_data)
+
+
+def instruction_data(instruction: CompiledInstruction) -> bytes:
+    # Raw data of a compiled instruction, or of an instruction parsed from JSON RPC
+    if isinstance(instruction, CompiledInstruction):
+        return instruction.raw_data
+    data = instruction.data
+    if isinstance(data, str):
+        return b58decode(data)
+    return bytes(data)
 
 
 class MessageHeader(NamedTuple):
@@ -49,71 +126,44 @@ class MessageHeader(NamedTuple):
 
 
 class Message:
+    version = "legacy"
+
     def __init__(
         self,
         header: MessageHeader,
-        account_keys: List[str],
+        account_keys: List[PublicKey | bytes | str],
         instructions: List[CompiledInstruction],
         recent_blockhash: str
     ):
         self.header = header
-        self.account_keys = [PublicKey(key) for key in account_keys]
+        self.account_keys = [
+            key if isinstance(key, PublicKey) else PublicKey(key)
+            for key in account_keys
+        ]
         self.recent_blockhash = recent_blockhash
         self.instructions = instructions
 
     def encode_message(self) -> bytes:
-        MessageFormat = NamedTuple(
-            "MessageFormat",
-            [
-                ("num_required_signatures", bytes),
-                ("num_readonly_signed_accounts", bytes),
-                ("num_readonly_unsigned_accounts", bytes),
-                ("public_keys_length", bytes),
-                ("public_keys", bytes),
-                ("recent_blockhash", bytes),
-            ],
-        )
-
-        return b"".join(
-            MessageFormat(
-                num_required_signatures=to_uint8_bytes(
-                    self.header.num_required_signatures),
-                num_readonly_signed_accounts=to_uint8_bytes(
-                    self.header.num_readonly_signed_accounts),
-                num_readonly_unsigned_accounts=to_uint8_bytes(
-                    self.header.num_readonly_unsigned_accounts),
-                public_keys_length=encode_length(len(self.account_keys)),
-                public_keys=b"".join([bytes(public_key)
-                                      for public_key in self.account_keys]),
-                recent_blockhash=b58decode(self.recent_blockhash),
-            )
-        )
+        # Header, account keys and recent blockhash
+        return b"".join([
+            bytes(self.header),
+            encode_length(len(self.account_keys)),
+            *[public_key.byte_value for public_key in self.account_keys],
+            _decode_blockhash(self.recent_blockhash),
+        ])
 
     @staticmethod
     def encode_instruction(
         instruction: "CompiledInstruction",
     ) -> bytes:
-        InstructionFormat = NamedTuple(
-            "InstructionFormat",
-            [
-                ("program_idx", bytes),
-                ("accounts_length", bytes),
-                ("accounts", bytes),
-                ("data_length", bytes),
-                ("data", bytes),
-            ],
-        )
-        data = b58decode(instruction.data)
-        data_length = encode_length(len(data))
-        return b"".join(
-            InstructionFormat(
-                program_idx=to_uint8_bytes(instruction.program_id_index),
-                accounts_length=encode_length(len(instruction.accounts)),
-                accounts=bytes(instruction.accounts),
-                data_length=data_length,
-                data=data,
-            )
-        )
+        data = instruction_data(instruction)
+        return b"".join([
+            to_uint8_bytes(instruction.program_id_index),
+            encode_length(len(instruction.accounts)),
+            bytes(instruction.accounts),
+            encode_length(len(data)),
+            data,
+        ])
 
     def is_account_signer(self, index: int) -> bool:
         return index < self.header.num_required_signatures
@@ -140,40 +190,197 @@ class Message:
     @staticmethod
     def from_buffer(buffer: bytes) -> Message:
         # Reference: https://github.com/solana-labs/solana-web3.js/blob/a1fafee/packages/library-legacy/src/message/legacy.ts#L267
+        message, _ = Message.decode_at(memoryview(buffer), 0)
+        return message
+
+    @staticmethod
+    def decode_at(
+        view: memoryview, offset: int, key_pool: PublicKeyPool | None = None
+    ) -> Tuple[Message, int]:
+        """
+        Decodes a message in a single pass over the buffer, without copying it.
+
+        Args:
+            view (memoryview): The buffer containing the message.
+            offset (int): The position at which the message starts.
+            key_pool (PublicKeyPool, optional): Pool the account keys are interned in.
 
-        buffer_array = list(buffer)
-        num_required_signatures = buffer_array.pop(0)
+        Returns:
+            Tuple[Message, int]: The message and the position right after it.
+        """
+        if offset < len(view) and view[offset] & VERSION_PREFIX_MASK:
+            raise ValueError(
+                "Versioned messages must be deserialized with MessageV0.from_buffer")
+        header, account_keys, recent_blockhash, instructions, offset = _decode_body(
+            view, offset, key_pool)
+        return Message(header, account_keys, instructions, recent_blockhash), offset
 
-        if num_required_signatures != (num_required_signatures & 0x7f):
-            raise ValueError("Versioned messages must be deserialized")
 
-        num_readonly_signed_accounts = buffer_array.pop(0)
-        num_readonly_unsigned_accounts = buffer_array.pop(0)
+class MessageAddressTableLookup(NamedTuple):
+    account_key: PublicKey
+    writable_indexes: bytes | List[int]
+    readonly_indexes: bytes | List[int]
 
-        account_count = decode_length(buffer_array)
+
+class MessageV0(Message):
+    version = 0
+
+    def __init__(
+        self,
+        header: MessageHeader,
+        account_keys: List[PublicKey | bytes | str],
+        instructions: List[CompiledInstruction],
+        recent_blockhash: str,
+        address_table_lookups: List[MessageAddressTableLookup] | None = None,
+    ):
+        # account_keys only holds the static keys, the others are loaded from lookup tables
+        super().__init__(header, account_keys, instructions, recent_blockhash)
+        self.address_table_lookups = address_table_lookups or []
+
+    @property
+    def num_loaded_writable(self) -> int:
+        return sum(len(lookup.writable_indexes) for lookup in self.address_table_lookups)
+
+    def is_account_writable(self, index: int) -> bool:
+        num_static = len(self.account_keys)
+        if index < num_static:
+            return super().is_account_writable(index)
+        return index - num_static < self.num_loaded_writable
+
+    def resolve_account_keys(self, address_lookup_tables) -> List[PublicKey]:
+        """
+        Returns the static keys followed by the writable and readonly keys loaded
+        from the lookup tables, in the order compiled instructions index them.
+
+        Args:
+            address_lookup_tables (List[AddressLookupTableAccount]): The tables the message looks up.
+
+        Raises:
+            ValueError: If a table is missing or does not hold a looked up index.
+        """
+        tables = {bytes(table.key): table for table in address_lookup_tables}
+        writable: List[PublicKey] = []
+        readonly: List[PublicKey] = []
+        for lookup in self.address_table_lookups:
+            table = tables.get(bytes(lookup.account_key))
+            if table is None:
+                raise ValueError(f"Address lookup table not provided: {lookup.account_key}")
+            try:
+                writable.extend(table.addresses[index] for index in lookup.writable_indexes)
+                readonly.extend(table.addresses[index] for index in lookup.readonly_indexes)
+            except IndexError:
+                raise ValueError(
+                    f"Address lookup table {lookup.account_key} does not hold a looked up index")
+        return [*self.account_keys, *writable, *readonly]
+
+    def serialize(self) -> bytes:
+        message_buffer = bytearray([VERSION_PREFIX_MASK | self.version])
+        message_buffer.extend(super().serialize())
+        message_buffer.extend(encode_length(len(self.address_table_lookups)))
+        for lookup in self.address_table_lookups:
+            message_buffer.extend(bytes(lookup.account_key))
+            message_buffer.extend(encode_length(len(lookup.writable_indexes)))
+            message_buffer.extend(bytes(lookup.writable_indexes))
+            message_buffer.extend(encode_length(len(lookup.readonly_indexes)))
+            message_buffer.extend(bytes(lookup.readonly_indexes))
+        return bytes(message_buffer)
+
+    @staticmethod
+    def from_buffer(buffer: bytes) -> MessageV0:
+        # Reference: https://github.com/solana-labs/solana-web3.js/blob/a1fafee/packages/library-legacy/src/message/v0.ts#L410
+        message, _ = MessageV0.decode_at(memoryview(buffer), 0)
+        return message
+
+    @staticmethod
+    def decode_at(
+        view: memoryview, offset: int, key_pool: PublicKeyPool | None = None
+    ) -> Tuple[MessageV0, int]:
+        """
+        Decodes a version 0 message, see `Message.decode_at`.
+        """
+        if offset >= len(view) or not view[offset] & VERSION_PREFIX_MASK:
+            raise ValueError("Expected a versioned message")
+        version = view[offset] & 0x7f
+        if version != 0:
+            raise ValueError(f"Unsupported message version: {version}")
+
+        header, account_keys, recent_blockhash, instructions, offset = _decode_body(
+            view, offset + 1, key_pool)
+        make_key = key_pool.get if key_pool is not None else PublicKey
+        lookups: List[MessageAddressTableLookup] = []
+        try:
+            lookup_count, offset = decode_length_at(view, offset)
+            for _ in range(lookup_count):
+                end = offset + PUBLIC_KEY_LENGTH
+                account_key = make_key(view[offset:end])
+                writable_count, offset = decode_length_at(view, end)
+                end = offset + writable_count
+                writable_indexes = view[offset:end].tobytes()
+                readonly_count, offset = decode_length_at(view, end)
+                end = offset + readonly_count
+                readonly_indexes = view[offset:end].tobytes()
+                offset = end
+                lookups.append(MessageAddressTableLookup(
+                    account_key, writable_indexes, readonly_indexes))
+        except (IndexError, ValueError):
+            offset = len(view) + 1
+
+        if offset > len(view):
+            raise ValueError("Buffer is too short to contain the message")
+
+        return MessageV0(header, account_keys, instructions, recent_blockhash, lookups), offset
+
+
+def decode_message_at(
+    view: memoryview, offset: int, key_pool: PublicKeyPool | None = None
+) -> Tuple[Message, int]:
+    """
+    Decodes a legacy or version 0 message depending on its prefix.
+    """
+    if offset < len(view) and view[offset] & VERSION_PREFIX_MASK:
+        return MessageV0.decode_at(view, offset, key_pool)
+    return Message.decode_at(view, offset, key_pool)
+
+
+def _decode_body(
+    view: memoryview, offset: int, key_pool: PublicKeyPool | None
+) -> Tuple[MessageHeader, List[PublicKey], str, List[CompiledInstruction], int]:
+    # Header, account keys, recent blockhash and instructions, shared by all message versions
+    make_key = key_pool.get if key_pool is not None else PublicKey
+    try:
+        header = MessageHeader(view[offset], view[offset + 1], view[offset + 2])
+        offset += 3
+
+        account_count, offset = decode_length_at(view, offset)
         account_keys: List[PublicKey] = []
         for _ in range(account_count):
-            account = bytes(buffer_array[:PUBLIC_KEY_LENGTH])
-            buffer_array = buffer_array[PUBLIC_KEY_LENGTH:]
-            account_keys.append(PublicKey(bytes(account)))
+            end = offset + PUBLIC_KEY_LENGTH
+            account_keys.append(make_key(view[offset:end]))
+            offset = end
 
-        recent_blockhash = buffer_array[:PUBLIC_KEY_LENGTH]
-        buffer_array = buffer_array[PUBLIC_KEY_LENGTH:]
+        end = offset + PUBLIC_KEY_LENGTH
+        recent_blockhash = b58encode(view[offset:end].tobytes())
+        offset = end
 
-        instruction_count = decode_length(buffer_array)
+        instruction_count, offset = decode_length_at(view, offset)
         instructions: List[CompiledInstruction] = []
         for _ in range(instruction_count):
-            program_id_index = buffer_array.pop(0)
-            account_count = decode_length(buffer_array)
-            accounts = buffer_array[:account_count]
-            buffer_array = buffer_array[account_count:]
-            data_length = decode_length(buffer_array)
-            data_slice = buffer_array[:data_length]
-            data = b58encode(bytes(data_slice))
-            buffer_array = buffer_array[data_length:]
-            instructions.append(CompiledInstruction(
-                accounts, program_id_index, data))
-
-        header = MessageHeader(
-            num_required_signatures, num_readonly_signed_accounts, num_readonly_unsigned_accounts)
-        return Message(header, account_keys, instructions, b58encode(bytes(recent_blockhash)).decode("utf-8"))
+            program_id_index = view[offset]
+            account_count, offset = decode_length_at(view, offset + 1)
+            end = offset + account_count
+            accounts = view[offset:end].tobytes()
+            data_length, offset = decode_length_at(view, end)
+            end = offset + data_length
+            data = view[offset:end].tobytes()
+            offset = end
+            instructions.append(CompiledInstruction._make(
+                (accounts, program_id_index, data)))
+    except (IndexError, ValueError):
+        # Slices past the end are shortened instead of raising, so a short
+        # key shows up as an invalid public key
+        offset = len(view) + 1
+
+    if offset > len(view):
+        raise ValueError("Buffer is too short to contain the message")
+
+    return header, account_keys, recent_blockhash, instructions, offset
@@ -0,0 +1,442 @@
+# Developer reference: https://github.com/solana-labs/solana/blob/master/sdk/program/src/system_instruction.rs
+# Precompiled encoders for the system program instructions, producing the same
+# bytes as SYSTEM_INSTRUCTIONS_LAYOUT without construct's interpretive overhead.
+from __future__ import annotations
+
+from struct import Struct, error as StructError
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from ..publickey import PublicKey, PublicKeyPool
+from .b58 import b58decode
+from .layouts import InstructionType, SYSTEM_PROGRAM_ID
+
+if TYPE_CHECKING:
+    from .instructions import Instruction
+    from .types.block import Block
+
+_U32 = Struct("<I")
+_U64 = Struct("<Q")
+_CREATE_ACCOUNT = Struct("<IQQ32s")
+_ASSIGN = Struct("<I32s")
+_TRANSFER = Struct("<IQ")
+_WITHDRAW_NONCE_ACCOUNT = Struct("<IQ")
+_INITIALIZE_NONCE_ACCOUNT = Struct("<I32s")
+_AUTHORIZE_NONCE_ACCOUNT = Struct("<I32s")
+_ALLOCATE = Struct("<IQ")
+_PUBLIC_KEY = Struct("<32s")
+_LAMPORTS_SPACE_PROGRAM = Struct("<QQ32s")
+_SPACE_PROGRAM = Struct("<Q32s")
+
+_ADVANCE_NONCE_ACCOUNT_DATA = _U32.pack(InstructionType.ADVANCE_NONCE_ACCOUNT)
+
+
+def _pack(layout: Struct, *values: Any) -> bytes:
+    try:
+        return layout.pack(*values)
+    except StructError as e:
+        raise ValueError(f"Invalid system instruction argument: {e}") from e
+
+
+def _encode_string(value: str) -> bytes:
+    # Rust strings are serialized with a u64 byte length
+    encoded = value.encode("utf-8")
+    return _U64.pack(len(encoded)) + encoded
+
+
+def encode_create_account(lamports: int, space: int, program_id: bytes) -> bytes:
+    return _pack(_CREATE_ACCOUNT, InstructionType.CREATE_ACCOUNT, lamports, space, bytes(program_id))
+
+
+def encode_assign(program_id: bytes) -> bytes:
+    return _pack(_ASSIGN, InstructionType.ASSIGN, bytes(program_id))
+
+
+def encode_transfer(lamports: int) -> bytes:
+    return _pack(_TRANSFER, InstructionType.TRANSFER, lamports)
+
+
+def encode_create_account_with_seed(
+    base: bytes, seed: str, lamports: int, space: int, program_id: bytes
+) -> bytes:
+    return (
+        _pack(_ASSIGN, InstructionType.CREATE_ACCOUNT_WITH_SEED, bytes(base))
+        + _encode_string(seed)
+        + _pack(_LAMPORTS_SPACE_PROGRAM, lamports, space, bytes(program_id))
+    )
+
+
+def encode_advance_nonce_account() -> bytes:
+    return _ADVANCE_NONCE_ACCOUNT_DATA
+
+
+def encode_withdraw_nonce_account(lamports: int) -> bytes:
+    return _pack(_WITHDRAW_NONCE_ACCOUNT, InstructionType.WITHDRAW_NONCE_ACCOUNT, lamports)
+
+
+def encode_initialize_nonce_account(authorized: bytes) -> bytes:
+    return _pack(_INITIALIZE_NONCE_ACCOUNT, InstructionType.INITIALIZE_NONCE_ACCOUNT, bytes(authorized))
+
+
+def encode_authorize_nonce_account(authorized: bytes) -> bytes:
+    return _pack(_AUTHORIZE_NONCE_ACCOUNT, InstructionType.AUTHORIZE_NONCE_ACCOUNT, bytes(authorized))
+
+
+def encode_allocate(space: int) -> bytes:
+    return _pack(_ALLOCATE, InstructionType.ALLOCATE, space)
+
+
+def encode_allocate_with_seed(base: bytes, seed: str, space: int, program_id: bytes) -> bytes:
+    return (
+        _pack(_ASSIGN, InstructionType.ALLOCATE_WITH_SEED, bytes(base))
+        + _encode_string(seed)
+        + _pack(_SPACE_PROGRAM, space, bytes(program_id))
+    )
+
+
+def encode_assign_with_seed(base: bytes, seed: str, program_id: bytes) -> bytes:
+    return (
+        _pack(_ASSIGN, InstructionType.ASSIGN_WITH_SEED, bytes(base))
+        + _encode_string(seed)
+        + _pack(_PUBLIC_KEY, bytes(program_id))
+    )
+
+
+def encode_transfer_with_seed(lamports: int, from_seed: str, from_owner: bytes) -> bytes:
+    return (
+        _pack(_TRANSFER, InstructionType.TRANSFER_WITH_SEED, lamports)
+        + _encode_string(from_seed)
+        + _pack(_PUBLIC_KEY, bytes(from_owner))
+    )
+
+
+class _Reader:
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes, offset: int):
+        self.data = data
+        self.offset = offset
+
+    def unpack(self, layout: Struct) -> Tuple[Any, ...]:
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def u64(self) -> int:
+        return self.unpack(_U64)[0]
+
+    def public_key(self) -> bytes:
+        return self.unpack(_PUBLIC_KEY)[0]
+
+    def string(self) -> str:
+        length = self.u64()
+        end = self.offset + length
+        if end > len(self.data):
+            raise ValueError("Instruction data is too short for its seed")
+        value = bytes(self.data[self.offset:end]).decode("utf-8")
+        self.offset = end
+        return value
+
+
+def _fields(*readers: Tuple[str, Callable[[_Reader], Any]]) -> Callable[[_Reader], Dict[str, Any]]:
+    return lambda reader: {name: read(reader) for name, read in readers}
+
+
+def _fixed(layout: str, *names: str) -> Callable[[_Reader], Dict[str, Any]]:
+    # Instructions without a seed are read with a single precompiled struct
+    compiled = Struct(layout)
+    return lambda reader: dict(zip(names, reader.unpack(compiled)))
+
+
+_u64 = _Reader.u64
+_public_key = _Reader.public_key
+_string = _Reader.string
+
+# Argument names are those of the construct layouts
+_DECODERS: Dict[int, Callable[[_Reader], Dict[str, Any]]] = {
+    InstructionType.CREATE_ACCOUNT: _fixed("<QQ32s", "lamports", "space", "program_id"),
+    InstructionType.ASSIGN: _fixed("<32s", "program_id"),
+    InstructionType.TRANSFER: _fixed("<Q", "lamports"),
+    InstructionType.CREATE_ACCOUNT_WITH_SEED: _fields(
+        ("base", _public_key), ("seed", _string), ("lamports", _u64), ("space", _u64), ("program_id", _public_key)
+    ),
+    InstructionType.ADVANCE_NONCE_ACCOUNT: _fields(),
+    InstructionType.WITHDRAW_NONCE_ACCOUNT: _fixed("<Q", "lamports"),
+    InstructionType.INITIALIZE_NONCE_ACCOUNT: _fixed("<32s", "authorized"),
+    InstructionType.AUTHORIZE_NONCE_ACCOUNT: _fixed("<32s", "authorized"),
+    InstructionType.ALLOCATE: _fixed("<Q", "space"),
+    InstructionType.ALLOCATE_WITH_SEED: _fields(
+        ("base", _public_key), ("seed", _string), ("space", _u64), ("program_id", _public_key)
+    ),
+    InstructionType.ASSIGN_WITH_SEED: _fields(("base", _public_key), ("seed", _string), ("program_id", _public_key)),
+    InstructionType.TRANSFER_WITH_SEED: _fields(
+        ("lamports", _u64), ("from_seed", _string), ("from_owner", _public_key)
+    ),
+}
+
+
+def decode_system_instruction_data(data: bytes) -> Tuple[InstructionType, Dict[str, Any]]:
+    """
+    Decodes the data of a system program instruction.
+
+    Args:
+        data (bytes): The instruction data.
+
+    Returns:
+        Tuple[InstructionType, Dict[str, Any]]: The instruction type and its arguments,
+        named as in `SYSTEM_INSTRUCTIONS_LAYOUT`, with public keys as raw bytes.
+
+    Raises:
+        ValueError: If the data is truncated or of an unknown instruction type.
+    """
+    try:
+        (instruction_type,) = _U32.unpack_from(data, 0)
+        decoder = _DECODERS.get(instruction_type)
+        if decoder is None:
+            raise ValueError(f"Unknown system instruction type {instruction_type}")
+        return InstructionType(instruction_type), decoder(_Reader(data, _U32.size))
+    except StructError as e:
+        raise ValueError("Instruction data is too short for its type") from e
+
+
+class CreateAccount(NamedTuple):
+    from_public_key: PublicKey
+    new_account_public_key: PublicKey
+    lamports: int
+    space: int
+    program_id: PublicKey
+
+
+class Assign(NamedTuple):
+    account_public_key: PublicKey
+    program_id: PublicKey
+
+
+class Transfer(NamedTuple):
+    from_public_key: PublicKey
+    to_public_key: PublicKey
+    lamports: int
+
+
+class CreateAccountWithSeed(NamedTuple):
+    from_public_key: PublicKey
+    new_account_public_key: PublicKey
+    base_public_key: PublicKey
+    seed: str
+    lamports: int
+    space: int
+    program_id: PublicKey
+
+
+class AdvanceNonceAccount(NamedTuple):
+    nonce_account: PublicKey
+    nonce_authority: PublicKey
+
+
+class WithdrawNonceAccount(NamedTuple):
+    nonce_account: PublicKey
+    to_public_key: PublicKey
+    nonce_authority: PublicKey
+    lamports: int
+
+
+class InitializeNonceAccount(NamedTuple):
+    nonce_account: PublicKey
+    authorized: PublicKey
+
+
+class AuthorizeNonceAccount(NamedTuple):
+    nonce_account: PublicKey
+    nonce_authority: PublicKey
+    authorized: PublicKey
+
+
+class Allocate(NamedTuple):
+    account_public_key: PublicKey
+    space: int
+
+
+class AllocateWithSeed(NamedTuple):
+    account_public_key: PublicKey
+    base_public_key: PublicKey
+    seed: str
+    space: int
+    program_id: PublicKey
+
+
+class AssignWithSeed(NamedTuple):
+    account_public_key: PublicKey
+    base_public_key: PublicKey
+    seed: str
+    program_id: PublicKey
+
+
+class TransferWithSeed(NamedTuple):
+    from_public_key: PublicKey
+    base_public_key: PublicKey
+    to_public_key: PublicKey
+    lamports: int
+    from_seed: str
+    from_owner: PublicKey
+
+
+SystemInstruction = Union[
+    CreateAccount, Assign, Transfer, CreateAccountWithSeed, AdvanceNonceAccount, WithdrawNonceAccount,
+    InitializeNonceAccount, AuthorizeNonceAccount, Allocate, AllocateWithSeed, AssignWithSeed, TransferWithSeed,
+]
+
+# Typed result of each instruction, with the positions of its fields in the
+# instruction accounts, None for fields read from the data
+_TYPED: Dict[int, Tuple[type, Dict[str, int]]] = {
+    InstructionType.CREATE_ACCOUNT: (CreateAccount, {"from_public_key": 0, "new_account_public_key": 1}),
+    InstructionType.ASSIGN: (Assign, {"account_public_key": 0}),
+    InstructionType.TRANSFER: (Transfer, {"from_public_key": 0, "to_public_key": 1}),
+    InstructionType.CREATE_ACCOUNT_WITH_SEED: (
+        CreateAccountWithSeed, {"from_public_key": 0, "new_account_public_key": 1}),
+    # The recent blockhashes and rent sysvars are skipped
+    InstructionType.ADVANCE_NONCE_ACCOUNT: (AdvanceNonceAccount, {"nonce_account": 0, "nonce_authority": 2}),
+    InstructionType.WITHDRAW_NONCE_ACCOUNT: (
+        WithdrawNonceAccount, {"nonce_account": 0, "to_public_key": 1, "nonce_authority": 4}),
+    InstructionType.INITIALIZE_NONCE_ACCOUNT: (InitializeNonceAccount, {"nonce_account": 0}),
+    InstructionType.AUTHORIZE_NONCE_ACCOUNT: (AuthorizeNonceAccount, {"nonce_account": 0, "nonce_authority": 1}),
+    InstructionType.ALLOCATE: (Allocate, {"account_public_key": 0}),
+    InstructionType.ALLOCATE_WITH_SEED: (AllocateWithSeed, {"account_public_key": 0}),
+    InstructionType.ASSIGN_WITH_SEED: (AssignWithSeed, {"account_public_key": 0}),
+    InstructionType.TRANSFER_WITH_SEED: (
+        TransferWithSeed, {"from_public_key": 0, "base_public_key": 1, "to_public_key": 2}),
+}
+
+_ARGUMENT_NAMES = {"base": "base_public_key"}
+
+
+def decode_system_instruction_accounts(
+    data: bytes,
+    accounts: Sequence[PublicKey],
+    key_pool: Optional[PublicKeyPool] = None,
+) -> SystemInstruction:
+    """
+    Decodes a system program instruction, from its data and the public keys of its
+    accounts, into a typed instruction such as `Transfer`.
+
+    Raises:
+        ValueError: If the data is invalid or there are too few accounts.
+    """
+    instruction_type, args = decode_system_instruction_data(data)
+    typed, positions = _TYPED[instruction_type]
+    fields: Dict[str, Any] = {}
+    try:
+        for name, position in positions.items():
+            fields[name] = accounts[position]
+    except IndexError:
+        raise ValueError(f"Too few accounts for a {typed.__name__} instruction")
+    for name, value in args.items():
+        if isinstance(value, bytes):
+            value = key_pool.get(value) if key_pool is not None else PublicKey(value)
+        fields[_ARGUMENT_NAMES.get(name, name)] = value
+    return typed(**fields)
+
+
+def decode_system_instruction(instruction: Instruction) -> SystemInstruction:
+    """
+    Decodes a system program `Instruction`, for example from `Transaction.instructions`.
+
+    Returns:
+        SystemInstruction: The typed instruction, such as `Transfer` or `CreateAccount`.
+
+    Raises:
+        ValueError: If the instruction is not a valid system program instruction.
+    """
+    if bytes(instruction.program_id) != SYSTEM_PROGRAM_ID.byte_value:
+        raise ValueError("Not a system program instruction")
+    return decode_system_instruction_accounts(
+        bytes(instruction.data),
+        [PublicKey(meta.public_key) if isinstance(meta.public_key, str) else meta.public_key
+         for meta in instruction.keys],
+    )
+
+
+class BlockSystemInstruction(NamedTuple):
+    signature: str
+    instruction_index: int
+    # Position within the inner instructions of the instruction, None at the top level
+    inner_index: Optional[int]
+    instruction: SystemInstruction
+    failed: bool
+
+
+def _block_account_keys(message: Any, loaded_addresses: Optional[Dict[str, List[str]]]) -> List[PublicKey]:
+    keys = list(message.account_keys)
+    if loaded_addresses:
+        keys.extend(PublicKey(key) for key in loaded_addresses.get("writable", []))
+        keys.extend(PublicKey(key) for key in loaded_addresses.get("readonly", []))
+    return keys
+
+
+def decode_block_system_instructions(
+    block: Block,
+    instruction_types: Optional[Iterable[InstructionType]] = None,
+    include_inner: bool = True,
+    key_pool: Optional[PublicKeyPool] = None,
+) -> List[BlockSystemInstruction]:
+    """
+    Decodes every system program instruction of a block in one pass. Transactions
+    which do not reference the system program are skipped after one scan of their
+    account keys, and other instructions by their program id index alone.
+
+    Args:
+        block (Block): The block, as returned by `Client.get_block`.
+        instruction_types (Iterable[InstructionType], optional): Only decode these types, such as transfers.
+        include_inner (bool, optional): Whether to decode inner instructions, from cross-program invocations. Defaults to True.
+        key_pool (PublicKeyPool, optional): Interns the public keys read from instruction data.
+
+    Returns:
+        List[BlockSystemInstruction]: The decoded instructions in block order. Invalid
+        instructions, which can only appear in failed transactions, are skipped.
+    """
+    wanted = None if instruction_types is None else {int(value) for value in instruction_types}
+    system_program = SYSTEM_PROGRAM_ID.byte_value
+    decoded: List[BlockSystemInstruction] = []
+    for element in block.transactions:
+        message = element.transaction.message
+        program_index = next(
+            (i for i, key in enumerate(message.account_keys) if key.byte_value == system_program), None
+        )
+        if program_index is None:
+            continue
+
+        meta = element.meta
+        inner = meta.inner_instructions if include_inner and meta.inner_instructions else []
+        candidates = [(i, None, instruction) for i, instruction in enumerate(message.instructions)]
+        for group in inner:
+            candidates.extend(
+                (group["index"], j, _InnerInstruction(instruction))
+                for j, instruction in enumerate(group["instructions"])
+            )
+        account_keys = None
+        for instruction_index, inner_index, instruction in candidates:
+            if instruction.program_id_index != program_index:
+                continue
+            data = instruction.data
+            data = b58decode(data) if isinstance(data, str) else bytes(data)
+            if wanted is not None and int.from_bytes(data[:4], "little") not in wanted:
+                continue
+            if account_keys is None:
+                account_keys = _block_account_keys(message, meta.loaded_addresses)
+            try:
+                typed = decode_system_instruction_accounts(
+                    data, [account_keys[index] for index in instruction.accounts], key_pool
+                )
+            except (ValueError, IndexError):
+                continue
+            decoded.append(BlockSystemInstruction(
+                element.transaction.signatures[0], instruction_index, inner_index, typed, meta.err is not None
+            ))
+    return decoded
+
+
+class _InnerInstruction:
+    __slots__ = ("accounts", "program_id_index", "data")
+
+    def __init__(self, response: Dict[str, Any]):
+        self.accounts = response["accounts"]
+        self.program_id_index = response["programIdIndex"]
+        self.data = response["data"]
@@ -91,6 +91,21 @@ class RecentPerformanceSamples:
         self.sample_period_secs = response['samplePeriodSecs']
         self.num_non_vote_transaction = response['numNonVoteTransaction']
 
+class PrioritizationFeeType(TypedDict):
+    '''
+    JSON Response type of Prioritization Fee received by RPC
+    '''
+    slot: int
+    prioritizationFee: int
+
+class PrioritizationFee:
+    '''
+    Convert Prioritization Fee JSON to Class
+    '''
+    def __init__(self, response: PrioritizationFeeType) -> None:
+        self.slot = response['slot']
+        self.prioritization_fee = response['prioritizationFee']
+
 class TransactionSignatureType(TypedDict):
     '''
     JSON Response type of Transaction Signature received by RPC
@@ -153,4 +168,38 @@ class Supply:
         self.total = response['total']
         self.circulating = response['circulating']
         self.non_circulating = response['nonCirculating']
-        self.non_circulating_accounts = response['nonCirculatingAccounts']
\ No newline at end of file
+        self.non_circulating_accounts = response['nonCirculatingAccounts']
+
+
+class SimulatedTransactionType(TypedDict):
+    '''
+    JSON Response type of Simulated Transaction received by RPC
+    '''
+    err: Any
+    logs: Optional[List[str]]
+    accounts: Optional[List[Optional[AccountInfoType]]]
+    unitsConsumed: Optional[int]
+    returnData: Optional[Any]
+    innerInstructions: Optional[List[Any]]
+    replacementBlockhash: Optional[Any]
+
+class SimulatedTransaction:
+    '''
+    Convert Simulated Transaction JSON to Class
+    '''
+
+    def __init__(self, response: SimulatedTransactionType) -> None:
+        self.err = response.get('err')
+        self.logs = response.get('logs') or []
+        accounts = response.get('accounts')
+        self.accounts = None if accounts is None else [
+            None if account is None else AccountInfo(account) for account in accounts
+        ]
+        self.units_consumed = response.get('unitsConsumed') or 0
+        self.return_data = response.get('returnData')
+        self.inner_instructions = response.get('innerInstructions')
+        replacement = response.get('replacementBlockhash')
+        self.replacement_blockhash = replacement['blockhash'] if replacement else None
+
+    def __repr__(self) -> str:
+        return f"SimulatedTransaction(err={self.err!r}, units_consumed={self.units_consumed})"
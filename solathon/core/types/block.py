@@ -116,6 +116,7 @@ class MetaType(TypedDict):
     preBalances: List[int]
     preTokenBalances: List[Any]
     rewards: Union[Any, None]
+    loadedAddresses: Dict[str, List[str]]
 
 
 class Meta:
@@ -133,6 +134,8 @@ class Meta:
         self.pre_balances = response['preBalances']
         self.pre_token_balances = response['preTokenBalances']
         self.rewards = response['rewards']
+        # Accounts loaded from address lookup tables by version 0 transactions
+        self.loaded_addresses = response.get('loadedAddresses')
 
     def __repr__(self) -> str:
         return f"Meta(err={self.err!r}, fee={self.fee!r}, num_inner_instructions={len(self.inner_instructions)!r})"
@@ -177,11 +180,11 @@ class Block:
     '''
 
     def __init__(self, response: BlockType) -> None:
-        self.block_height = response['block_height']
-        self.block_time = response['block_time']
+        self.block_height = response['blockHeight']
+        self.block_time = response['blockTime']
         self.blockhash = response['blockhash']
-        self.parent_slot = response['parent_slot']
-        self.previous_blockhash = response['previous_blockhash']
+        self.parent_slot = response['parentSlot']
+        self.previous_blockhash = response['previousBlockhash']
         self.transactions = [TransactionElement(
             transaction) for transaction in response['transactions']]
 
@@ -277,6 +280,7 @@ class BlockHashType(TypedDict):
     '''
     blockhash: str
     feeCalculator: FeeCalculatorType
+    lastValidBlockHeight: int
 
 
 class BlockHash:
@@ -286,10 +290,11 @@ class BlockHash:
 
     def __init__(self, response: BlockHashType) -> None:
         self.blockhash = response['blockhash']
+        self.last_valid_block_height = response.get('lastValidBlockHeight', None)
         if "feeCalculator" in response:
             self.fee_calculator = FeeCalculator(response['feeCalculator'])
         else:
             self.fee_calculator = None
 
     def __repr__(self) -> str:
-        return f"BlockHash(blockhash={self.blockhash!r}, fee_calculator={self.fee_calculator!r})"
+        return f"BlockHash(blockhash={self.blockhash!r}, last_valid_block_height={self.last_valid_block_height!r})"
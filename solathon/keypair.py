@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 import json
-import base58
-from typing import List
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+from .core.b58 import b58decode, b58encode
 from .publickey import PublicKey
+from nacl.bindings import crypto_sign_seed_keypair
 from nacl.signing import SigningKey, SignedMessage
 from nacl.public import PrivateKey as NaclPrivateKey
 
+SEED_LENGTH = 32
+# The derivation path of Phantom, Solflare and solana-keygen, for account {index}
+DEFAULT_DERIVATION_PATH = "m/44'/501'/{index}'/0'"
+_HARDENED_OFFSET = 0x80000000
+_SLIP10_ED25519_KEY = b"ed25519 seed"
+
 
 class PrivateKey(PublicKey):
+    __slots__ = ()
+
     LENGTH = 64
 
 
@@ -25,9 +38,9 @@ class Keypair:
                 "nacl.public.PrivateKey object. To initialize with "
                 "private key string, use 'from_private_key' method"
             )
-        verify_key: bytes = bytes(
-                            SigningKey(bytes(self.key_pair)).verify_key
-                            )
+        # Built once, creating a SigningKey derives the public key again
+        self.signing_key = SigningKey(bytes(self.key_pair))
+        verify_key: bytes = bytes(self.signing_key.verify_key)
         self.public_key = PublicKey(verify_key)
         self.private_key = PrivateKey(
             bytes(self.key_pair) + bytes(self.public_key)
@@ -35,12 +48,10 @@ class Keypair:
 
     def sign(self, message: str | bytes) -> SignedMessage:
         if isinstance(message, str):
-            signing_key = SigningKey(bytes(self.key_pair))
-            return signing_key.sign(bytes(message, encoding="utf-8"))
+            return self.signing_key.sign(bytes(message, encoding="utf-8"))
 
         if isinstance(message, bytes):
-            signing_key = SigningKey(bytes(self.key_pair))
-            return signing_key.sign(message)
+            return self.signing_key.sign(message)
 
         raise ValueError(
             "Message argument must be either string or bytes"
@@ -53,7 +64,7 @@ class Keypair:
         elif isinstance(private_key, str):
             private_key = private_key.encode('utf-8')
             try:
-                private_key = base58.b58decode(private_key)
+                private_key = b58decode(private_key)
             except Exception as e:
                 raise ValueError(f"Error decoding private key: {str(e)}")
         
@@ -66,6 +77,200 @@ class Keypair:
             data = json.load(f)
 
         private_key_bytes = bytes(data[:32])
-        private_key = base58.b58encode(private_key_bytes)
+        private_key = b58encode(private_key_bytes)
         keypair = Keypair.from_private_key(private_key)
         return keypair
+
+
+def _derivation_indices(components: List[str]) -> List[int]:
+    indices = []
+    for component in components:
+        # SLIP-0010 only defines hardened derivation for ed25519
+        if not component.endswith(("'", "h")) or not component[:-1].isdigit():
+            raise ValueError(f"Invalid derivation path component {component!r}, ed25519 paths must be hardened")
+        index = int(component[:-1])
+        if index >= _HARDENED_OFFSET:
+            raise ValueError(f"Derivation index {index} is too large")
+        indices.append(index + _HARDENED_OFFSET)
+    return indices
+
+
+def _split_path(path: str) -> List[str]:
+    components = path.split("/")
+    if components[0] != "m":
+        raise ValueError(f"Invalid derivation path {path!r}, it must start with 'm'")
+    return components[1:]
+
+
+def _derive_node(key: bytes, chain_code: bytes, indices: List[int]) -> Tuple[bytes, bytes]:
+    for index in indices:
+        digest = hmac.digest(chain_code, b"\0" + key + index.to_bytes(4, "big"), hashlib.sha512)
+        key, chain_code = digest[:32], digest[32:]
+    return key, chain_code
+
+
+def _master_node(seed: bytes) -> Tuple[bytes, bytes]:
+    digest = hmac.digest(_SLIP10_ED25519_KEY, bytes(seed), hashlib.sha512)
+    return digest[:32], digest[32:]
+
+
+def derive_private_key(seed: bytes, path: str = DEFAULT_DERIVATION_PATH.format(index=0)) -> bytes:
+    """
+    Derives the 32 byte private key seed of an ed25519 path from a wallet seed, as
+    defined by SLIP-0010, for example the 64 byte seed of a BIP39 mnemonic.
+
+    Args:
+        seed (bytes): The wallet seed.
+        path (str, optional): A hardened derivation path. Defaults to m/44'/501'/0'/0'.
+
+    Returns:
+        bytes: The private key seed, to build a Keypair with `Keypair(NaclPrivateKey(seed))`.
+    """
+    key, _ = _derive_node(*_master_node(seed), _derivation_indices(_split_path(path)))
+    return key
+
+
+def _public_keys_chunk(seeds: bytes) -> bytes:
+    return b"".join(
+        crypto_sign_seed_keypair(seeds[i:i + SEED_LENGTH])[0]
+        for i in range(0, len(seeds), SEED_LENGTH)
+    )
+
+
+def _derive_chunk(
+    key: bytes, chain_code: bytes, components: List[str], start: int, stop: int
+) -> Tuple[bytes, bytes]:
+    # Runs in worker processes, from the node shared by every derived key
+    seeds = b"".join(
+        _derive_node(key, chain_code, _derivation_indices([
+            component.format(index=index) for component in components
+        ]))[0]
+        for index in range(start, stop)
+    )
+    return seeds, _public_keys_chunk(seeds)
+
+
+class KeypairBatch:
+    def __init__(self, seeds: bytes, public_keys: bytes):
+        """
+        Many keypairs stored as two contiguous byte strings, the 32 byte private key
+        seeds and the 32 byte public keys. `Keypair` objects are only built on access.
+
+        Args:
+            seeds (bytes): The concatenated private key seeds.
+            public_keys (bytes): The concatenated public keys, in the same order.
+        """
+        if len(seeds) % SEED_LENGTH or len(seeds) != len(public_keys):
+            raise ValueError("Seeds and public keys must be 32 bytes each and of the same count")
+        self.seeds = bytes(seeds)
+        self.public_keys = bytes(public_keys)
+
+    def __len__(self) -> int:
+        return len(self.seeds) // SEED_LENGTH
+
+    def _offset(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("KeypairBatch index out of range")
+        return index * SEED_LENGTH
+
+    def __getitem__(self, index: int) -> Keypair:
+        offset = self._offset(index)
+        return Keypair(NaclPrivateKey(self.seeds[offset:offset + SEED_LENGTH]))
+
+    def __iter__(self) -> Iterator[Keypair]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def public_key(self, index: int) -> PublicKey:
+        """
+        Returns the public key at an index without building the Keypair.
+        """
+        offset = self._offset(index)
+        return PublicKey(self.public_keys[offset:offset + SEED_LENGTH])
+
+    def seed(self, index: int) -> bytes:
+        """
+        Returns the 32 byte private key seed at an index.
+        """
+        offset = self._offset(index)
+        return self.seeds[offset:offset + SEED_LENGTH]
+
+    @staticmethod
+    def _run(function, payloads: List[tuple], max_workers: int | None, use_processes: bool) -> list:
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1 or len(payloads) <= 1:
+            return [function(*payload) for payload in payloads]
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
+            return list(executor.map(function, *zip(*payloads)))
+
+    @classmethod
+    def generate(
+        cls,
+        count: int,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        chunk_size: int = 4096,
+    ) -> KeypairBatch:
+        """
+        Generates new random keypairs, computing their public keys over a pool of workers.
+
+        Args:
+            count (int): Number of keypairs.
+            max_workers (int, optional): Number of workers. Defaults to the number of CPUs.
+            use_processes (bool, optional): Whether to use a process pool rather than a thread pool. Defaults to True.
+            chunk_size (int, optional): Number of keypairs per task. Defaults to 4096.
+
+        Returns:
+            KeypairBatch: The generated keypairs.
+        """
+        seeds = os.urandom(count * SEED_LENGTH)
+        step = chunk_size * SEED_LENGTH
+        payloads = [(seeds[i:i + step],) for i in range(0, len(seeds), step)]
+        public_keys = cls._run(_public_keys_chunk, payloads, max_workers, use_processes)
+        return cls(seeds, b"".join(public_keys))
+
+    @classmethod
+    def derive(
+        cls,
+        seed: bytes,
+        count: int,
+        start: int = 0,
+        path: str = DEFAULT_DERIVATION_PATH,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        chunk_size: int = 4096,
+    ) -> KeypairBatch:
+        """
+        Derives the keypairs of consecutive indexes of a SLIP-0010 ed25519 path from a
+        wallet seed, over a pool of workers. The path is formatted with `index`.
+
+        Args:
+            seed (bytes): The wallet seed, for example the 64 byte seed of a BIP39 mnemonic.
+            count (int): Number of keypairs.
+            start (int, optional): First index. Defaults to 0.
+            path (str, optional): The derivation path template. Defaults to m/44'/501'/{index}'/0'.
+            max_workers (int, optional): Number of workers. Defaults to the number of CPUs.
+            use_processes (bool, optional): Whether to use a process pool rather than a thread pool. Defaults to True.
+            chunk_size (int, optional): Number of keypairs per task. Defaults to 4096.
+
+        Returns:
+            KeypairBatch: The derived keypairs, in index order.
+        """
+        components = _split_path(path)
+        # The node above the first indexed component is derived once
+        shared = next(
+            (i for i, component in enumerate(components) if "{index}" in component), len(components)
+        )
+        key, chain_code = _derive_node(*_master_node(seed), _derivation_indices(components[:shared]))
+        payloads = [
+            (key, chain_code, components[shared:], i, min(i + chunk_size, start + count))
+            for i in range(start, start + count, chunk_size)
+        ]
+        results = cls._run(_derive_chunk, payloads, max_workers, use_processes)
+        return cls(
+            b"".join(seeds for seeds, _ in results),
+            b"".join(public_keys for _, public_keys in results),
+        )
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from base64 import b64decode
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Set, Text
+
+from .client import Client
+from .async_client import AsyncClient
+from .core.b58 import b58encode
+from .core.instructions import advance_nonce_account
+from .core.layouts import NONCE_ACCOUNT_LAYOUT, NONCE_ACCOUNT_LENGTH
+from .core.types import Commitment
+from .keypair import Keypair
+from .publickey import PublicKey
+from .transaction import NonceInformation, Transaction
+from .utils import RPCRequestError, validate_commitment
+
+# getMultipleAccounts accepts at most 100 accounts
+MAX_MULTIPLE_ACCOUNTS = 100
+_INITIALIZED = 1
+
+
+@dataclass
+class NonceAccount:
+    public_key: PublicKey
+    authority: PublicKey
+    nonce: Text
+    lamports_per_signature: int
+
+
+def decode_nonce_account(public_key: PublicKey | Text, data: bytes) -> NonceAccount:
+    """
+    Decodes the data of a nonce account.
+
+    Args:
+        public_key (PublicKey | str): The nonce account.
+        data (bytes): The account data.
+
+    Returns:
+        NonceAccount: The authority, the durable nonce and its fee.
+
+    Raises:
+        ValueError: If the data is not an initialized nonce account.
+    """
+    if len(data) != NONCE_ACCOUNT_LENGTH:
+        raise ValueError(f"{public_key} is not a nonce account")
+    state = NONCE_ACCOUNT_LAYOUT.parse(data)
+    if state.state != _INITIALIZED:
+        raise ValueError(f"Nonce account {public_key} is not initialized")
+    return NonceAccount(
+        public_key=public_key if isinstance(public_key, PublicKey) else PublicKey(public_key),
+        authority=PublicKey(state.authority),
+        nonce=b58encode(state.nonce),
+        lamports_per_signature=state.lamports_per_signature,
+    )
+
+
+def _account_data(account: Any) -> Optional[bytes]:
+    if account is None:
+        return None
+    data = account.data if hasattr(account, "data") else account["data"]
+    return b64decode(data[0])
+
+
+class NoncePool:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        nonce_accounts: Sequence[PublicKey | Text],
+        authority: Keypair | PublicKey,
+        commitment: Optional[Commitment] = None,
+    ):
+        """
+        Hands out durable nonces from a set of nonce accounts, so that batches of
+        transactions can be signed offline and sent later, in parallel, without
+        their blockhash expiring.
+
+        The nonces of all accounts are fetched in bulk with `getMultipleAccounts`,
+        100 accounts per request. Each account is given to one transaction at a time:
+        once that transaction lands the nonce has advanced, so the account is stale
+        until the next `refresh`.
+
+        Args:
+            client (Client | AsyncClient): The client used to fetch the nonce accounts.
+            nonce_accounts (Sequence[PublicKey | str]): The nonce accounts of the pool.
+            authority (Keypair | PublicKey): The nonce authority of every account, which must sign the transactions.
+            commitment (Commitment, optional): The level of commitment desired when fetching nonces.
+        """
+        self.client = client
+        self.authority = authority.public_key if isinstance(authority, Keypair) else authority
+        self.commitment = validate_commitment(commitment) if commitment else None
+        self._accounts: Dict[Text, Optional[NonceAccount]] = {
+            str(account): None for account in nonce_accounts
+        }
+        self._available: Deque[Text] = deque()
+        self._in_use: Set[Text] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def is_async(self) -> bool:
+        return asyncio.iscoroutinefunction(self.client.get_multiple_accounts)
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    @property
+    def available(self) -> int:
+        """
+        Number of accounts whose fetched nonce can be used right away.
+        """
+        return len(self._available)
+
+    def _stale(self) -> List[Text]:
+        with self._lock:
+            available = set(self._available)
+            return [
+                key for key in self._accounts
+                if key not in available and key not in self._in_use
+            ]
+
+    @staticmethod
+    def _chunks(keys: List[Text]) -> List[List[Text]]:
+        return [keys[i:i + MAX_MULTIPLE_ACCOUNTS] for i in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS)]
+
+    def _store(self, keys: List[Text], response) -> List[NonceAccount]:
+        if isinstance(response, dict):
+            if "error" in response:
+                raise RPCRequestError(
+                    f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+                )
+            response = response["result"]["value"]
+        nonce_accounts: List[NonceAccount] = []
+        for key, account in zip(keys, response):
+            data = _account_data(account)
+            if data is None:
+                raise ValueError(f"Nonce account {key} does not exist")
+            nonce_account = decode_nonce_account(key, data)
+            if nonce_account.authority != self.authority:
+                raise ValueError(f"Nonce account {key} is not authorized by {self.authority}")
+            nonce_accounts.append(nonce_account)
+
+        with self._lock:
+            available = set(self._available)
+            for nonce_account in nonce_accounts:
+                key = str(nonce_account.public_key)
+                self._accounts[key] = nonce_account
+                if key not in available and key not in self._in_use:
+                    self._available.append(key)
+        return nonce_accounts
+
+    def refresh(self, accounts: Optional[Iterable[PublicKey | Text]] = None) -> List[NonceAccount]:
+        """
+        Fetches the nonces of stale accounts through a `Client`, which are the accounts
+        never fetched or released after use.
+
+        Args:
+            accounts (Iterable[PublicKey | str], optional): The accounts to fetch instead of the stale ones.
+
+        Returns:
+            List[NonceAccount]: The fetched nonce accounts.
+
+        Raises:
+            ValueError: If an account does not exist, is not an initialized nonce account or has another authority.
+        """
+        if self.is_async:
+            raise TypeError("Use refresh_async with an AsyncClient")
+        keys = [str(account) for account in accounts] if accounts is not None else self._stale()
+        nonce_accounts: List[NonceAccount] = []
+        for chunk in self._chunks(keys):
+            nonce_accounts.extend(
+                self._store(chunk, self.client.get_multiple_accounts(chunk, commitment=self.commitment))
+            )
+        return nonce_accounts
+
+    async def refresh_async(self, accounts: Optional[Iterable[PublicKey | Text]] = None) -> List[NonceAccount]:
+        """
+        Asynchronous counterpart of `refresh`, fetching every chunk of 100 accounts concurrently.
+        """
+        if not self.is_async:
+            return await asyncio.to_thread(self.refresh, accounts)
+        keys = [str(account) for account in accounts] if accounts is not None else self._stale()
+        chunks = self._chunks(keys)
+        responses = await asyncio.gather(*(
+            self.client.get_multiple_accounts(chunk, commitment=self.commitment) for chunk in chunks
+        ))
+        nonce_accounts: List[NonceAccount] = []
+        for chunk, response in zip(chunks, responses):
+            nonce_accounts.extend(self._store(chunk, response))
+        return nonce_accounts
+
+    def acquire(self) -> NonceAccount:
+        """
+        Takes an account with a fetched nonce out of the pool.
+
+        Raises:
+            ValueError: If no account is available, `refresh` fetches the stale ones.
+        """
+        return self._take(1)[0]
+
+    def _take(self, count: int) -> List[NonceAccount]:
+        with self._lock:
+            if len(self._available) < count:
+                raise ValueError(
+                    f"{count} nonce accounts needed, {len(self._available)} available, refresh the pool first"
+                )
+            keys = [self._available.popleft() for _ in range(count)]
+            self._in_use.update(keys)
+            return [self._accounts[key] for key in keys]
+
+    def release(self, nonce_account: NonceAccount | PublicKey | Text, used: bool = True) -> None:
+        """
+        Returns an account to the pool. An account whose transaction was confirmed is
+        stale until refreshed, an unused one can be acquired again right away.
+
+        Args:
+            nonce_account (NonceAccount | PublicKey | str): The account.
+            used (bool, optional): Whether a transaction using the nonce was confirmed. Defaults to True.
+        """
+        if isinstance(nonce_account, NonceAccount):
+            nonce_account = nonce_account.public_key
+        key = str(nonce_account)
+        with self._lock:
+            if key not in self._in_use:
+                return
+            self._in_use.discard(key)
+            if not used:
+                self._available.append(key)
+
+    def nonce_info(self, nonce_account: NonceAccount) -> NonceInformation:
+        """
+        Returns the nonce information of a transaction using the account, which
+        advances the nonce in its first instruction.
+        """
+        return NonceInformation(
+            nonce=nonce_account.nonce,
+            nonce_instruction=advance_nonce_account(nonce_account.public_key, self.authority),
+        )
+
+    def assign(self, transactions: Sequence[Transaction]) -> List[NonceAccount]:
+        """
+        Gives every transaction its own nonce account, so that they can be signed now
+        and sent later in any order or in parallel. Each transaction uses the nonce as
+        recent blockhash and advances it in its first instruction.
+
+        Args:
+            transactions (Sequence[Transaction]): The transactions, which the authority must sign.
+
+        Returns:
+            List[NonceAccount]: The account of each transaction, to `release` once it is sent.
+
+        Raises:
+            ValueError: If fewer accounts are available than transactions, or the authority is not a signer.
+        """
+        for transaction in transactions:
+            if all(pair.public_key != self.authority for pair in transaction.signatures):
+                raise ValueError(f"The nonce authority {self.authority} must sign every transaction")
+        nonce_accounts = self._take(len(transactions))
+        for transaction, nonce_account in zip(transactions, nonce_accounts):
+            transaction.nonce_info = self.nonce_info(nonce_account)
+            transaction.recent_blockhash = nonce_account.nonce
+        return nonce_accounts
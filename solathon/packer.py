@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from .compute_budget import MAX_COMPUTE_UNIT_LIMIT
+from .core.instructions import Instruction, set_compute_unit_limit, set_compute_unit_price
+from .core.message import compiled_instruction_size
+from .keypair import Keypair
+from .publickey import PublicKey
+from .transaction import PACKET_DATA_SIZE, Transaction, transaction_size
+
+# Accounts a transaction can lock, programs included
+MAX_TX_ACCOUNT_LOCKS = 64
+# Compute units used by each compute budget instruction
+COMPUTE_BUDGET_INSTRUCTION_UNITS = 150
+
+_SIGNER = 1
+_WRITABLE = 2
+
+
+def _key_bytes(public_key: PublicKey | str) -> bytes:
+    if isinstance(public_key, PublicKey):
+        return public_key.byte_value
+    return PublicKey(public_key).byte_value
+
+
+class _InstructionShape:
+    __slots__ = ("instruction", "accounts", "size", "compute_units")
+
+    def __init__(self, instruction: Instruction, compute_units: int):
+        self.instruction = instruction
+        # Each account with its signer and writable flags, as compile_transaction merges them
+        accounts: Dict[bytes, int] = {}
+        for meta in instruction.keys:
+            key = _key_bytes(meta.public_key)
+            accounts[key] = accounts.get(key, 0) | (meta.is_signer and _SIGNER) | (meta.is_writable and _WRITABLE)
+        accounts.setdefault(_key_bytes(instruction.program_id), 0)
+        self.accounts = accounts
+        self.size = compiled_instruction_size(len(instruction.keys), len(instruction.data))
+        self.compute_units = compute_units
+
+
+class _OpenTransaction:
+    __slots__ = ("shapes", "accounts", "num_signers", "instructions_size", "compute_units")
+
+    def __init__(self, fee_payer: bytes, prefix: List[_InstructionShape]):
+        self.shapes: List[_InstructionShape] = []
+        self.accounts: Dict[bytes, int] = {fee_payer: _SIGNER | _WRITABLE}
+        self.num_signers = 1
+        self.instructions_size = 0
+        self.compute_units = 0
+        for shape in prefix:
+            self._merge(shape)
+            self.compute_units += shape.compute_units
+
+    def _merge(self, shape: _InstructionShape) -> None:
+        for key, flags in shape.accounts.items():
+            current = self.accounts.get(key)
+            if current is None:
+                self.accounts[key] = flags
+                self.num_signers += flags & _SIGNER
+            else:
+                self.accounts[key] = current | flags
+                self.num_signers += (flags & ~current) & _SIGNER
+        self.instructions_size += shape.size
+
+    def fits(
+        self,
+        shape: _InstructionShape,
+        num_instructions: int,
+        compute_unit_limit: int,
+        max_accounts: int,
+    ) -> bool:
+        if self.compute_units + shape.compute_units > compute_unit_limit:
+            return False
+        num_accounts = len(self.accounts)
+        num_signers = self.num_signers
+        for key, flags in shape.accounts.items():
+            current = self.accounts.get(key)
+            if current is None:
+                num_accounts += 1
+                num_signers += flags & _SIGNER
+            else:
+                num_signers += (flags & ~current) & _SIGNER
+        if num_accounts > max_accounts:
+            return False
+        return transaction_size(
+            num_signers, num_accounts, num_instructions + 1, self.instructions_size + shape.size
+        ) <= PACKET_DATA_SIZE
+
+    def add(self, shape: _InstructionShape) -> None:
+        self._merge(shape)
+        self.shapes.append(shape)
+        self.compute_units += shape.compute_units
+
+
+class InstructionPacker:
+    def __init__(
+        self,
+        signers: Sequence[Keypair | PublicKey],
+        recent_blockhash: str | None = None,
+        compute_units: int | Callable[[Instruction], int] | None = None,
+        compute_unit_limit: int = MAX_COMPUTE_UNIT_LIMIT,
+        compute_unit_price: int | None = None,
+        max_accounts: int = MAX_TX_ACCOUNT_LOCKS,
+        max_open: int = 1,
+    ):
+        """
+        Packs a stream of instructions into as few transactions as fit under the
+        packet size, account and compute limits. Sizes are computed exactly and
+        incrementally from the accounts and data of each instruction, the same way
+        `compile_transaction` dedups accounts, so nothing is serialized.
+
+        With `max_open` set to 1, instructions keep their order and a transaction is
+        emitted as soon as the next instruction does not fit. With more, each
+        instruction goes to the first open transaction it fits in (first fit), which
+        fills transactions better when instruction sizes vary, and the oldest open
+        transaction is emitted when a new one is needed.
+
+        Args:
+            signers (Sequence[Keypair | PublicKey]): The fee payer first, then every other signer the instructions require.
+            recent_blockhash (str, optional): Recent blockhash of the transactions, can also be set later.
+            compute_units (int | Callable[[Instruction], int], optional): Compute units used by an instruction. When set,
+                the compute unit limit of each transaction is set to the sum with `set_compute_unit_limit`.
+            compute_unit_limit (int, optional): Compute units available per transaction. Defaults to 1,400,000.
+            compute_unit_price (int, optional): Adds `set_compute_unit_price` to every transaction when set.
+            max_accounts (int, optional): Accounts per transaction, programs included. Defaults to 64.
+            max_open (int, optional): Transactions kept open for first fit packing. Defaults to 1.
+        """
+        if not signers:
+            raise ValueError("At least the fee payer must be given as a signer")
+        if max_open < 1:
+            raise ValueError("At least one transaction must be kept open")
+        self.signers = list(signers)
+        self.recent_blockhash = recent_blockhash
+        self.compute_unit_limit = compute_unit_limit
+        self.compute_unit_price = compute_unit_price
+        self.max_accounts = max_accounts
+        self.max_open = max_open
+        self._compute_units = compute_units
+        self._signer_keys: Dict[bytes, Keypair | PublicKey] = {}
+        for signer in self.signers:
+            key = signer.public_key if isinstance(signer, Keypair) else signer
+            self._signer_keys.setdefault(_key_bytes(key), signer)
+        self._fee_payer = next(iter(self._signer_keys))
+
+        # Compute budget instructions, their size does not depend on their values
+        prefix: List[Instruction] = []
+        if compute_units is not None:
+            prefix.append(set_compute_unit_limit(0))
+        if compute_unit_price is not None:
+            prefix.append(set_compute_unit_price(compute_unit_price))
+        self._prefix = [
+            _InstructionShape(instruction, COMPUTE_BUDGET_INSTRUCTION_UNITS if compute_units is not None else 0)
+            for instruction in prefix
+        ]
+        self._open: List[_OpenTransaction] = []
+
+    def _shape(self, instruction: Instruction) -> _InstructionShape:
+        compute_units = self._compute_units
+        if callable(compute_units):
+            compute_units = compute_units(instruction)
+        shape = _InstructionShape(instruction, compute_units or 0)
+        for key, flags in shape.accounts.items():
+            if flags & _SIGNER and key not in self._signer_keys:
+                raise ValueError(f"No signer given for {PublicKey(key)}")
+        return shape
+
+    def _fits(self, transaction: _OpenTransaction, shape: _InstructionShape) -> bool:
+        return transaction.fits(
+            shape, len(self._prefix) + len(transaction.shapes), self.compute_unit_limit, self.max_accounts
+        )
+
+    def _build(self, transaction: _OpenTransaction) -> Transaction:
+        instructions: List[Instruction] = []
+        if self._compute_units is not None:
+            instructions.append(set_compute_unit_limit(transaction.compute_units))
+        if self.compute_unit_price is not None:
+            instructions.append(set_compute_unit_price(self.compute_unit_price))
+        instructions.extend(shape.instruction for shape in transaction.shapes)
+        signers = [
+            signer for key, signer in self._signer_keys.items()
+            if transaction.accounts.get(key, 0) & _SIGNER
+        ]
+        return Transaction(
+            instructions=instructions,
+            signers=signers,
+            recent_blockhash=self.recent_blockhash,
+        )
+
+    def add(self, instruction: Instruction) -> List[Transaction]:
+        """
+        Adds an instruction, returning the transactions closed to make room for it.
+
+        Raises:
+            ValueError: If the instruction does not fit in a transaction on its own, or a signer is missing.
+        """
+        shape = self._shape(instruction)
+        for transaction in self._open:
+            if self._fits(transaction, shape):
+                transaction.add(shape)
+                return []
+
+        transaction = _OpenTransaction(self._fee_payer, self._prefix)
+        if not self._fits(transaction, shape):
+            raise ValueError("Instruction does not fit in a transaction on its own")
+        transaction.add(shape)
+        closed: List[Transaction] = []
+        if len(self._open) == self.max_open:
+            closed.append(self._build(self._open.pop(0)))
+        self._open.append(transaction)
+        return closed
+
+    def flush(self) -> List[Transaction]:
+        """
+        Closes and returns every open transaction.
+        """
+        closed = [self._build(transaction) for transaction in self._open]
+        self._open = []
+        return closed
+
+
+def pack_instructions(
+    instructions: Iterable[Instruction],
+    signers: Sequence[Keypair | PublicKey],
+    recent_blockhash: str | None = None,
+    compute_units: int | Callable[[Instruction], int] | None = None,
+    compute_unit_limit: int = MAX_COMPUTE_UNIT_LIMIT,
+    compute_unit_price: int | None = None,
+    max_accounts: int = MAX_TX_ACCOUNT_LOCKS,
+    max_open: int = 1,
+) -> List[Transaction]:
+    """
+    Packs instructions into as few transactions as fit, see `InstructionPacker`.
+
+    Returns:
+        List[Transaction]: The transactions, signed by the fee payer and the signers their instructions need.
+    """
+    packer = InstructionPacker(
+        signers, recent_blockhash, compute_units, compute_unit_limit, compute_unit_price, max_accounts, max_open
+    )
+    transactions: List[Transaction] = []
+    for instruction in instructions:
+        transactions.extend(packer.add(instruction))
+    transactions.extend(packer.flush())
+    return transactions
@@ -1,21 +1,73 @@
 from __future__ import annotations
 
-import base58
-from typing import List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .core.b58 import b58decode, b58encode
+
+MAX_SEED_LENGTH = 32
+MAX_SEEDS = 16
+PDA_MARKER = b"ProgramDerivedAddress"
+PDA_CACHE_SIZE = 65536
+
+# Ed25519 curve parameters, used to tell program derived addresses apart
+_P = 2 ** 255 - 19
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+
+
+def _jacobi(a: int, n: int) -> int:
+    # Binary Jacobi symbol, several times faster than Euler's criterion with pow
+    t = 1
+    while a:
+        twos = (a & -a).bit_length() - 1
+        a >>= twos
+        if twos & 1 and n & 7 in (3, 5):
+            t = -t
+        if a & n & 3 == 3:
+            t = -t
+        a, n = n % a, a
+    return t if n == 1 else 0
+
+
+def is_on_curve(value: bytes) -> bool:
+    """
+    Returns whether 32 bytes decompress to a point on the Ed25519 curve, in which
+    case they can have a private key and are not a valid program derived address.
+    """
+    y = int.from_bytes(value, "little") & ((1 << 255) - 1)
+    y2 = y * y % _P
+    u = (y2 - 1) % _P
+    v = (_D * y2 + 1) % _P
+    # The point exists if x^2 = u / v has a root, that is if u * v is a square
+    return _jacobi(u * v % _P, _P) != -1
+
 
 class PublicKey:
+    __slots__ = ("byte_value", "_base58")
+
     LENGTH = 32
 
     def __init__(self, value: bytes | int | str | List[int] | bytearray):
+        # Base58 string of the key, computed on first use
+        self._base58: str | None = None
         if isinstance(value, str):
             try:
-                self.byte_value = base58.b58decode(value)
+                self.byte_value = b58decode(value)
             except ValueError:
                 raise ValueError("Invalid public key")
+            # Base58 is bijective, the given string is the encoding of the key
+            self._base58 = value.rstrip()
 
         elif isinstance(value, int):
             self.byte_value = bytes([value])
 
+        elif isinstance(value, PublicKey):
+            self.byte_value = value.byte_value
+            self._base58 = value._base58
+
         else:
             self.byte_value = bytes(value)
 
@@ -23,22 +75,166 @@ class PublicKey:
             raise ValueError("Invalid public key, the length must be 32 bytes")
 
     def __bytes__(self) -> bytes:
-        return (
-            self.byte_value
-            if len(self.byte_value) == self.LENGTH
-            else self.byte_value.rjust(self.LENGTH, b"\0")
-        )
+        return self.byte_value
 
     def __repr__(self) -> str:
         return str(self)
 
     def __str__(self) -> str:
-        return self.base58_encode().decode("utf-8")
-    
+        if self._base58 is None:
+            self._base58 = b58encode(self.byte_value)
+        return self._base58
+
     def __eq__(self, __value: object) -> bool:
         if isinstance(__value, PublicKey):
             return self.byte_value == __value.byte_value
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.byte_value)
+
+    def __getstate__(self) -> bytes:
+        return self.byte_value
+
+    def __setstate__(self, state: bytes) -> None:
+        self.byte_value = state
+        self._base58 = None
+
     def base58_encode(self) -> bytes:
-        return base58.b58encode(bytes(self))
\ No newline at end of file
+        return str(self).encode("utf-8")
+
+    def is_on_curve(self) -> bool:
+        return is_on_curve(self.byte_value)
+
+    @staticmethod
+    def create_program_address(seeds: List[bytes], program_id: PublicKey) -> PublicKey:
+        """
+        Derives a program address from seeds, the address must not be on the curve.
+
+        Raises:
+            ValueError: If there are too many seeds, a seed is too long or the derived address is on the curve.
+        """
+        if len(seeds) > MAX_SEEDS:
+            raise ValueError(f"At most {MAX_SEEDS} seeds can be used")
+        hasher = sha256()
+        for seed in seeds:
+            if len(seed) > MAX_SEED_LENGTH:
+                raise ValueError(f"Seeds can be at most {MAX_SEED_LENGTH} bytes long")
+            hasher.update(seed)
+        hasher.update(bytes(program_id))
+        hasher.update(PDA_MARKER)
+        address = hasher.digest()
+        if is_on_curve(address):
+            raise ValueError("Invalid seeds, address must fall off the curve")
+        return PublicKey(address)
+
+    @staticmethod
+    def find_program_address(seeds: List[bytes], program_id: PublicKey) -> Tuple[PublicKey, int]:
+        """
+        Finds a valid program address and its bump seed, trying bumps from 255 down.
+        The most recently derived addresses are cached by seeds and program id.
+
+        Returns:
+            Tuple[PublicKey, int]: The program address and the bump seed.
+        """
+        address, bump = _find_program_address(_seed_key(seeds), bytes(program_id))
+        return PublicKey(address), bump
+
+
+def _seed_key(seeds: Sequence[bytes]) -> Tuple[bytes, ...]:
+    if len(seeds) >= MAX_SEEDS:
+        raise ValueError(f"At most {MAX_SEEDS - 1} seeds can be used along with the bump seed")
+    seeds = tuple(bytes(seed) for seed in seeds)
+    if any(len(seed) > MAX_SEED_LENGTH for seed in seeds):
+        raise ValueError(f"Seeds can be at most {MAX_SEED_LENGTH} bytes long")
+    return seeds
+
+
+@lru_cache(maxsize=PDA_CACHE_SIZE)
+def _find_program_address(seeds: Tuple[bytes, ...], program_id: bytes) -> Tuple[bytes, int]:
+    prefix = b"".join(seeds)
+    suffix = program_id + PDA_MARKER
+    for bump in range(255, -1, -1):
+        address = sha256(prefix + bytes((bump,)) + suffix).digest()
+        if not is_on_curve(address):
+            return address, bump
+    raise ValueError("Unable to find a viable program address bump seed")
+
+
+def _find_program_address_chunk(
+    items: List[Tuple[Tuple[bytes, ...], bytes]]
+) -> List[Tuple[bytes, int]]:
+    return [_find_program_address(seeds, program_id) for seeds, program_id in items]
+
+
+def find_program_addresses(
+    items: Iterable[Tuple[Sequence[bytes], PublicKey | str | bytes]],
+    max_workers: int | None = None,
+    chunk_size: int = 1024,
+) -> List[Tuple[PublicKey, int]]:
+    """
+    Finds the program addresses of many (seeds, program id) pairs, such as the
+    associated token accounts of many owners.
+
+    The bump search is pure Python, so large batches are spread over a process pool.
+    Duplicate pairs are only derived once, and without workers the derivations go
+    through the cache of `PublicKey.find_program_address`.
+
+    Args:
+        items (Iterable[Tuple[Sequence[bytes], PublicKey | str | bytes]]): (seeds, program id) pairs.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of addresses derived per task. Defaults to 1024.
+
+    Returns:
+        List[Tuple[PublicKey, int]]: The program address and bump seed of each pair, in order.
+    """
+    keys = [
+        (_seed_key(seeds), bytes(PublicKey(program_id)) if isinstance(program_id, str) else bytes(program_id))
+        for seeds, program_id in items
+    ]
+    results: Dict[Tuple[Tuple[bytes, ...], bytes], Tuple[PublicKey, int]] = dict.fromkeys(keys)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers > 1 and len(results) > chunk_size:
+        pending = list(results)
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            derived = [result for chunk in executor.map(_find_program_address_chunk, chunks) for result in chunk]
+        for key, (address, bump) in zip(pending, derived):
+            results[key] = (PublicKey(address), bump)
+    else:
+        for key in results:
+            address, bump = _find_program_address(*key)
+            results[key] = (PublicKey(address), bump)
+    return [results[key] for key in keys]
+
+
+class PublicKeyPool:
+    def __init__(self):
+        """
+        Interns public keys so that every distinct key is represented by a single
+        object, for example across all the transactions of parsed blocks.
+        """
+        self._keys: Dict[bytes, PublicKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, value: PublicKey | bytes) -> bool:
+        return bytes(value) in self._keys
+
+    def get(self, value: bytes | memoryview | str | PublicKey) -> PublicKey:
+        """
+        Returns the interned public key for raw bytes, a base58 string or a PublicKey.
+        """
+        if isinstance(value, str):
+            value = PublicKey(value)
+        key = value.byte_value if isinstance(value, PublicKey) else bytes(value)
+        public_key = self._keys.get(key)
+        if public_key is None:
+            public_key = value if isinstance(value, PublicKey) else PublicKey(key)
+            self._keys[key] = public_key
+        return public_key
+
+    def clear(self) -> None:
+        self._keys.clear()
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Text
+
+
+from .async_client import AsyncClient
+from .blockhash_cache import BlockhashCache
+from .confirmation import ConfirmationTracker, TransactionExpiredError
+from .core.b58 import b58encode
+from .core.types import Commitment
+from .transaction import Transaction
+
+SendStatus = Literal["pending", "confirmed", "failed", "expired", "dropped", "error", "duplicate"]
+
+
+@dataclass
+class SendResult:
+    transaction: Transaction
+    signature: Optional[Text] = None
+    status: SendStatus = "pending"
+    error: Any = None
+    attempts: int = 0
+
+
+@dataclass
+class SendReport:
+    results: List[SendResult]
+    elapsed: float
+
+    def count(self, status: SendStatus) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def confirmed(self) -> int:
+        return self.count("confirmed")
+
+    @property
+    def tps(self) -> float:
+        """
+        Confirmed transactions per second over the whole run.
+        """
+        return self.confirmed / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class _Inflight:
+    result: SendResult
+    wire_transaction: bytes
+    future: Future
+    last_sent: float = 0.0
+    # Whether the node answered a submission, only the first answer can reject the transaction
+    submitted: bool = False
+    # Monotonic time after which a transaction that cannot expire by block height is dropped
+    deadline: Optional[float] = None
+
+
+class TransactionSender:
+    def __init__(
+        self,
+        client: AsyncClient,
+        max_concurrency: int = 16,
+        commitment: Commitment = "confirmed",
+        rebroadcast_interval: float = 2.0,
+        blockhash_cache: Optional[BlockhashCache] = None,
+        skip_preflight: bool = True,
+        max_pending_time: float = 90.0,
+    ):
+        """
+        Signs and sends transactions with bounded concurrency, rebroadcasting the
+        ones which are not confirmed yet until their blockhash expires.
+
+        Args:
+            client (AsyncClient): The client used to send and confirm transactions.
+            max_concurrency (int, optional): Maximum number of in-flight `sendTransaction` requests. Defaults to 16.
+            commitment (Commitment, optional): Commitment at which a transaction counts as confirmed. Defaults to "confirmed".
+            rebroadcast_interval (float, optional): Seconds before an unconfirmed transaction is sent again. Defaults to 2.0.
+            blockhash_cache (BlockhashCache, optional): Cache the signing blockhash is taken from. Defaults to
+                `client.blockhash_cache`, or a new cache for the client.
+            skip_preflight (bool, optional): Whether to skip the preflight simulation. Defaults to True.
+            max_pending_time (float, optional): Seconds after which a transaction whose expiry is unknown, one using
+                a durable nonce or a blockhash set by the caller, is reported as dropped. Defaults to 90.0.
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.commitment = commitment
+        self.rebroadcast_interval = rebroadcast_interval
+        self.blockhash_cache = (
+            blockhash_cache
+            or client.blockhash_cache
+            or BlockhashCache(client)
+        )
+        self.skip_preflight = skip_preflight
+        self.max_pending_time = max_pending_time
+
+    async def _broadcast(self, inflight: _Inflight, semaphore: asyncio.Semaphore) -> None:
+        options = {
+            "encoding": "base64",
+            "skipPreflight": self.skip_preflight,
+            "maxRetries": 0,
+        }
+        async with semaphore:
+            inflight.last_sent = time.monotonic()
+            inflight.result.attempts += 1
+            try:
+                response = await self.client.build_and_send_request_async(
+                    "sendTransaction", [inflight.wire_transaction, options]
+                )
+            except Exception:
+                # Transport failures are transient, the transaction stays
+                # pending and is sent again by the rebroadcast loop.
+                return
+
+        if "error" in response and not inflight.submitted:
+            # Only the first answer decides; rebroadcasts of a landed
+            # transaction are rejected as already processed.
+            inflight.result.status = "error"
+            inflight.result.error = response["error"]
+        inflight.submitted = True
+
+    @staticmethod
+    async def _iterate(
+        transactions: Iterable[Transaction] | asyncio.Queue,
+    ) -> AsyncIterator[Transaction]:
+        if isinstance(transactions, asyncio.Queue):
+            while True:
+                transaction = await transactions.get()
+                if transaction is None:
+                    return
+                yield transaction
+        else:
+            for transaction in transactions:
+                yield transaction
+
+    async def _rebroadcast(
+        self,
+        tracker: ConfirmationTracker,
+        inflight: Dict[Text, _Inflight],
+        semaphore: asyncio.Semaphore,
+        producing: asyncio.Event,
+    ) -> None:
+        while producing.is_set() or len(tracker):
+            await asyncio.sleep(tracker.interval)
+            try:
+                await tracker.poll_async()
+                polled = True
+            except Exception as e:
+                tracker.last_error = e
+                polled = False
+
+            # Deadlines are enforced even while polls fail, so `send` always returns
+            now = time.monotonic()
+            for signature, entry in inflight.items():
+                if (
+                    entry.deadline is not None
+                    and now > entry.deadline
+                    and not entry.future.done()
+                    and entry.result.status == "pending"
+                ):
+                    entry.result.status = "dropped"
+                    entry.result.error = f"Not confirmed after {self.max_pending_time} seconds"
+                if entry.result.status in ("dropped", "error"):
+                    tracker.untrack(signature)
+            if not polled:
+                continue
+
+            stale = [
+                entry for entry in inflight.values()
+                if not entry.future.done()
+                and entry.result.status == "pending"
+                and now - entry.last_sent >= self.rebroadcast_interval
+            ]
+            await asyncio.gather(*[self._broadcast(entry, semaphore) for entry in stale])
+
+    async def send(
+        self, transactions: Iterable[Transaction] | asyncio.Queue
+    ) -> SendReport:
+        """
+        Signs, sends and confirms transactions.
+
+        Transactions without a nonce or a blockhash are signed with a shared cached
+        blockhash, and expire with it. Those using a nonce or a blockhash set by the
+        caller are dropped after `max_pending_time` seconds. Transactions producing
+        an already seen signature are reported as duplicates and not sent again.
+
+        Args:
+            transactions (Iterable[Transaction] | asyncio.Queue): The transactions to send. A queue is consumed until
+                `None` is put into it.
+
+        Returns:
+            SendReport: The per-transaction outcomes and aggregate throughput.
+        """
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tracker = ConfirmationTracker(self.client, commitment=self.commitment)
+        inflight: Dict[Text, _Inflight] = {}
+        results: List[SendResult] = []
+        sends: List[asyncio.Task] = []
+
+        producing = asyncio.Event()
+        producing.set()
+        monitor = asyncio.create_task(
+            self._rebroadcast(tracker, inflight, semaphore, producing)
+        )
+
+        try:
+            async for transaction in self._iterate(transactions):
+                result = SendResult(transaction=transaction)
+                results.append(result)
+                try:
+                    last_valid_block_height = None
+                    if not (transaction.nonce_info or transaction.recent_blockhash):
+                        blockhash = await self.blockhash_cache.get_async()
+                        transaction.recent_blockhash = blockhash.blockhash
+                        last_valid_block_height = blockhash.last_valid_block_height
+                    transaction.sign()
+                    wire_transaction = transaction.serialize(verify_signatures=False)
+                except Exception as e:
+                    result.status = "error"
+                    result.error = e
+                    continue
+
+                result.signature = b58encode(transaction.signatures[0].signature)
+                if result.signature in inflight:
+                    result.status = "duplicate"
+                    continue
+
+                entry = _Inflight(
+                    result=result,
+                    wire_transaction=wire_transaction,
+                    future=tracker.track(result.signature, last_valid_block_height),
+                    last_sent=time.monotonic(),
+                    deadline=time.monotonic() + self.max_pending_time
+                    if last_valid_block_height is None else None,
+                )
+                inflight[result.signature] = entry
+                sends.append(asyncio.create_task(self._broadcast(entry, semaphore)))
+
+            await asyncio.gather(*sends)
+        except BaseException:
+            monitor.cancel()
+            raise
+        finally:
+            producing.clear()
+        await monitor
+
+        for entry in inflight.values():
+            result = entry.result
+            if result.status != "pending":
+                continue
+            try:
+                status = entry.future.result()
+            except TransactionExpiredError as e:
+                result.status = "expired"
+                result.error = e
+                continue
+            if status.err is not None:
+                result.status = "failed"
+                result.error = status.err
+            else:
+                result.status = "confirmed"
+
+        return SendReport(results=results, elapsed=time.monotonic() - start)
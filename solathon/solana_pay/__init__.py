@@ -1,7 +1,14 @@
-from .create_transfer import create_transfer
-from .fetch_transaction import fetch_transaction
+from .create_transfer import create_transfer, create_transfer_async
+from .fetch_transaction import (
+    fetch_transaction,
+    fetch_transaction_async,
+    fetch_transactions,
+    fetch_transactions_async,
+    configure_http_pool,
+)
 from .encode_url import encode_url
 from .parse_url import parse_url
-from .validate_transfer import validate_transfer
-from .create_qr import create_qr
-from .find_reference import find_reference
\ No newline at end of file
+from .validate_transfer import validate_transfer, validate_transfer_async, check_transfer, TransferValidator, TransferVerdict
+from .create_qr import create_qr, create_qrs
+from .find_reference import find_reference, find_reference_async
+from .reference_watcher import ReferenceWatcher, ReferenceExpiredError
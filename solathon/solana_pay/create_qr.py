@@ -1,10 +1,113 @@
+import os
+from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO, StringIO
+from typing import Iterable, List, Union
+from xml.sax.saxutils import quoteattr
+
 import qrcode
-from io import BytesIO
 from PIL import Image
 from qrcode.image.styles.moduledrawers.pil import RoundedModuleDrawer
-import os
 
-def create_qr(link: str, size: int = 10, background: str = 'white', color: str = 'black', border: int = 2) -> BytesIO:
+LOGO_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "qr-logo.png")
+LOGO_SIZE_PERCENT = 20
+QR_FORMATS = ("png", "svg", "terminal")
+
+
+@lru_cache(maxsize=1)
+def _logo() -> Image.Image:
+    with Image.open(LOGO_PATH) as logo:
+        logo.load()
+        return logo
+
+
+@lru_cache(maxsize=32)
+def _resized_logo(width: int) -> Image.Image:
+    # The rendered QR only takes a few sizes, so each logo size is resized once
+    logo = _logo()
+    height = int(logo.size[1] * (width / float(logo.size[0])))
+    return logo.resize((width, height))
+
+
+@lru_cache(maxsize=32)
+def _logo_png(width: int) -> str:
+    stream = BytesIO()
+    _resized_logo(width).save(stream, format="PNG")
+    return b64encode(stream.getvalue()).decode()
+
+
+def _make_qr(link: str, size: int, border: int) -> qrcode.QRCode:
+    qr = qrcode.QRCode(
+        box_size=size,
+        border=border,
+    )
+    qr.add_data(link)
+    qr.make(fit=True)
+    return qr
+
+
+def _render_png(qr: qrcode.QRCode, background: str, color: str) -> bytes:
+    img = qr.make_image(fill_color=color, back_color=background,
+                        module_drawer=RoundedModuleDrawer()).convert('RGB')
+
+    logo = _resized_logo(int(img.width * (LOGO_SIZE_PERCENT / 100)))
+    pos = ((img.size[0] - logo.size[0]) // 2,
+           (img.size[1] - logo.size[1]) // 2)
+    img.paste(logo, pos)
+
+    img_bytes_io = BytesIO()
+    img.save(img_bytes_io, format='PNG')
+    return img_bytes_io.getvalue()
+
+
+def _render_svg(qr: qrcode.QRCode, size: int, background: str, color: str) -> bytes:
+    matrix = qr.get_matrix()
+    width = len(matrix) * size
+    # One path for every dark module, which keeps the document small
+    path = "".join(
+        f"M{x * size} {y * size}h{size}v{size}h-{size}z"
+        for y, row in enumerate(matrix)
+        for x, dark in enumerate(row)
+        if dark
+    )
+    logo_width = int(width * (LOGO_SIZE_PERCENT / 100))
+    logo_height = _resized_logo(logo_width).size[1]
+    logo = f"data:image/png;base64,{_logo_png(logo_width)}"
+    # xlink:href for SVG 1.1 renderers, href for SVG 2
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width}" height="{width}" viewBox="0 0 {width} {width}">'
+        f'<rect width="{width}" height="{width}" fill={quoteattr(background)}/>'
+        f'<path d="{path}" fill={quoteattr(color)}/>'
+        f'<image x="{(width - logo_width) // 2}" y="{(width - logo_height) // 2}" '
+        f'width="{logo_width}" height="{logo_height}" xlink:href="{logo}" href="{logo}"/>'
+        '</svg>'
+    ).encode()
+
+
+def _render_terminal(qr: qrcode.QRCode) -> str:
+    out = StringIO()
+    qr.print_ascii(out=out)
+    return out.getvalue()
+
+
+def _render(link: str, size: int, background: str, color: str, border: int, format: str) -> Union[bytes, str]:
+    if format not in QR_FORMATS:
+        raise ValueError(f"Invalid QR format {format!r}, must be one of {QR_FORMATS}")
+    qr = _make_qr(link, size, border)
+    if format == "svg":
+        return _render_svg(qr, size, background, color)
+    if format == "terminal":
+        return _render_terminal(qr)
+    return _render_png(qr, background, color)
+
+
+def _output(rendered: Union[bytes, str]) -> Union[BytesIO, str]:
+    return BytesIO(rendered) if isinstance(rendered, bytes) else rendered
+
+
+def create_qr(link: str, size: int = 10, background: str = 'white', color: str = 'black', border: int = 2, format: str = "png") -> Union[BytesIO, str]:
     """
     Creates a QR code with the given link and returns it as a BytesIO object.
 
@@ -14,39 +117,44 @@ def create_qr(link: str, size: int = 10, background: str = 'white', color: str =
         background (str): The background color of the QR code.
         color (str): The color of the QR code.
         border (int): The border of the QR code.
+        format (str): "png", "svg" or "terminal". Defaults to "png".
 
+    Returns:
+        BytesIO | str: The PNG image or SVG document, or a text rendering to print for "terminal".
+
+    Raises:
+        ValueError: If the format is not supported.
     """
-    qr = qrcode.QRCode(
-        box_size=size,
-        border=border,
-    )
-    qr.add_data(link)
-    qr.make(fit=True)
+    return _output(_render(link, size, background, color, border, format))
 
-    img = qr.make_image(fill_color=color, back_color=background,
-                        module_drawer=RoundedModuleDrawer()).convert('RGB')
 
+def _render_star(args: tuple) -> Union[bytes, str]:
+    return _render(*args)
 
-    script_dir = os.path.dirname(os.path.realpath(__file__))
-    os.chdir(script_dir)
-    logo_path = os.path.join(script_dir, "qr-logo.png")
-    logo = Image.open(logo_path)
-    logo_size_percent = 20
-    logo_width = int(img.width * (logo_size_percent / 100))
 
-    wpercent = (logo_width/float(logo.size[0]))
-    hsize = int((float(logo.size[1])*float(wpercent)))
-    logo = logo.resize((logo_width, hsize))
+def create_qrs(links: Iterable[str], size: int = 10, background: str = 'white', color: str = 'black', border: int = 2, format: str = "png", max_workers: int = None) -> List[Union[BytesIO, str]]:
+    """
+    Creates a QR code for each link, rendering them in a process pool since
+    rendering is CPU bound. With a single worker they are rendered in this process.
 
-    pos = ((img.size[0] - logo.size[0]) // 2,
-           (img.size[1] - logo.size[1]) // 2)
-    img.paste(logo, pos)
+    Args:
+        links (Iterable[str]): The links to be encoded, such as one Solana Pay URL per invoice.
+        size, background, color, border, format: Options of `create_qr`, shared by every QR code.
+        max_workers (int, optional): Processes used for rendering. Defaults to the number of CPUs.
 
-    img_pil = Image.new("RGB", img.size, background)
-    img_pil.paste(img)
+    Returns:
+        List[BytesIO | str]: The QR code of each link, in order.
 
-    img_bytes_io = BytesIO()
-    img_pil.save(img_bytes_io, format='PNG')
-    img_bytes_io.seek(0)
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if format not in QR_FORMATS:
+        raise ValueError(f"Invalid QR format {format!r}, must be one of {QR_FORMATS}")
+    tasks = [(link, size, background, color, border, format) for link in links]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if max_workers <= 1:
+        return [_output(_render_star(task)) for task in tasks]
 
-    return img_bytes_io
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return [_output(rendered) for rendered in executor.map(_render_star, tasks, chunksize=chunksize)]
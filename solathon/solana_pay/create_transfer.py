@@ -1,83 +1,84 @@
+from __future__ import annotations
+
+from solathon.async_client import AsyncClient
+from solathon.blockhash_cache import BlockhashCache
 from solathon.client import Client
-from solathon.core.instructions import AccountMeta, transfer
+from solathon.core.instructions import AccountMeta, memo, transfer
 from solathon.core.layouts import SYSTEM_PROGRAM_ID
 from solathon.core.types import Commitment, RPCResponse
-from solathon.core.types.account_info import AccountInfo, AccountInfoType
-from solathon.core.types.block import BlockHash, BlockHashType
+from solathon.core.types.account_info import AccountInfo
+from solathon.core.types.block import BlockHash
 from solathon.keypair import Keypair
 from solathon.publickey import PublicKey
 from solathon.solana_pay.types import CreateTransferFields
 from solathon.transaction import Transaction
-from solathon.utils import RPCRequestError, sol_to_lamport
-
-from typing import Optional
+from solathon.utils import RPCRequestError, sol_to_lamport, validate_commitment
 
+from typing import Any, Dict, List, Optional
 
-def create_transfer(client: Client,  sender: Keypair, transfer_fields: CreateTransferFields, commitment: Optional[Commitment] = None) -> Transaction:
-    """
-    Creates and returns a Solana Pay transfer transaction.
-
-    Args
-        client (Client) - A connection client to the cluster.
-        sender (Keypair) - Account that will send the transfer.
-        transfer_fields (CreateTransferFields) - Fields of a Solana Pay transfer request URL.
-        commitment (Commitment, optional) - commitment option for `getRecentBlockhash`.
-
-    Raises
-        ValueError - If `recipient` or `amount` is missing from `transfer_fields`.
-
-    :type client: solathon.client.Client
-    :type sender: solathon.publickey.PublicKey
-    :type transfer_fields: solathon.solana_pay.types.CreateTransferFields
-    :type commitment: solathon.core.types.Commitment
-    :rtype: solathon.transaction.Transaction
-    """
-
-    sender_info: AccountInfo = None
-    if client.clean_response == False:
-        raw_sender_info: RPCResponse[AccountInfoType] = client.get_account_info(
-            sender.public_key)
-        if raw_sender_info['result']['value'] == None:
-            raise RPCRequestError(
-                f"Account details not found: {sender.public_key}")
-        sender_info = AccountInfo(raw_sender_info['result']['value'])
-    else:
-        sender_info: AccountInfo = client.get_account_info(sender.public_key)
-
-    if sender_info.owner != str(SYSTEM_PROGRAM_ID):
-        raise ValueError("Invalid sender account")
-    if sender_info.executable:
-        raise ValueError("Sender account is executable")
 
+def _check_fields(transfer_fields: CreateTransferFields) -> None:
     if transfer_fields.get("recipient", None) == None:
         raise ValueError("Recipient is missing from transfer_fields")
-    
+
     if not isinstance(transfer_fields['recipient'], PublicKey):
         raise ValueError(f"Invalid `recipient` type, found {type(transfer_fields['recipient']).__name__} must be of type PublicKey")
 
-    recipient: AccountInfo = None
-    if client.clean_response == False:
-        raw_recipient: RPCResponse[AccountInfoType] = client.get_account_info(
-            transfer_fields['recipient'])
-        if raw_recipient['result']['value'] == None:
-            raise RPCRequestError(
-                f"Account details not found: {transfer_fields['recipient']}")
-        recipient = AccountInfo(raw_recipient['result']['value']['owner'])
-    else:
-        recipient: AccountInfo = client.get_account_info(
-            transfer_fields['recipient'])
-
-    if recipient.owner != str(SYSTEM_PROGRAM_ID):
-        raise ValueError("Invalid recipient account")
-    if recipient.executable:
-        raise ValueError("Recipient account is executable")
-
     if transfer_fields.get("amount", None) == None:
         raise ValueError("Amount is missing from transfer_fields")
 
     if not isinstance(transfer_fields['amount'], float) and not isinstance(transfer_fields['amount'], int):
         raise ValueError(f"Invalid `amount` type, found {type(transfer_fields['amount']).__name__} must be of type float or int")
-    
+
+
+def _transfer_requests(http: Any, sender: Keypair, transfer_fields: CreateTransferFields, commitment: Optional[Commitment], blockhash_cache: Optional[BlockhashCache]) -> List[Dict[str, Any]]:
+    # Both accounts in one getMultipleAccounts, and the blockhash in the same batch unless cached
+    config: Dict[str, Any] = {"encoding": "base64"}
+    if commitment:
+        config["commitment"] = commitment
+    data = [http.build_data(
+        "getMultipleAccounts", [[str(sender.public_key), str(transfer_fields['recipient'])], config]
+    )]
+    if blockhash_cache is None or blockhash_cache.is_stale():
+        blockhash_commitment = blockhash_cache.commitment if blockhash_cache is not None else commitment
+        data.append(http.build_data(
+            "getLatestBlockhash", [{"commitment": blockhash_commitment} if blockhash_commitment else None]
+        ))
+    return data
+
+
+def _result(response: RPCResponse) -> Any:
+    if "error" in response:
+        raise RPCRequestError(
+            f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+        )
+    return response["result"]["value"]
+
+
+def _check_account(account: Optional[Dict[str, Any]], public_key: PublicKey, name: str) -> AccountInfo:
+    if account == None:
+        raise RPCRequestError(f"Account details not found: {public_key}")
+    info = AccountInfo(account)
+    if info.owner != str(SYSTEM_PROGRAM_ID):
+        raise ValueError(f"Invalid {name} account")
+    if info.executable:
+        raise ValueError(f"{name.capitalize()} account is executable")
+    return info
+
+
+def _build_transfer(sender: Keypair, transfer_fields: CreateTransferFields, responses: List[RPCResponse], blockhash_cache: Optional[BlockhashCache]) -> Transaction:
+    # Stored first, a fetched blockhash refreshes the cache even if the transfer is invalid
+    block_hash: Optional[BlockHash] = None
+    if len(responses) > 1:
+        if blockhash_cache is not None:
+            block_hash = blockhash_cache.update(responses[1])
+        else:
+            block_hash = BlockHash(_result(responses[1]))
+
+    sender_account, recipient_account = _result(responses[0])
+    sender_info = _check_account(sender_account, sender.public_key, "sender")
+    _check_account(recipient_account, transfer_fields['recipient'], "recipient")
+
     lamports = sol_to_lamport(transfer_fields['amount'])
 
     if lamports > sender_info.lamports:
@@ -87,33 +88,80 @@ def create_transfer(client: Client,  sender: Keypair, transfer_fields: CreateTra
         from_public_key=sender.public_key, to_public_key=transfer_fields['recipient'], lamports=lamports)
 
     if transfer_fields.get("reference", None) != None:
-        if isinstance(transfer_fields['reference'], list):
-            for ref in transfer_fields['reference']:
-
-                acc_ref = AccountMeta(
-                    public_key=ref,
-                    is_signer=False,
-                    is_writable=False
-                )
-                instruction.keys.append(acc_ref)
-        else:
+        references = transfer_fields['reference']
+        if not isinstance(references, list):
+            references = [references]
+        for ref in references:
             acc_ref = AccountMeta(
-                public_key=transfer_fields['reference'],
+                public_key=ref,
                 is_signer=False,
                 is_writable=False
             )
             instruction.keys.append(acc_ref)
 
-    block_hash: BlockHash = None
-    if client.clean_response == False:
-        raw_block_hash: RPCResponse[BlockHashType] = client.get_latest_blockhash(
-            commitment=commitment)
-        block_hash: BlockHash = BlockHash(raw_block_hash['result']['value'])
-    else:
-        block_hash: BlockHash = client.get_latest_blockhash(
-            commitment=commitment)
+    instructions = [instruction]
+    if transfer_fields.get("memo", None) != None:
+        # The memo goes right before the transfer, where `validate_transfer` looks for it
+        instructions.insert(0, memo(transfer_fields['memo']))
+
+    return Transaction(instructions=instructions, signers=[
+                       sender], fee_payer=sender.public_key, recent_blockhash=block_hash.blockhash if block_hash else None)
+
+
+def create_transfer(client: Client,  sender: Keypair, transfer_fields: CreateTransferFields, commitment: Optional[Commitment] = None, blockhash_cache: Optional[BlockhashCache] = None) -> Transaction:
+    """
+    Creates and returns a Solana Pay transfer transaction.
+
+    The sender and recipient accounts are fetched with a single `getMultipleAccounts`,
+    sent in the same JSON-RPC batch as `getLatestBlockhash` unless the blockhash cache
+    holds a fresh blockhash, so creating a transfer takes one round trip.
 
-    transaction = Transaction(instructions=[instruction], signers=[
-                              sender], fee_payer=sender.public_key, recent_blockhash=block_hash.blockhash)
+    Args
+        client (Client) - A connection client to the cluster.
+        sender (Keypair) - Account that will send the transfer.
+        transfer_fields (CreateTransferFields) - Fields of a Solana Pay transfer request URL.
+        commitment (Commitment, optional) - commitment option for `getMultipleAccounts` and `getLatestBlockhash`.
+        blockhash_cache (BlockhashCache, optional) - cache to take the blockhash from, defaults to `client.blockhash_cache`.
+
+    Raises
+        ValueError - If `recipient` or `amount` is missing from `transfer_fields`.
+        RPCRequestError - If a request fails or an account does not exist.
 
+    :type client: solathon.client.Client
+    :type sender: solathon.publickey.PublicKey
+    :type transfer_fields: solathon.solana_pay.types.CreateTransferFields
+    :type commitment: solathon.core.types.Commitment
+    :type blockhash_cache: solathon.blockhash_cache.BlockhashCache
+    :rtype: solathon.transaction.Transaction
+    """
+    _check_fields(transfer_fields)
+    commitment = validate_commitment(commitment) if commitment else None
+    blockhash_cache = blockhash_cache or client.blockhash_cache
+
+    responses = client.http.send_batch(
+        _transfer_requests(client.http, sender, transfer_fields, commitment, blockhash_cache)
+    )
+    transaction = _build_transfer(sender, transfer_fields, responses, blockhash_cache)
+    if transaction.recent_blockhash is None:
+        transaction.recent_blockhash = blockhash_cache.get().blockhash
+    return transaction
+
+
+async def create_transfer_async(client: AsyncClient,  sender: Keypair, transfer_fields: CreateTransferFields, commitment: Optional[Commitment] = None, blockhash_cache: Optional[BlockhashCache] = None) -> Transaction:
+    """
+    Asynchronous counterpart of `create_transfer` for an `AsyncClient`, also taking one round trip.
+
+    :type client: solathon.async_client.AsyncClient
+    :rtype: solathon.transaction.Transaction
+    """
+    _check_fields(transfer_fields)
+    commitment = validate_commitment(commitment) if commitment else None
+    blockhash_cache = blockhash_cache or client.blockhash_cache
+
+    responses = await client.http.send_batch(
+        _transfer_requests(client.http, sender, transfer_fields, commitment, blockhash_cache)
+    )
+    transaction = _build_transfer(sender, transfer_fields, responses, blockhash_cache)
+    if transaction.recent_blockhash is None:
+        transaction.recent_blockhash = (await blockhash_cache.get_async()).blockhash
     return transaction
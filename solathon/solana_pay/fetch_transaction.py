@@ -1,79 +1,256 @@
+from __future__ import annotations
+
+from solathon.async_client import AsyncClient
 from solathon.client import Client
-from solathon.core.types.block import BlockHash, BlockHashType
+from solathon.core.types.block import BlockHash
 from solathon.publickey import PublicKey
 from solathon.core.types import Commitment, RPCResponse
 from solathon.transaction import Transaction
+from solathon.utils import RPCRequestError, get_verify_key
 
-from typing import Optional
-from nacl.signing import VerifyKey
+import asyncio
+import threading
+from base64 import b64decode
+from binascii import Error as BinasciiError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from nacl.exceptions import BadSignatureError
 import httpx
-import json
 
+HEADERS = {
+    'Accept': 'application/json',
+    'Content-Type': 'application/json'
+}
+# Seconds to wait for a merchant server to answer
+DEFAULT_FETCH_TIMEOUT = 10.0
+
+_http_pool: Optional[httpx.Client] = None
+_http_pool_lock = threading.Lock()
+
+
+def _new_http_pool(max_connections: int, max_keepalive_connections: int, timeout: float) -> httpx.Client:
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+        timeout=timeout,
+    )
+
+
+def configure_http_pool(max_connections: int = 100, max_keepalive_connections: int = 20, timeout: float = DEFAULT_FETCH_TIMEOUT) -> httpx.Client:
+    '''
+    Replaces the connection pool shared by `fetch_transaction` calls that are not
+    given an `http` client. The previous pool is left open, since other threads may
+    still have requests in flight on it, and its connections are released once it
+    is no longer referenced.
+
+    Args:
+        max_connections (int, optional): Connections open at once across all merchant servers.
+        max_keepalive_connections (int, optional): Idle connections kept open for reuse.
+        timeout (float, optional): Default timeout of a request in seconds.
+
+    Returns:
+        httpx.Client: The new shared pool.
+    '''
+    global _http_pool
+    pool = _new_http_pool(max_connections, max_keepalive_connections, timeout)
+    with _http_pool_lock:
+        _http_pool = pool
+    return pool
+
+
+def _shared_http_pool() -> httpx.Client:
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = _new_http_pool(100, 20, DEFAULT_FETCH_TIMEOUT)
+    return _http_pool
+
+
+def _parse_transaction(json_data: Any, account: PublicKey) -> Tuple[Transaction, bool]:
+    # Returns the transaction and whether it needs a new blockhash
+    if not isinstance(json_data, dict) or not json_data.get("transaction"):
+        raise ValueError("Transaction not found")
+
+    # Ensure the transaction is a valid string
+    if not isinstance(json_data['transaction'], str):
+        raise ValueError("Invalid Transaction")
+
+    # Deserialize the base64 wire transaction
+    try:
+        transaction: Transaction = Transaction.from_buffer(
+            b64decode(json_data['transaction'], validate=True))
+    except (BinasciiError, ValueError):
+        raise ValueError("Invalid Transaction")
+
+    if not transaction.signatures:
+        transaction.fee_payer = account
+        return transaction, True
+
+    # A partially signed transaction keeps its fee payer and blockhash, the
+    # signatures of every signer other than `account` must be present and valid
+    if transaction.fee_payer != transaction.signatures[0].public_key:
+        raise ValueError("Invalid Fee payer or Missing Signature")
+    if not transaction.recent_blockhash:
+        raise ValueError("Missing recent blockhash")
+
+    message = transaction._message.serialize()
+    needs_blockhash = False
+    for signature in transaction.signatures:
+        if signature.signature:
+            try:
+                get_verify_key(signature.public_key).verify(message, signature.signature)
+            except BadSignatureError:
+                raise ValueError("Invalid Signature")
+        elif signature.public_key == account:
+            # Only `account` has to sign, so the blockhash can be replaced with a fresh one
+            needs_blockhash = len(transaction.signatures) == 1
+        else:
+            raise ValueError("Missing Signature")
+    return transaction, needs_blockhash
+
+
+def _blockhash(response: RPCResponse | BlockHash) -> str:
+    if isinstance(response, BlockHash):
+        return response.blockhash
+    if "error" in response:
+        raise RPCRequestError(
+            f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+        )
+    return BlockHash(response['result']['value']).blockhash
+
+
+def _request_body(account: PublicKey) -> Dict[str, str]:
+    return {'account': str(account)}
 
-def fetch_transaction(client: Client, account: PublicKey, link: str, commitment: Optional[Commitment] = None) -> Transaction:
+
+def fetch_transaction(client: Client, account: PublicKey, link: str, commitment: Optional[Commitment] = None, http: Optional[httpx.Client] = None, timeout: Optional[float] = None) -> Transaction:
     '''
     Fetches a transaction from a Solana Pay transaction link.
 
+    Connections to merchant servers are reused across calls: from `http` when given,
+    such as `client.http.client` to share the pool of the RPC client, otherwise from
+    a pool shared by the process, see `configure_http_pool`.
+
     Args:
         client (Client): A connection client to the cluster.
         account (PublicKey): Account that may sign the transaction.
         link (str): [Solana Pay Spec](https://github.com/solana-labs/solana-pay/blob/master/SPEC.md#link) link to fetch the transaction from.
-        commitment (Commitment, optional): Commitment option for `getRecentBlockhash`.
+        commitment (Commitment, optional): Commitment option for `getLatestBlockhash`.
+        http (httpx.Client, optional): Client used to reach the link, defaults to the shared pool.
+        timeout (float, optional): Seconds to wait for the merchant server, defaults to the timeout of the pool.
 
     Raises:
-        ValueError: If `transaction` is not found in the response.
+        ValueError: If `transaction` is not found in the response, or is not a valid transaction for `account`.
+        httpx.TimeoutException: If the merchant server does not answer in time.
 
     :type client: solathon.client.Client
     :type account: solathon.publickey.PublicKey
     :type commitment: solathon.core.types.Commitment
     :rtype: solathon.transaction.Transaction
     '''
-    http = httpx.Client()
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
-    
-    # Prepare data for the request
-    data = json.dumps({'account': account.byte_value})
-    
-    # Make the HTTP request
-    response = http.post(url=link, headers=headers, data=data)
-    json_data = response.json()
-
-    # Check if the transaction is found in the response
-    if not json_data.get("transaction"):
-        raise ValueError("Transaction not found")
+    transaction, needs_blockhash = _fetch(account, link, http, timeout)
+    if needs_blockhash:
+        transaction.recent_blockhash = _blockhash(client.get_latest_blockhash(commitment=commitment))
+    return transaction
 
-    # Ensure the transaction is a valid string
-    if not isinstance(json_data['transaction'], str):
-        raise ValueError("Invalid Transaction")
 
-    # Deserialize the transaction from hex
-    transaction: Transaction = Transaction.from_buffer(
-        bytes.fromhex(json_data['transaction']))
+def _fetch(account: PublicKey, link: str, http: Optional[httpx.Client], timeout: Optional[float]) -> Tuple[Transaction, bool]:
+    http = http or _shared_http_pool()
+    options: Dict[str, Any] = {} if timeout is None else {"timeout": timeout}
+    response = http.post(url=link, headers=HEADERS, json=_request_body(account), **options)
+    return _parse_transaction(response.json(), account)
+
+
+def _needs_blockhash(fetched: List[Tuple[Transaction, bool] | Exception]) -> bool:
+    return any(not isinstance(result, Exception) and result[1] for result in fetched)
+
+
+def _with_blockhash(fetched: List[Tuple[Transaction, bool] | Exception], blockhash: Optional[str]) -> List[Transaction | Exception]:
+    # One blockhash is shared by every transaction that needs a fresh one
+    transactions: List[Transaction | Exception] = []
+    for result in fetched:
+        if isinstance(result, Exception):
+            transactions.append(result)
+            continue
+        transaction, needs_blockhash = result
+        if needs_blockhash:
+            transaction.recent_blockhash = blockhash
+        transactions.append(transaction)
+    return transactions
 
-    # Verify transaction signatures
-    for signature in transaction.signatures:
-        if not signature.signature:
-            raise ValueError("Missing Signature")
 
-        # Verify the signature using nacl library
-        public_key = VerifyKey(signature.public_key)
+def fetch_transactions(client: Client, account: PublicKey, links: Sequence[str], commitment: Optional[Commitment] = None, http: Optional[httpx.Client] = None, timeout: Optional[float] = None, max_workers: int = 8, return_exceptions: bool = False) -> List[Transaction | Exception]:
+    '''
+    Fetches the transactions of many transaction links concurrently, in a thread pool
+    sharing one connection pool. Transactions that need a fresh blockhash share a
+    single `getLatestBlockhash` request.
+
+    Args:
+        links (Sequence[str]): The transaction links.
+        max_workers (int, optional): Links fetched at once. Defaults to 8.
+        return_exceptions (bool, optional): Whether a failed link gives its exception in the results instead
+            of raising it, as `asyncio.gather` does. Defaults to False.
+
+    The other arguments are those of `fetch_transaction`.
+
+    Returns:
+        List[Transaction | Exception]: The transaction of each link, in order.
+    '''
+    http = http or _shared_http_pool()
+
+    def fetch(link: str):
         try:
-            public_key.verify(signature.signature)
-        except BadSignatureError:
-            raise ValueError("Invalid Signature")
-
-    # Additional transaction checks
-    if len(transaction.signatures) == 1 and transaction.signatures[0].public_key == account:
-        if not transaction.recent_blockhash:
-            # Fetch recent blockhash if missing
-            raw_blockhash: RPCResponse[BlockHashType] = client.get_latest_blockhas(commitment=commitment)
-            transaction.recent_blockhash = BlockHash(raw_blockhash['result']['value']).blockhash
-    if not transaction.signatures:
-        fee_payer = account
-    elif fee_payer not in transaction.signatures:
-         raise ValueError("Invalid Fee payer or Missing Signature")
+            return _fetch(account, link, http, timeout)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(links)))) as executor:
+        fetched = list(executor.map(fetch, links))
+
+    if _needs_blockhash(fetched):
+        return _with_blockhash(fetched, _blockhash(client.get_latest_blockhash(commitment=commitment)))
+    return _with_blockhash(fetched, None)
+
+
+async def _fetch_async(account: PublicKey, link: str, http: httpx.AsyncClient, timeout: Optional[float]) -> Tuple[Transaction, bool]:
+    # The pool of the RPC client has the 5 seconds default of httpx, merchant servers get as long as with `fetch_transaction`
+    timeout = DEFAULT_FETCH_TIMEOUT if timeout is None else timeout
+    response = await http.post(url=link, headers=HEADERS, json=_request_body(account), timeout=timeout)
+    return _parse_transaction(response.json(), account)
+
+
+async def fetch_transaction_async(client: AsyncClient, account: PublicKey, link: str, commitment: Optional[Commitment] = None, http: Optional[httpx.AsyncClient] = None, timeout: Optional[float] = None) -> Transaction:
+    '''
+    Asynchronous counterpart of `fetch_transaction` for an `AsyncClient`.
+
+    Args:
+        http (httpx.AsyncClient, optional): Client used to reach the link, defaults to the connection pool of `client`.
+        timeout (float, optional): Seconds to wait for the merchant server, defaults to `DEFAULT_FETCH_TIMEOUT`.
+
+    :type client: solathon.async_client.AsyncClient
+    :rtype: solathon.transaction.Transaction
+    '''
+    transaction, needs_blockhash = await _fetch_async(account, link, http or client.http.client, timeout)
+    if needs_blockhash:
+        transaction.recent_blockhash = _blockhash(await client.get_latest_blockhash(commitment=commitment))
     return transaction
+
+
+async def fetch_transactions_async(client: AsyncClient, account: PublicKey, links: Sequence[str], commitment: Optional[Commitment] = None, http: Optional[httpx.AsyncClient] = None, timeout: Optional[float] = None, max_concurrency: int = 8, return_exceptions: bool = False) -> List[Transaction | Exception]:
+    '''
+    Asynchronous counterpart of `fetch_transactions`, fetching up to `max_concurrency` links at once.
+    '''
+    http = http or client.http.client
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(link: str):
+        async with semaphore:
+            return await _fetch_async(account, link, http, timeout)
+
+    fetched = await asyncio.gather(*(fetch(link) for link in links), return_exceptions=return_exceptions)
+
+    if _needs_blockhash(fetched):
+        return _with_blockhash(fetched, _blockhash(await client.get_latest_blockhash(commitment=commitment)))
+    return _with_blockhash(fetched, None)
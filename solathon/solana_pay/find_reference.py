@@ -1,7 +1,26 @@
 from typing import List
-from ..core.types import TransactionSignature
+from ..core.types import RPCResponse, TransactionSignature
+from ..async_client import AsyncClient
 from ..client import Client
 from ..publickey import PublicKey
+from ..utils import RPCRequestError
+
+
+def _oldest(signatures: List[TransactionSignature]) -> TransactionSignature:
+    if len(signatures) == 0:
+        raise ValueError("Reference not found")
+
+    oldest = signatures[-1]
+    return oldest
+
+
+def _signatures(response: RPCResponse) -> List[TransactionSignature]:
+    if "error" in response:
+        raise RPCRequestError(
+            f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+        )
+    return [TransactionSignature(signature) for signature in response['result']]
+
 
 def find_reference(client: Client, reference: PublicKey) -> TransactionSignature:
     '''
@@ -21,14 +40,18 @@ def find_reference(client: Client, reference: PublicKey) -> TransactionSignature
 
     signatures: List[TransactionSignature] = []
     if client.clean_response == False:
-        raw_signatures = client.get_signatures_for_address(str(reference))
-        signatures = [TransactionSignature(signature)
-                      for signature in raw_signatures]
+        signatures = _signatures(client.get_signatures_for_address(str(reference)))
     else:
         signatures = client.get_signatures_for_address(str(reference))
 
-    if len(signatures) == 0:
-        raise ValueError("Reference not found")
+    return _oldest(signatures)
 
-    oldest = signatures[-1]
-    return oldest
+
+async def find_reference_async(client: AsyncClient, reference: PublicKey) -> TransactionSignature:
+    '''
+    Asynchronous counterpart of `find_reference` for an `AsyncClient`.
+
+    :type client: solathon.async_client.AsyncClient
+    :rtype: solathon.core.types.TransactionSignature
+    '''
+    return _oldest(_signatures(await client.get_signatures_for_address(str(reference))))
@@ -0,0 +1,503 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Text, Tuple
+
+from ..client import Client
+from ..async_client import AsyncClient
+from ..core.types import Commitment, RPCResponse, TransactionSignature
+from ..publickey import PublicKey
+from ..utils import RPCRequestError, validate_commitment
+
+try:
+    # Optional, only needed by the websocket mode, https://pypi.org/project/websockets
+    import websockets
+except ImportError:
+    websockets = None
+
+# getSignaturesForAddress returns at most 1000 signatures per request
+MAX_SIGNATURES_PER_REQUEST = 1000
+
+
+class ReferenceExpiredError(Exception):
+    def __init__(self, reference: Text, timeout: float):
+        self.reference = reference
+        self.timeout = timeout
+        self.message = f"No transaction found for reference {reference} within {timeout} seconds"
+        super().__init__(self.message)
+
+
+@dataclass
+class WatchedReference:
+    reference: Text
+    future: Future
+    until: Optional[Text]
+    interval: float
+    next_poll: float
+    expires_at: Optional[float] = None
+    timeout: Optional[float] = None
+    # Set while paging back through more signatures than fit in one request
+    before: Optional[Text] = None
+    oldest: Optional[TransactionSignature] = None
+
+
+class ReferenceWatcher:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        commitment: Commitment = "confirmed",
+        min_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        batch_size: int = 100,
+        page_limit: int = MAX_SIGNATURES_PER_REQUEST,
+    ):
+        """
+        Watches many Solana Pay references at once and resolves, for each, the oldest
+        signature of a transaction referencing it, as `find_reference` does for one.
+
+        Each reference is polled on its own schedule, every `min_interval` seconds at
+        first and `backoff` times slower after every empty poll, up to `max_interval`,
+        so that new checkouts are found fast while old ones cost few requests. The
+        `getSignaturesForAddress` requests of all references due are sent together in
+        JSON-RPC batches of `batch_size`. When a reference has more signatures than
+        fit in a page, the next pages are requested with `before` right away.
+
+        Use `poll`, `wait` and `start` with a `Client`, and `poll_async`, `wait_async`
+        and `run_async` with an `AsyncClient`.
+
+        Args:
+            client (Client | AsyncClient): The client used to poll the cluster.
+            commitment (Commitment, optional): Commitment of the signatures searched. Defaults to "confirmed".
+            min_interval (float, optional): Delay between the first polls of a reference in seconds. Defaults to 0.5.
+            max_interval (float, optional): Longest delay between polls of a reference in seconds. Defaults to 10.0.
+            backoff (float, optional): Growth factor of the delay after every empty poll. Defaults to 1.5.
+            batch_size (int, optional): Requests per JSON-RPC batch. Defaults to 100.
+            page_limit (int, optional): Signatures requested per reference and page, up to 1000. Defaults to 1000.
+        """
+        if not 1 <= page_limit <= MAX_SIGNATURES_PER_REQUEST:
+            raise ValueError(f"page_limit must be between 1 and {MAX_SIGNATURES_PER_REQUEST}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.client = client
+        self.commitment = validate_commitment(commitment)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.page_limit = page_limit
+        self.last_error: Optional[Exception] = None
+
+        self._pending: Dict[Text, WatchedReference] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        self._async_wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def watch(
+        self,
+        reference: PublicKey | Text,
+        callback: Optional[Callable[[TransactionSignature], Any]] = None,
+        until: Optional[Text] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Starts watching a reference.
+
+        Args:
+            reference (PublicKey | str): The reference account of the payment.
+            callback (Callable[[TransactionSignature], Any], optional): Called with the signature once found.
+            until (str, optional): Signature the search stops at, such as the newest one seen before the
+                checkout was created, so older transactions are neither fetched nor matched.
+            timeout (float, optional): Seconds after which the future fails with `ReferenceExpiredError`.
+
+        Returns:
+            Future: Resolved with the oldest `TransactionSignature` referencing the account.
+        """
+        key = str(reference)
+        with self._lock:
+            if key in self._pending:
+                future = self._pending[key].future
+            else:
+                future = Future()
+                now = time.monotonic()
+                self._pending[key] = WatchedReference(
+                    reference=key,
+                    future=future,
+                    until=until,
+                    interval=self.min_interval,
+                    next_poll=now,
+                    expires_at=None if timeout is None else now + timeout,
+                    timeout=timeout,
+                )
+        if callback is not None:
+            future.add_done_callback(
+                lambda done: callback(done.result())
+                if not done.cancelled() and done.exception() is None else None
+            )
+        self._wake_up()
+        return future
+
+    def watch_many(
+        self,
+        references: Iterable[PublicKey | Text],
+        callback: Optional[Callable[[TransactionSignature], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Future]:
+        """
+        Starts watching many references.
+
+        Returns:
+            List[Future]: One future per reference, in the same order.
+        """
+        return [self.watch(reference, callback, timeout=timeout) for reference in references]
+
+    def unwatch(self, reference: PublicKey | Text) -> None:
+        """
+        Stops watching a reference and cancels its future.
+        """
+        with self._lock:
+            entry = self._pending.pop(str(reference), None)
+        if entry is not None:
+            entry.future.cancel()
+
+    def notify(self, reference: PublicKey | Text) -> None:
+        """
+        Makes a reference due right away, for example when a websocket reports a
+        transaction mentioning it.
+        """
+        with self._lock:
+            entry = self._pending.get(str(reference))
+            if entry is None:
+                return
+            entry.next_poll = 0.0
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        self._wake.set()
+        if self._async_wake is not None and self._loop is not None:
+            # asyncio.Event is not thread safe, it is set from the loop it belongs to
+            try:
+                self._loop.call_soon_threadsafe(self._async_wake.set)
+            except RuntimeError:
+                # The loop is closed, nothing is waiting for the event anymore
+                pass
+
+    def _due(self, force: bool) -> List[WatchedReference]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                entry for entry in self._pending.values()
+                if force or entry.next_poll <= now
+            ]
+
+    def next_poll_in(self) -> float:
+        """
+        Returns the number of seconds until a reference is due, at most `max_interval`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            next_poll = min((entry.next_poll for entry in self._pending.values()), default=now + self.max_interval)
+        return min(max(next_poll - now, 0.0), self.max_interval)
+
+    def _params(self, entry: WatchedReference) -> List[Any]:
+        options: Dict[str, Any] = {"limit": self.page_limit, "commitment": self.commitment}
+        if entry.until is not None:
+            options["until"] = entry.until
+        if entry.before is not None:
+            options["before"] = entry.before
+        return [entry.reference, options]
+
+    def _resolve(self, entry: WatchedReference, signature: TransactionSignature) -> None:
+        with self._lock:
+            self._pending.pop(entry.reference, None)
+        if not entry.future.done():
+            entry.future.set_result(signature)
+
+    def _reschedule(self, entry: WatchedReference, now: float) -> int:
+        if entry.expires_at is not None and now >= entry.expires_at:
+            with self._lock:
+                self._pending.pop(entry.reference, None)
+            if not entry.future.done():
+                entry.future.set_exception(ReferenceExpiredError(entry.reference, entry.timeout))
+            return 1
+        entry.next_poll = now + entry.interval
+        entry.interval = min(entry.interval * self.backoff, self.max_interval)
+        return 0
+
+    def _settle(
+        self, entries: List[WatchedReference], responses: List[RPCResponse]
+    ) -> Tuple[int, List[WatchedReference]]:
+        # Returns the number of references resolved and those with another page to fetch
+        now = time.monotonic()
+        resolved = 0
+        paging: List[WatchedReference] = []
+        for entry, response in zip(entries, responses):
+            if entry.future.done():
+                continue
+            if "error" in response:
+                self.last_error = RPCRequestError(
+                    f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+                )
+                if entry.oldest is not None:
+                    # A failed page past a match still resolves with the oldest signature found
+                    self._resolve(entry, entry.oldest)
+                    resolved += 1
+                else:
+                    resolved += self._reschedule(entry, now)
+                continue
+
+            signatures = response["result"]
+            if signatures:
+                entry.oldest = TransactionSignature(signatures[-1])
+                if len(signatures) == self.page_limit:
+                    entry.before = entry.oldest.signature
+                    paging.append(entry)
+                    continue
+            if entry.oldest is not None:
+                self._resolve(entry, entry.oldest)
+                resolved += 1
+            else:
+                resolved += self._reschedule(entry, now)
+        return resolved, paging
+
+    @staticmethod
+    def _chunks(entries: List[WatchedReference], size: int) -> List[List[WatchedReference]]:
+        return [entries[i:i + size] for i in range(0, len(entries), size)]
+
+    def poll(self, force: bool = False) -> int:
+        """
+        Polls every reference due once, in JSON-RPC batches.
+
+        Args:
+            force (bool, optional): Whether to poll every reference, due or not. Defaults to False.
+
+        Returns:
+            int: The number of references resolved or expired by this poll.
+        """
+        entries = self._due(force)
+        resolved = 0
+        while entries:
+            paging: List[WatchedReference] = []
+            for chunk in self._chunks(entries, self.batch_size):
+                responses = self.client.build_and_send_batch_request(
+                    "getSignaturesForAddress", [self._params(entry) for entry in chunk]
+                )
+                chunk_resolved, chunk_paging = self._settle(chunk, responses)
+                resolved += chunk_resolved
+                paging.extend(chunk_paging)
+            entries = paging
+        return resolved
+
+    async def poll_async(self, force: bool = False) -> int:
+        """
+        Polls every reference due once through an `AsyncClient`, requesting all
+        batches concurrently.
+
+        Returns:
+            int: The number of references resolved or expired by this poll.
+        """
+        entries = self._due(force)
+        resolved = 0
+        while entries:
+            chunks = self._chunks(entries, self.batch_size)
+            responses = await asyncio.gather(*[
+                self.client.build_and_send_batch_request_async(
+                    "getSignaturesForAddress", [self._params(entry) for entry in chunk]
+                )
+                for chunk in chunks
+            ])
+            entries = []
+            for chunk, chunk_responses in zip(chunks, responses):
+                chunk_resolved, chunk_paging = self._settle(chunk, chunk_responses)
+                resolved += chunk_resolved
+                entries.extend(chunk_paging)
+        return resolved
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Polls until every watched reference is resolved or expired.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if nothing is left pending.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            self.poll()
+            if not self._pending:
+                break
+            delay = self.next_poll_in()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+        return True
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Asynchronous counterpart of `wait`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            await self.poll_async()
+            if not self._pending:
+                break
+            delay = self.next_poll_in()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self._pending:
+                try:
+                    self.poll()
+                except Exception as e:
+                    self.last_error = e
+            self._wake.wait(self.next_poll_in())
+            self._wake.clear()
+
+    def start(self) -> None:
+        """
+        Starts polling on a background daemon thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="solathon-reference-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, cancel_pending: bool = False) -> None:
+        """
+        Stops the background thread.
+
+        Args:
+            cancel_pending (bool, optional): Whether to cancel the futures still pending. Defaults to False.
+        """
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if cancel_pending:
+            with self._lock:
+                entries = list(self._pending.values())
+                self._pending.clear()
+            for entry in entries:
+                entry.future.cancel()
+
+    async def _poll_forever(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        while True:
+            if self._pending:
+                try:
+                    await self.poll_async()
+                except Exception as e:
+                    self.last_error = e
+            try:
+                await asyncio.wait_for(self._async_wake.wait(), self.next_poll_in())
+            except asyncio.TimeoutError:
+                pass
+            self._async_wake.clear()
+
+    def _handle_message(
+        self, message: Dict[str, Any], requests: Dict[int, Text], subscriptions: Dict[int, Text]
+    ) -> None:
+        if "id" in message and "result" in message and message["id"] in requests:
+            subscriptions[message["result"]] = requests.pop(message["id"])
+        elif "id" in message and "error" in message and message["id"] in requests:
+            # Forgetting the failed request makes the next loop subscribe again
+            reference = requests.pop(message["id"])
+            self.last_error = RPCRequestError(
+                f"Failed to subscribe to {reference}. Error {message['error'].get('code')}: {message['error'].get('message')}"
+            )
+        elif message.get("method") == "logsNotification":
+            reference = subscriptions.get(message["params"]["subscription"])
+            if reference is not None:
+                self.notify(reference)
+
+    async def _listen(self, websocket_endpoint: Text) -> None:
+        request_id = 0
+        async with websockets.connect(websocket_endpoint) as connection:
+            requests: Dict[int, Text] = {}
+            subscriptions: Dict[int, Text] = {}
+            while True:
+                with self._lock:
+                    pending = set(self._pending)
+                subscribed = set(requests.values()) | set(subscriptions.values())
+                for reference in pending - subscribed:
+                    request_id += 1
+                    requests[request_id] = reference
+                    await connection.send(json.dumps({
+                        "jsonrpc": "2.0", "id": request_id, "method": "logsSubscribe",
+                        "params": [{"mentions": [reference]}, {"commitment": self.commitment}],
+                    }))
+                for subscription, reference in list(subscriptions.items()):
+                    if reference not in pending:
+                        del subscriptions[subscription]
+                        request_id += 1
+                        await connection.send(json.dumps({
+                            "jsonrpc": "2.0", "id": request_id, "method": "logsUnsubscribe",
+                            "params": [subscription],
+                        }))
+                try:
+                    message = await asyncio.wait_for(connection.recv(), self.min_interval)
+                except asyncio.TimeoutError:
+                    continue
+                self._handle_message(json.loads(message), requests, subscriptions)
+
+    async def _listen_forever(self, websocket_endpoint: Text) -> None:
+        while True:
+            try:
+                await self._listen(websocket_endpoint)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Polling goes on at its own pace while the websocket reconnects
+                self.last_error = e
+                await asyncio.sleep(self.max_interval)
+
+    async def run_async(self, websocket_endpoint: Optional[Text] = None) -> None:
+        """
+        Polls references as they become due until cancelled.
+
+        With a websocket endpoint, every watched reference is also subscribed to with
+        `logsSubscribe`, and polled right away when a transaction mentions it instead
+        of at its next scheduled poll. Most RPC nodes limit the subscriptions per
+        connection, so this suits hundreds rather than thousands of references.
+
+        Args:
+            websocket_endpoint (str, optional): The websocket endpoint, such as "wss://api.devnet.solana.com".
+
+        Raises:
+            ImportError: If a websocket endpoint is given and the websockets package is not installed.
+        """
+        if websocket_endpoint is None:
+            await self._poll_forever()
+            return
+        if websockets is None:
+            raise ImportError("The websocket mode requires the websockets package: pip install websockets")
+        await asyncio.gather(self._poll_forever(), self._listen_forever(websocket_endpoint))
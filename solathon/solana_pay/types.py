@@ -11,12 +11,13 @@ class CreateTransferFields(TypedDict):
         recipient (PublicKey) - Account that will receive the transfer.
         amount (float) - Amount to be transferred in Sol.
         reference (List[PublicKey], optional) - List of accounts to be referenced in the transfer.
+        memo (str, optional) - Memo expected in the instruction before the transfer, checked by validation.
     """
 
     recipient: PublicKey
     amount: float
     reference: Optional[Union[List[PublicKey], PublicKey]]
-    # memo: Optional[str]
+    memo: Optional[str]
 
 
 @dataclass
@@ -1,11 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from solathon.async_client import AsyncClient
 from solathon.client import Client
-from solathon.core.types import Commitment
+from solathon.core.layouts import MEMO_PROGRAM_ID, SYSTEM_PROGRAM_ID
+from solathon.core.message import instruction_data
+from solathon.core.system_program import Transfer, _block_account_keys, decode_system_instruction_accounts
+from solathon.core.types import Commitment, RPCResponse
 from solathon.core.types.block import TransactionElement
+from solathon.publickey import PublicKey
 from solathon.solana_pay.types import CreateTransferFields
-from solathon.transaction import Transaction
-from solathon.utils import LAMPORT_PER_SOL
+from solathon.utils import RPCRequestError, sol_to_lamport, validate_commitment
+
+from typing import List, Optional, Sequence, Text, Tuple
+
+
+def _account_key(keys: List[PublicKey], index: int) -> PublicKey:
+    try:
+        return keys[index]
+    except IndexError:
+        raise ValueError(f"Invalid account index {index}")
+
+
+def check_transfer(response: TransactionElement, transfer_fields: CreateTransferFields) -> None:
+    '''
+    Checks that a fetched transaction contains a valid Solana Pay transfer: a system
+    transfer to the recipient as last instruction, followed by the references in its
+    accounts, a balance change of at least the amount in lamports, and the memo in
+    the instruction before it.
+
+    Args
+        response (TransactionElement) - The transaction, as returned by `get_transaction`.
+        transfer_fields (CreateTransferFields) - Fields of a Solana Pay transfer request URL.
+
+    Raises
+        ValueError - If the transaction is not a valid transfer for `transfer_fields`.
+    '''
+    if transfer_fields.get("recipient", None) == None:
+        raise ValueError("Recipient is missing from transfer_fields")
+    if transfer_fields.get("amount", None) == None:
+        raise ValueError("Amount is missing from transfer_fields")
+
+    if not response.meta:
+        raise ValueError("Transaction meta not found")
+    if response.meta.err:
+        raise ValueError(f"Meta failed with error: {response.meta.err}")
+
+    keys = _block_account_keys(response.transaction.message, response.meta.loaded_addresses)
+    instructions = response.transaction.message.instructions
+    if not instructions:
+        raise ValueError("Instruction not found")
+
+    instruction = instructions[-1]
+    if _account_key(keys, instruction.program_id_index) != SYSTEM_PROGRAM_ID:
+        raise ValueError("Last instruction is not a system program instruction")
+    accounts = [_account_key(keys, index) for index in instruction.accounts]
+    decoded = decode_system_instruction_accounts(instruction_data(instruction), accounts)
+    if not isinstance(decoded, Transfer):
+        raise ValueError("Last instruction is not a transfer")
+
+    recipient = str(transfer_fields['recipient'])
+    if str(decoded.to_public_key) != recipient:
+        raise ValueError("Recipient not found in transaction")
+
+    references = transfer_fields.get("reference", None)
+    if references != None:
+        if not isinstance(references, list):
+            references = [references]
+        extra_keys = accounts[2:]
+        if len(extra_keys) != len(references):
+            raise ValueError("Invalid number of references")
+        for index, reference in enumerate(references):
+            if str(extra_keys[index]) != str(reference):
+                raise ValueError(f"Invalid reference {index}")
+
+    # Balances are compared in lamports, as sent by `create_transfer`
+    acc_index = accounts.index(decoded.to_public_key)
+    acc_index = instruction.accounts[acc_index]
+    try:
+        received = response.meta.post_balances[acc_index] - response.meta.pre_balances[acc_index]
+    except IndexError:
+        raise ValueError("Recipient balance not found in transaction meta")
+    if received < sol_to_lamport(transfer_fields['amount']):
+        raise ValueError("Amount not transferred to recipient")
 
-from typing import Optional
+    memo = transfer_fields.get("memo", None)
+    if memo != None:
+        if len(instructions) < 2:
+            raise ValueError("Missing memo instruction")
+        memo_instruction = instructions[-2]
+        if _account_key(keys, memo_instruction.program_id_index) != MEMO_PROGRAM_ID:
+            raise ValueError("Missing memo instruction")
+        if memo_instruction.accounts:
+            raise ValueError("Invalid memo keys")
+        if instruction_data(memo_instruction) != memo.encode("utf-8"):
+            raise ValueError("Invalid memo")
 
 
 def validate_transfer(client: Client, signature: str, transfer_fields: CreateTransferFields, commitment: Optional[Commitment] = None) -> TransactionElement:
@@ -16,10 +109,10 @@ def validate_transfer(client: Client, signature: str, transfer_fields: CreateTra
         client (Client) - A connection client to the cluster.
         signature (str) - Signature of the transaction to validate.
         transfer_fields (CreateTransferFields) - Fields of a Solana Pay transfer request URL.
-        commitment (Commitment, optional) - commitment option for `getRecentBlockhash`.
+        commitment (Commitment, optional) - commitment option for `getTransaction`.
 
     Raises
-        ValueError - If `recipient` or `amount` is missing from `transfer_fields`.
+        ValueError - If the transaction is not found or not a valid transfer, see `check_transfer`.
 
     :type client: solathon.client.Client
     :type transfer_fields: solathon.solana_pay.types.CreateTransferFields
@@ -28,59 +121,201 @@ def validate_transfer(client: Client, signature: str, transfer_fields: CreateTra
     '''
     response: TransactionElement = None
     if client.clean_response == False:
-        raw_response = client.get_transaction(signature, commitment)
-        response = TransactionElement(raw_response)
+        raw_response = client.get_transaction(signature, commitment=commitment)
+        if raw_response.get('result', None) == None:
+            raise ValueError("Transaction not found")
+        response = TransactionElement(raw_response['result'])
     else:
-        response = client.get_transaction(signature, commitment)
+        response = client.get_transaction(signature, commitment=commitment)
 
     if not response:
         raise ValueError("Transaction not found")
 
-    message = response.transaction.message
-    signatures = response.transaction.signatures
+    check_transfer(response, transfer_fields)
+    return response
 
-    if not response.meta:
-        raise ValueError("Transaction meta not found")
 
-    if response.meta.err:
-        raise ValueError(f"Meta failed with error: {response.meta.err}")
+async def validate_transfer_async(client: AsyncClient, signature: str, transfer_fields: CreateTransferFields, commitment: Optional[Commitment] = None) -> TransactionElement:
+    '''
+    Asynchronous counterpart of `validate_transfer` for an `AsyncClient`.
 
-    transaction: Transaction = Transaction.populate(message, signatures)
-    instructions = transaction.instructions[:]
-    instruction = instructions.pop()
-    if not instruction:
-        raise ValueError("Instruction not found")
+    :type client: solathon.async_client.AsyncClient
+    :rtype: solathon.core.types.block.TransactionElement
+    '''
+    raw_response = await client.get_transaction(signature, commitment=commitment)
+    if "error" in raw_response:
+        raise RPCRequestError(
+            f"Failed to fetch data from RPC endpoint. Error {raw_response['error']['code']}: {raw_response['error']['message']}"
+        )
+    if raw_response.get('result', None) == None:
+        raise ValueError("Transaction not found")
+    response = TransactionElement(raw_response['result'])
 
-    if transfer_fields.get("recipient", None) == None:
-        raise ValueError("Recipient is missing from transfer_fields")
+    check_transfer(response, transfer_fields)
+    return response
 
-    try:
-        acc_index = message.account_keys.index(transfer_fields['recipient'])
-    except ValueError:
-        raise ValueError("Recipient not found in transaction")
 
-    if transfer_fields.get("references", None) != None:
-        _from, _to, *extra_keys = instruction.keys
-        if len(extra_keys) != len(transfer_fields['references']):
-            raise ValueError("Invalid number of references")
+@dataclass
+class TransferVerdict:
+    signature: Text
+    valid: bool
+    error: Optional[Text] = None
+    transaction: Optional[TransactionElement] = None
 
-        for index, reference in enumerate(transfer_fields['references']):
-            if str(extra_keys[index].public_key) != str(reference):
-                raise ValueError(f"Invalid reference {index}")
 
-    pre_balance = response.meta.pre_balances[acc_index] / LAMPORT_PER_SOL
-    post_balance = response.meta.post_balances[acc_index] / LAMPORT_PER_SOL
+class TransferValidator:
+    def __init__(
+        self,
+        client: Client | AsyncClient,
+        commitment: Commitment = "finalized",
+        batch_size: int = 100,
+        cache_size: int = 10000,
+    ):
+        '''
+        Validates many Solana Pay transfers at once. The transactions are fetched in
+        JSON-RPC batches of `batch_size`, all batches concurrently with an `AsyncClient`,
+        and checked with `check_transfer`.
 
-    if (post_balance - pre_balance + 0.0000005001) < transfer_fields['amount']:
-        raise ValueError("Amount not transferred to recipient")
+        Finalized transactions cannot change, so when fetched at the "finalized"
+        commitment they are kept in a cache of `cache_size` transactions, and validating
+        the same payment again costs no request.
 
-    # if transfer_fields.get("memo", None) != None:
-    #     instruction = instructions.pop()
-    #     if not instruction:
-    #         raise ValueError("Missing memo instruction")
-    #     if len(instruction.keys):
-    #         raise ValueError("Invalid memo keys")
-    #     if instruction.data.decode('utf-8') != transfer_fields['memo']:
-    #         raise ValueError("Invalid memo")
+        Args
+            client (Client | AsyncClient) - A connection client to the cluster.
+            commitment (Commitment, optional) - commitment option for `getTransaction`, defaults to "finalized".
+            batch_size (int, optional) - transactions fetched per JSON-RPC batch, defaults to 100.
+            cache_size (int, optional) - finalized transactions kept in memory, defaults to 10000.
+        '''
+        self.client = client
+        self.commitment = validate_commitment(commitment)
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Text, TransactionElement] = OrderedDict()
+        self._lock = threading.Lock()
 
-    return response
+    @property
+    def caches_results(self) -> bool:
+        return self.commitment in ("finalized", "root", "max") and self.cache_size > 0
+
+    def _cached(self, signature: Text) -> Optional[TransactionElement]:
+        with self._lock:
+            response = self._cache.get(signature)
+            if response is not None:
+                self._cache.move_to_end(signature)
+            return response
+
+    def _store(self, signature: Text, response: TransactionElement) -> None:
+        if not self.caches_results:
+            return
+        with self._lock:
+            self._cache[signature] = response
+            self._cache.move_to_end(signature)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _params(self, signature: Text) -> List:
+        return [signature, {
+            "encoding": "json",
+            "commitment": self.commitment,
+            "maxSupportedTransactionVersion": 0,
+        }]
+
+    @staticmethod
+    def _verdict(
+        signature: Text, response: Optional[TransactionElement], transfer_fields: CreateTransferFields
+    ) -> TransferVerdict:
+        try:
+            if response is None:
+                raise ValueError("Transaction not found")
+            check_transfer(response, transfer_fields)
+        except ValueError as e:
+            return TransferVerdict(signature, False, str(e), response)
+        return TransferVerdict(signature, True, None, response)
+
+    def _parse(self, signature: Text, response: RPCResponse) -> Optional[TransactionElement]:
+        if "error" in response:
+            raise RPCRequestError(
+                f"Failed to fetch data from RPC endpoint. Error {response['error']['code']}: {response['error']['message']}"
+            )
+        if response.get("result") is None:
+            return None
+        transaction = TransactionElement(response["result"])
+        self._store(signature, transaction)
+        return transaction
+
+    def _missing(self, payments: Sequence[Tuple[Text, CreateTransferFields]]) -> Tuple[dict, List[Text]]:
+        found = {}
+        missing: List[Text] = []
+        for signature, _ in payments:
+            if signature in found or signature in missing:
+                continue
+            cached = self._cached(signature)
+            if cached is not None:
+                found[signature] = cached
+            else:
+                missing.append(signature)
+        return found, missing
+
+    def _settle(
+        self,
+        payments: Sequence[Tuple[Text, CreateTransferFields]],
+        found: dict,
+        errors: dict,
+    ) -> List[TransferVerdict]:
+        verdicts: List[TransferVerdict] = []
+        for signature, transfer_fields in payments:
+            if signature in errors:
+                verdicts.append(TransferVerdict(signature, False, errors[signature]))
+            else:
+                verdicts.append(self._verdict(signature, found.get(signature), transfer_fields))
+        return verdicts
+
+    def _collect(self, found: dict, errors: dict, signatures: List[Text], responses: List[RPCResponse]) -> None:
+        for signature, response in zip(signatures, responses):
+            try:
+                found[signature] = self._parse(signature, response)
+            except RPCRequestError as e:
+                errors[signature] = e.message
+
+    def validate_many(self, payments: Sequence[Tuple[Text, CreateTransferFields]]) -> List[TransferVerdict]:
+        '''
+        Validates payments through a `Client`.
+
+        Args
+            payments (Sequence[Tuple[str, CreateTransferFields]]) - The signature and expected fields of each payment.
+
+        Returns
+            List[TransferVerdict] - One verdict per payment, in order. Failed requests give invalid verdicts with the error.
+        '''
+        found, missing = self._missing(payments)
+        errors: dict = {}
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start:start + self.batch_size]
+            responses = self.client.build_and_send_batch_request(
+                "getTransaction", [self._params(signature) for signature in chunk]
+            )
+            self._collect(found, errors, chunk, responses)
+        return self._settle(payments, found, errors)
+
+    async def validate_many_async(
+        self, payments: Sequence[Tuple[Text, CreateTransferFields]]
+    ) -> List[TransferVerdict]:
+        '''
+        Asynchronous counterpart of `validate_many` for an `AsyncClient`, requesting all batches concurrently.
+        '''
+        found, missing = self._missing(payments)
+        chunks = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        responses = await asyncio.gather(*[
+            self.client.build_and_send_batch_request_async(
+                "getTransaction", [self._params(signature) for signature in chunk]
+            )
+            for chunk in chunks
+        ])
+        errors: dict = {}
+        for chunk, chunk_responses in zip(chunks, responses):
+            self._collect(found, errors, chunk, chunk_responses)
+        return self._settle(payments, found, errors)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
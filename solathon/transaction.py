@@ -1,23 +1,100 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict
-from base58 import b58decode, b58encode
+from base64 import b64decode
+from typing import TYPE_CHECKING, Iterable, List, Dict, Literal, Sequence, Tuple
 from .keypair import Keypair
-from .publickey import PublicKey
-from nacl.signing import VerifyKey
+from .publickey import PublicKey, PublicKeyPool
+from nacl.signing import SigningKey
 from nacl.exceptions import BadSignatureError
+from .core.b58 import b58decode
 from .core.instructions import Instruction, AccountMeta
+from .utils import get_verify_key, verify_many
 from .core.message import (
     Message,
+    MessageV0,
     MessageHeader,
+    MessageAddressTableLookup,
     CompiledInstruction,
     encode_length,
-    decode_length
+    encoded_length_size,
+    decode_length_at,
+    decode_message_at,
+    instruction_data
 )
 
+if TYPE_CHECKING:
+    from .address_lookup_table import AddressLookupTableAccount
+
 PACKET_DATA_SIZE = 1232
-DEFAULT_SIGNATURE = bytes([0] * 64)
+SIGNATURE_LENGTH = 64
+DEFAULT_SIGNATURE = bytes([0] * SIGNATURE_LENGTH)
+# Stands in for the recent blockhash of a transaction simulated with replaceRecentBlockhash
+PLACEHOLDER_BLOCKHASH = "11111111111111111111111111111111"
+# Signatures are raw bytes in the wire format and base58 strings in JSON RPC responses
+SignatureEncoding = Literal["base58", "raw"]
+
+
+def transaction_size(
+    num_signers: int,
+    num_accounts: int,
+    num_instructions: int,
+    instructions_size: int,
+    address_table_lookups_size: int | None = None,
+) -> int:
+    """
+    Returns the exact wire size of a transaction from the counts of its message.
+
+    Args:
+        num_signers (int): Number of signatures.
+        num_accounts (int): Number of account keys listed in the message, programs included.
+        num_instructions (int): Number of instructions.
+        instructions_size (int): Total size of the compiled instructions.
+        address_table_lookups_size (int, optional): Size of the address table lookups of a
+            version 0 message, lookup count included. None for a legacy message.
+    """
+    return (
+        encoded_length_size(num_signers) + num_signers * SIGNATURE_LENGTH
+        # Message header and recent blockhash
+        + 3 + 32
+        + encoded_length_size(num_accounts) + num_accounts * 32
+        + encoded_length_size(num_instructions) + instructions_size
+        # Version prefix and lookups
+        + (0 if address_table_lookups_size is None else 1 + address_table_lookups_size)
+    )
+
+
+def _key_bytes(public_key: PublicKey | str) -> bytes:
+    if isinstance(public_key, PublicKey):
+        return public_key.byte_value
+    return PublicKey(public_key).byte_value
+
+
+def _to_public_key(public_key: PublicKey | str) -> PublicKey:
+    if isinstance(public_key, PublicKey):
+        return public_key
+    return PublicKey(public_key)
+
+
+def _decode_signature(signature: bytes | str, encoding: SignatureEncoding) -> bytes | None:
+    if encoding == "base58":
+        signature = b58decode(signature)
+    elif encoding == "raw":
+        signature = bytes(signature)
+        if len(signature) != SIGNATURE_LENGTH:
+            raise ValueError(f"Raw signatures must be {SIGNATURE_LENGTH} bytes long")
+    else:
+        raise ValueError(f"Unsupported signature encoding: {encoding}")
+    return None if signature == DEFAULT_SIGNATURE else signature
+
+
+@dataclass
+class NonceInformation:
+    # The durable nonce used as recent blockhash, and the instruction advancing it
+    nonce: str
+    nonce_instruction: Instruction
 
 
 @dataclass
@@ -34,6 +111,9 @@ class Transaction:
         self.signers: list[PublicKey] | list[Keypair] = config.get("signers")
         self.instructions: list[Instruction] = []
         self.signatures: list[PKSigPair] = config.get("signatures", [])
+        # Compiles a version 0 message loading accounts from these tables when set
+        self.address_lookup_tables: list[AddressLookupTableAccount] | None = config.get(
+            "address_lookup_tables")
         if "instructions" in config:
             instructions: Instruction = config.get("instructions")
             if (
@@ -75,7 +155,10 @@ class Transaction:
                 "nonceInstruction": self.nonce_info.nonce_instruction._to_json()
             } if self.nonce_info else None,
             "instructions": [instruction._to_json() for instruction in self.instructions],
-            "signers": [signature.public_key.base58_encode() for signature in self.signatures]
+            "signers": [signature.public_key.base58_encode() for signature in self.signatures],
+            "addressLookupTables": [
+                table.key.base58_encode() for table in self.address_lookup_tables
+            ] if self.address_lookup_tables is not None else None
         }
     
     def compile_transaction(self) -> bytes:
@@ -83,10 +166,14 @@ class Transaction:
         if self._message and self._to_json() == self.json:
             return self._message.serialize()
 
+        instructions: List[Instruction] = self.instructions
         if self.nonce_info:
             self.recent_blockhash = self.nonce_info.nonce
+            # A durable nonce transaction must advance the nonce first
+            if not instructions or instructions[0] != self.nonce_info.nonce_instruction:
+                instructions = [self.nonce_info.nonce_instruction, *instructions]
 
-        if not self.instructions:
+        if not instructions:
             raise AttributeError("No instructions provided.")
 
         if not self.recent_blockhash:
@@ -98,99 +185,113 @@ class Transaction:
         if not self.fee_payer:
             self.fee_payer = self.signatures[0].public_key
 
-        account_metas: List[AccountMeta] = []
-        program_ids: List[str] = []
+        # Every account is keyed by its raw 32 byte key. The first signature
+        # pays the fees, signers are always writable.
+        public_keys: Dict[bytes, PublicKey] = {}
+        is_signer: Dict[bytes, bool] = {}
+        is_writable: Dict[bytes, bool] = {}
 
-        for instruction in self.instructions:
+        for sig in self.signatures:
+            key = _key_bytes(sig.public_key)
+            if key not in public_keys:
+                public_keys[key] = _to_public_key(sig.public_key)
+                is_writable[key] = True
+            is_signer[key] = True
+
+        # Instruction accounts grouped as signer-writable, signer-readonly,
+        # writable and readonly, followed by the (readonly) program ids.
+        groups: List[List[Tuple[bytes, AccountMeta]]] = [[], [], [], []]
+        instruction_keys: List[List[bytes]] = []
+        program_keys: List[bytes] = []
+        for instruction in instructions:
             if not instruction.program_id:
                 raise AttributeError(
                     "Invalid instruction (no program ID found): ",
                     instruction
                 )
-            account_metas.extend(instruction.keys)
-            if str(instruction.program_id) not in program_ids:
-                program_ids.append(str(instruction.program_id))
-
-        for program_id in program_ids:
-            account_metas.append(AccountMeta(
-                public_key=PublicKey(program_id),
-                is_signer=False,
-                is_writable=False
-            ))
-
-        account_metas.sort(key=lambda account: (
-            not account.is_signer, not account.is_writable))
-
-        fee_payer_idx = 0
-        seen: Dict[str, int] = {}
-        uniq_metas: List[AccountMeta] = []
-
-        for sig in self.signatures:
-            public_key = str(sig.public_key)
-            if public_key in seen:
-                uniq_metas[seen[public_key]].is_signer = True
-            else:
-                uniq_metas.append(AccountMeta(sig.public_key, True, True))
-                seen[public_key] = len(uniq_metas) - 1
-                if sig.public_key == self.fee_payer:
-                    fee_payer_idx = min(fee_payer_idx, seen[public_key])
-
-        for a_m in account_metas:
-            public_key = str(a_m.public_key)
-            if public_key in seen:
-                idx = seen[public_key]
-                uniq_metas[idx].is_writable = uniq_metas[idx].is_writable or a_m.is_writable
-            else:
-                uniq_metas.append(a_m)
-                seen[public_key] = len(uniq_metas) - 1
-                if a_m.public_key == self.fee_payer:
-                    fee_payer_idx = min(fee_payer_idx, seen[public_key])
-
-        if fee_payer_idx == 1:
-            uniq_metas = [AccountMeta(self.fee_payer, True, True)] + uniq_metas
-        else:
-            uniq_metas = (
-                [uniq_metas[fee_payer_idx]] + uniq_metas[:fee_payer_idx] +
-                uniq_metas[fee_payer_idx + 1:]
-            )
-
-        signed_keys: List[str] = []
-        unsigned_keys: List[str] = []
-        num_required_signatures = num_readonly_signed_accounts = num_readonly_unsigned_accounts = 0
-        for a_m in uniq_metas:
-            if a_m.is_signer:
-                signed_keys.append(str(a_m.public_key))
-                num_required_signatures += 1
-                num_readonly_signed_accounts += int(not a_m.is_writable)
-            else:
-                num_readonly_unsigned_accounts += int(not a_m.is_writable)
-                unsigned_keys.append(str(a_m.public_key))
-        if not self.signatures:
-            self.signatures = [PKSigPair(public_key=PublicKey(
-                key), signature=None) for key in signed_keys]
+            keys: List[bytes] = []
+            for a_m in instruction.keys:
+                key = _key_bytes(a_m.public_key)
+                keys.append(key)
+                groups[(not a_m.is_signer) * 2 + (not a_m.is_writable)].append((key, a_m))
+            instruction_keys.append(keys)
+            program_keys.append(_key_bytes(instruction.program_id))
+
+        for group in groups:
+            for key, a_m in group:
+                if key in public_keys:
+                    is_writable[key] = is_writable[key] or a_m.is_writable
+                else:
+                    public_keys[key] = _to_public_key(a_m.public_key)
+                    is_signer[key] = a_m.is_signer
+                    is_writable[key] = a_m.is_writable
+
+        for instruction, key in zip(instructions, program_keys):
+            if key not in public_keys:
+                public_keys[key] = _to_public_key(instruction.program_id)
+                is_signer[key] = False
+                is_writable[key] = False
+
+        # Non signer accounts which are not invoked as programs can be loaded
+        # from lookup tables instead of being listed in the message
+        lookups: List[MessageAddressTableLookup] = []
+        loaded_writable: List[bytes] = []
+        loaded_readonly: List[bytes] = []
+        if self.address_lookup_tables is not None:
+            invoked = set(program_keys)
+            for table in self.address_lookup_tables:
+                table_indices: Dict[bytes, int] = {}
+                for index, address in enumerate(table.addresses):
+                    table_indices.setdefault(_key_bytes(address), index)
+                writable_indexes: List[int] = []
+                readonly_indexes: List[int] = []
+                for key in [key for key in public_keys if key in table_indices]:
+                    if is_signer[key] or key in invoked:
+                        continue
+                    if is_writable[key]:
+                        writable_indexes.append(table_indices[key])
+                        loaded_writable.append(key)
+                    else:
+                        readonly_indexes.append(table_indices[key])
+                        loaded_readonly.append(key)
+                    del public_keys[key]
+                if writable_indexes or readonly_indexes:
+                    lookups.append(MessageAddressTableLookup(
+                        account_key=_to_public_key(table.key),
+                        writable_indexes=bytes(writable_indexes),
+                        readonly_indexes=bytes(readonly_indexes),
+                    ))
+
+        ordered: List[List[bytes]] = [[], [], [], []]
+        for key in public_keys:
+            ordered[(not is_signer[key]) * 2 + (not is_writable[key])].append(key)
+        signed_writable, signed_readonly, unsigned_writable, unsigned_readonly = ordered
+        account_keys: List[bytes] = (
+            signed_writable + signed_readonly + unsigned_writable + unsigned_readonly
+        )
 
-        account_keys: List[str] = signed_keys + unsigned_keys
-        account_indices: Dict[str, int] = {
-            str(key): i for i, key in enumerate(account_keys)}
+        account_indices: Dict[bytes, int] = {
+            key: i for i, key in enumerate(account_keys + loaded_writable + loaded_readonly)}
         compiled_instructions: List[CompiledInstruction] = [
-            CompiledInstruction(
-                accounts=[account_indices[str(a_m.public_key)]
-                          for a_m in instr.keys],
-                program_id_index=account_indices[str(instr.program_id)],
-                data=b58encode(instr.data),
-            )
-            for instr in self.instructions
+            CompiledInstruction._make((
+                bytes([account_indices[key] for key in keys]),
+                account_indices[program_key],
+                bytes(instr.data),
+            ))
+            for instr, keys, program_key in zip(
+                instructions, instruction_keys, program_keys)
         ]
-        message: Message = Message(
-            MessageHeader(
-                num_required_signatures=num_required_signatures,
-                num_readonly_signed_accounts=num_readonly_signed_accounts,
-                num_readonly_unsigned_accounts=num_readonly_unsigned_accounts,
-            ),
-            account_keys,
-            compiled_instructions,
-            self.recent_blockhash,
+        header = MessageHeader(
+            num_required_signatures=len(signed_writable) + len(signed_readonly),
+            num_readonly_signed_accounts=len(signed_readonly),
+            num_readonly_unsigned_accounts=len(unsigned_readonly),
         )
+        static_keys = [public_keys[key] for key in account_keys]
+        if self.address_lookup_tables is not None:
+            message: Message = MessageV0(
+                header, static_keys, compiled_instructions, self.recent_blockhash, lookups)
+        else:
+            message = Message(header, static_keys, compiled_instructions, self.recent_blockhash)
         serialized_message: bytes = message.serialize()
         return serialized_message
 
@@ -225,18 +326,25 @@ class Transaction:
             if not sig_pair.signature:
                 return False
             try:
-                VerifyKey(bytes(sig_pair.public_key)).verify(
+                get_verify_key(sig_pair.public_key).verify(
                     signed_data, sig_pair.signature)
             except BadSignatureError:
                 return False
         return True
 
-    def serialize(self) -> bytes:
+    def serialize(self, verify_signatures: bool = True) -> bytes:
+        """
+        Serializes the signed transaction into the wire format.
+
+        Args:
+            verify_signatures (bool, optional): Whether to verify the signatures first. Can be turned off
+                right after `sign`, whose signatures are valid. Defaults to True.
+        """
         if not self.signatures:
             raise AttributeError("Transaction has not been signed.")
 
         sign_data: bytes = self.compile_transaction()
-        if not self.verify_signatures(sign_data):
+        if verify_signatures and not self.verify_signatures(sign_data):
             raise AttributeError("Transaction has not been signed correctly.")
 
         if len(self.signatures) >= 64 * 4:
@@ -275,30 +383,57 @@ class Transaction:
             self.instructions.append(instr)
 
     @classmethod
-    def populate(self, message: Message, signatures: List[bytes], signers: List[Keypair]) -> Transaction:
-        decoded_signatures = list(map(lambda x: PKSigPair(
-            public_key=message.account_keys[x[0]],
-            signature=None if x[1] == b58encode(
-                DEFAULT_SIGNATURE) else b58decode(x[1])
-        ), enumerate(signatures)))
+    def populate(
+        self,
+        message: Message,
+        signatures: List[bytes | str],
+        signers: List[Keypair] | None = None,
+        address_lookup_tables: List[AddressLookupTableAccount] | None = None,
+        signature_encoding: SignatureEncoding = "base58",
+    ) -> Transaction:
+        """
+        Builds a transaction from a decoded message and its signatures.
+
+        Args:
+            message (Message): The message, legacy or version 0.
+            signatures (List[bytes | str]): One signature per required signer, in order.
+            signers (List[Keypair], optional): Signers attached to the transaction.
+            address_lookup_tables (List[AddressLookupTableAccount], optional): Tables looked up by a version 0 message.
+            signature_encoding (SignatureEncoding, optional): "base58" for signatures as returned by JSON RPC,
+                "raw" for the 64 bytes of the wire format. Defaults to "base58".
+
+        Raises:
+            ValueError: If a signature is not valid for `signature_encoding`.
+        """
+        account_keys: List[PublicKey] = message.account_keys
+        if isinstance(message, MessageV0):
+            account_keys = message.resolve_account_keys(address_lookup_tables or [])
+
+        decoded_signatures = [
+            PKSigPair(
+                public_key=account_keys[index],
+                signature=_decode_signature(signature, signature_encoding),
+            ) for index, signature in enumerate(signatures)
+        ]
+        signature_keys = {pair.public_key for pair in decoded_signatures}
 
         instructions: List[Instruction] = []
         for instruction in message.instructions:
 
             acc_metas: List[AccountMeta] = []
             for account in instruction.accounts:
-                pubkey = message.account_keys[account]
+                pubkey = account_keys[account]
                 acc_metas.append(AccountMeta(
                     public_key=pubkey,
-                    is_signer=message.is_account_signer(account) or pubkey in [
-                        x.public_key for x in decoded_signatures],
+                    is_signer=message.is_account_signer(account)
+                    or pubkey in signature_keys,
                     is_writable=message.is_account_writable(account)
                 ))
 
             instructions.append(Instruction(
-                program_id=message.account_keys[instruction.program_id_index],
+                program_id=account_keys[instruction.program_id_index],
                 keys=acc_metas,
-                data=b58decode(instruction.data)
+                data=instruction_data(instruction)
             ))
 
         fee_payer = message.account_keys[0] if message.header.num_required_signatures > 0 else None
@@ -307,26 +442,199 @@ class Transaction:
             recent_blockhash=message.recent_blockhash,
             signatures=decoded_signatures,
             instructions=instructions,
-            signers = signers
+            signers=signers or [],
+            address_lookup_tables=(address_lookup_tables or [])
+            if isinstance(message, MessageV0) else None
         )
         transaction._message = message
         transaction.json = transaction._to_json()
         return transaction
 
     @classmethod
-    def from_buffer(self, buffer: bytes, signers: List[Keypair]) -> Transaction:
+    def from_buffer(
+        self,
+        buffer: bytes,
+        signers: List[Keypair] | None = None,
+        address_lookup_tables: List[AddressLookupTableAccount] | None = None,
+        key_pool: PublicKeyPool | None = None,
+    ) -> Transaction:
         # Reference: https://github.com/solana-labs/solana-web3.js/blob/a1fafee/packages/library-legacy/src/transaction/legacy.ts#L878
-        if not isinstance(buffer, bytes):
+        if not isinstance(buffer, (bytes, bytearray, memoryview)):
             raise TypeError("Buffer must be a bytes object.")
 
-        buffer_array: List[int] = list(buffer)
-        signature_length = decode_length(buffer_array)
+        view = memoryview(buffer)
+        signature_length, offset = decode_length_at(view, 0)
 
         signatures: List[bytes] = []
         for _ in range(signature_length):
-            signature = bytes(buffer_array[:64])
-            buffer_array = buffer_array[64:]
-            signatures.append(b58encode(signature))
-
-        message: Message = Message.from_buffer(bytes(buffer_array))
-        return Transaction.populate(message, signatures, signers)
+            end = offset + SIGNATURE_LENGTH
+            signatures.append(view[offset:end].tobytes())
+            offset = end
+        if offset > len(view):
+            raise ValueError("Buffer is too short to contain the signatures")
+
+        message, offset = decode_message_at(view, offset, key_pool)
+        if offset != len(view):
+            raise ValueError("Unexpected trailing bytes after the message")
+        return Transaction.populate(message, signatures, signers, address_lookup_tables, signature_encoding="raw")
+
+
+def _simulation_bytes(transaction: Transaction, sig_verify: bool) -> bytes:
+    # Without signature verification, missing signatures are sent as zeros and no
+    # blockhash is needed when the node replaces it
+    if not sig_verify:
+        if transaction.recent_blockhash or transaction.nonce_info:
+            return transaction.serialize(verify_signatures=False)
+        transaction.recent_blockhash = PLACEHOLDER_BLOCKHASH
+        try:
+            return transaction.serialize(verify_signatures=False)
+        finally:
+            transaction.recent_blockhash = None
+    if not transaction.verify_signatures():
+        transaction.sign()
+    return transaction.serialize(verify_signatures=False)
+
+
+def decode_transactions(
+    wire_transactions: Iterable[bytes | str | List[str]],
+    signers: List[Keypair] | None = None,
+    address_lookup_tables: List[AddressLookupTableAccount] | None = None,
+    key_pool: PublicKeyPool | None = None,
+) -> List[Transaction]:
+    """
+    Decodes many wire transactions, such as the transactions of a block fetched
+    with the base64 encoding.
+
+    Args:
+        wire_transactions (Iterable[bytes | str | List[str]]): Raw transactions, base64 strings or
+            `[data, "base64"]` pairs as returned by JSON RPC.
+        signers (List[Keypair], optional): Signers attached to every decoded transaction.
+        address_lookup_tables (List[AddressLookupTableAccount], optional): Tables looked up by version 0 transactions.
+        key_pool (PublicKeyPool, optional): Pool the account keys of all transactions are interned in.
+
+    Returns:
+        List[Transaction]: The decoded transactions, in order.
+    """
+    transactions: List[Transaction] = []
+    for wire_transaction in wire_transactions:
+        if isinstance(wire_transaction, list):
+            data, encoding = wire_transaction
+            if encoding != "base64":
+                raise ValueError(f"Unsupported transaction encoding: {encoding}")
+            wire_transaction = data
+        if isinstance(wire_transaction, str):
+            wire_transaction = b64decode(wire_transaction)
+        transactions.append(
+            Transaction.from_buffer(wire_transaction, signers, address_lookup_tables, key_pool))
+    return transactions
+
+
+def _sign_chunk(
+    seeds: List[bytes], messages: List[Tuple[bytes, List[int]]]
+) -> List[List[bytes]]:
+    # Runs in worker processes, signing keys are rebuilt once per chunk
+    signing_keys = [SigningKey(seed) for seed in seeds]
+    return [
+        [signing_keys[index].sign(message).signature for index in indices]
+        for message, indices in messages
+    ]
+
+
+def _sign_chunk_with_keys(
+    messages: List[Tuple[bytes, List[Keypair]]]
+) -> List[List[bytes]]:
+    return [
+        [signer.signing_key.sign(message).signature for signer in signers]
+        for message, signers in messages
+    ]
+
+
+def sign_many(
+    transactions: Sequence[Transaction],
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    chunk_size: int = 256,
+) -> List[Transaction]:
+    """
+    Signs many transactions, spreading the Ed25519 work over a pool of workers.
+
+    Every message is compiled once in the calling thread. Threads share the signing
+    keys cached on each `Keypair` and run in parallel since libsodium releases the
+    GIL; processes receive the private keys of each chunk instead.
+
+    Args:
+        transactions (Sequence[Transaction]): The transactions, with their blockhash set.
+        max_workers (int, optional): Number of workers. Defaults to the number of CPUs.
+        use_processes (bool, optional): Whether to sign in a process pool rather than a thread pool. Defaults to False.
+        chunk_size (int, optional): Number of transactions signed per task. Defaults to 256.
+
+    Returns:
+        List[Transaction]: The same transactions, signed.
+    """
+    messages: List[Tuple[bytes, List[Keypair]]] = []
+    for transaction in transactions:
+        for signer in transaction.signers:
+            if not isinstance(signer, Keypair):
+                raise TypeError("Transactions can only be signed by Keypair signers")
+        messages.append((transaction.compile_transaction(), transaction.signers))
+
+    chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(chunks) <= 1:
+        results = [_sign_chunk_with_keys(chunk) for chunk in chunks]
+    elif use_processes:
+        payloads = []
+        for chunk in chunks:
+            seed_indices: Dict[bytes, int] = {}
+            items = [
+                (message, [
+                    seed_indices.setdefault(bytes(signer.key_pair), len(seed_indices))
+                    for signer in signers
+                ])
+                for message, signers in chunk
+            ]
+            payloads.append((list(seed_indices), items))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_sign_chunk, *zip(*payloads)))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_sign_chunk_with_keys, chunks))
+
+    signatures = (signature for chunk in results for signature in chunk)
+    for transaction, transaction_signatures in zip(transactions, signatures):
+        for idx, signature in enumerate(transaction_signatures):
+            transaction.signatures[idx].signature = signature
+    return list(transactions)
+
+
+def verify_transactions(
+    transactions: Sequence[Transaction],
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    chunk_size: int = 256,
+) -> List[bool]:
+    """
+    Verifies the signatures of many transactions with `verify_many`, compiling
+    every message once.
+
+    Returns:
+        List[bool]: Whether all signatures of each transaction are present and valid.
+    """
+    items: List[Tuple[PublicKey, bytes, bytes]] = []
+    owners: List[int] = []
+    valid = [True] * len(transactions)
+    for i, transaction in enumerate(transactions):
+        if not transaction.signatures:
+            valid[i] = False
+            continue
+        message = transaction.compile_transaction()
+        for sig_pair in transaction.signatures:
+            if not sig_pair.signature:
+                valid[i] = False
+                continue
+            items.append((sig_pair.public_key, message, sig_pair.signature))
+            owners.append(i)
+
+    for i, result in zip(owners, verify_many(items, max_workers, use_processes, chunk_size)):
+        valid[i] = valid[i] and result
+    return valid
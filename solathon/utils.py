@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
 from .publickey import PublicKey
+from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 from solathon.core.types import Commitment, RPCErrorType, RPCResponse
 
@@ -14,6 +18,8 @@ class RPCRequestError(Exception):
 LAMPORT_PER_SOL: int = 1000000000
 SOL_PER_LAMPORT: float = 1 / LAMPORT_PER_SOL
 SOL_FLOATING_PRECISION: int = 9
+DEFAULT_MS_PER_SLOT: int = 400
+VERIFY_KEY_CACHE_SIZE: int = 4096
 
 
 def truncate_float(number: float, length: int) -> float:
@@ -58,9 +64,69 @@ def verify_signature(
     if isinstance(message, str):
         message = bytes(message, encoding="utf8")
 
-    bytes_pk = bytes(public_key)
-    vk = VerifyKey(bytes_pk)
-    vk.verify(message, bytes(signature))
+    get_verify_key(public_key).verify(message, bytes(signature))
+
+
+@lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def _verify_key(public_key: bytes) -> VerifyKey:
+    return VerifyKey(public_key)
+
+
+def get_verify_key(public_key: PublicKey | str | bytes) -> VerifyKey:
+    """
+    Returns the VerifyKey of a public key, cached for the most recently used keys.
+    """
+    if isinstance(public_key, str):
+        public_key = PublicKey(public_key)
+    return _verify_key(bytes(public_key))
+
+
+def _verify_chunk(items: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    results: List[bool] = []
+    for public_key, message, signature in items:
+        try:
+            _verify_key(public_key).verify(message, signature)
+            results.append(True)
+        except (BadSignatureError, ValueError):
+            results.append(False)
+    return results
+
+
+def verify_many(
+    items: Iterable[Tuple[PublicKey | str | bytes, bytes, bytes]],
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    chunk_size: int = 256,
+) -> List[bool]:
+    """
+    Verifies many signatures, spreading the Ed25519 work over a pool of workers.
+
+    Args:
+        items (Iterable[Tuple[PublicKey | str | bytes, bytes, bytes]]): (public key, message, signature) triples.
+        max_workers (int, optional): Number of workers. Defaults to the number of CPUs.
+        use_processes (bool, optional): Whether to verify in a process pool rather than a thread pool. Defaults to False.
+        chunk_size (int, optional): Number of signatures verified per task. Defaults to 256.
+
+    Returns:
+        List[bool]: Whether each signature is valid, in order.
+    """
+    triples: List[Tuple[bytes, bytes, bytes]] = [
+        (
+            bytes(PublicKey(public_key)) if isinstance(public_key, str) else bytes(public_key),
+            bytes(message),
+            bytes(signature),
+        )
+        for public_key, message, signature in items
+    ]
+    chunks = [triples[i:i + chunk_size] for i in range(0, len(triples), chunk_size)]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(chunks) <= 1:
+        results = [_verify_chunk(chunk) for chunk in chunks]
+    else:
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
+            results = list(executor.map(_verify_chunk, chunks))
+    return [result for chunk in results for result in chunk]
 
 
 def clean_response(response: RPCResponse) -> Dict[str, Any] | RPCErrorType:
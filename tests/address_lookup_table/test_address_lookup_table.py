@@ -0,0 +1,149 @@
+from base64 import b64encode
+
+import pytest
+from nacl.public import PrivateKey as NaclPrivateKey
+from solathon import AddressLookupTableAccount, AddressLookupTableCache, Keypair, PublicKey, Transaction
+from solathon.core.instructions import (
+    AccountMeta,
+    Instruction,
+    create_lookup_table,
+    derive_lookup_table_address,
+    transfer,
+)
+from solathon.core.layouts import LOOKUP_TABLE_META_SIZE
+from solathon.core.message import MessageV0
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def key(seed):
+    return Keypair(NaclPrivateKey(bytes([seed]) * 32)).public_key
+
+
+def table_data(addresses, authority=None):
+    meta = bytearray(LOOKUP_TABLE_META_SIZE)
+    meta[0] = 1
+    meta[4:12] = (2 ** 64 - 1).to_bytes(8, "little")
+    if authority is not None:
+        meta[21] = 1
+        meta[22:54] = bytes(authority)
+    return bytes(meta) + b"".join(bytes(address) for address in addresses)
+
+
+def many_accounts_transaction(address_lookup_tables=None):
+    sender = Keypair(NaclPrivateKey(bytes([1]) * 32))
+    program = key(200)
+    accounts = [key(10 + i) for i in range(40)]
+    instruction = Instruction(
+        keys=[AccountMeta(account, False, i % 2 == 0) for i, account in enumerate(accounts)],
+        program_id=program,
+        data=b"\x01\x02",
+    )
+    return Transaction(
+        instructions=[instruction, transfer(sender.public_key, accounts[0], 1)],
+        signers=[sender],
+        recent_blockhash=BLOCKHASH,
+        address_lookup_tables=address_lookup_tables,
+    )
+
+
+def lookup_table():
+    return AddressLookupTableAccount(key=key(100), addresses=[key(10 + i) for i in range(40)])
+
+
+def test_pda_matches_reference_vectors():
+    program_id = PublicKey("BPFLoaderUpgradeab1e11111111111111111111111")
+    assert str(PublicKey.create_program_address([b"", bytes([1])], program_id)) == (
+        "BwqrghZA2htAcqq8dzP1WDAhTXYTYWj7CHxF5j7TDBAe"
+    )
+    assert str(PublicKey.create_program_address([b"Talking", b"Squirrels"], program_id)) == (
+        "2fnQrngrQT4SeLcdToJAD96phoEjNL2man2kfRLCASVk"
+    )
+    address, bump = PublicKey.find_program_address([b"Lil'", b"Bits"], program_id)
+    assert not address.is_on_curve()
+    assert PublicKey.create_program_address([b"Lil'", b"Bits", bytes([bump])], program_id) == address
+
+
+def test_create_lookup_table_instruction():
+    authority = key(1)
+    instruction, address = create_lookup_table(authority, authority, 123)
+    expected, bump = derive_lookup_table_address(authority, 123)
+
+    assert address == expected
+    assert instruction.data == bytes(4) + (123).to_bytes(8, "little") + bytes([bump])
+    assert instruction.keys[0].public_key == address
+
+
+def test_v0_transaction_fits_in_one_packet():
+    with pytest.raises(RuntimeError):
+        transaction = many_accounts_transaction()
+        transaction.sign()
+        transaction.serialize()
+
+    table = lookup_table()
+    transaction = many_accounts_transaction([table])
+    transaction.sign()
+    wire_transaction = transaction.serialize()
+
+    message = MessageV0.from_buffer(wire_transaction[65:])
+    assert message.serialize() == wire_transaction[65:]
+    # The fee payer and both invoked programs stay static
+    assert len(message.account_keys) == 3
+    assert sorted(message.address_table_lookups[0].writable_indexes) == list(range(0, 40, 2))
+
+    decoded = Transaction.from_buffer(wire_transaction, address_lookup_tables=[table])
+    assert decoded.serialize() == wire_transaction
+    assert [(m.public_key, m.is_writable) for m in decoded.instructions[0].keys] == [
+        (m.public_key, m.is_writable) for m in transaction.instructions[0].keys
+    ]
+
+    with pytest.raises(ValueError):
+        Transaction.from_buffer(wire_transaction)
+
+
+def test_decodes_lookup_table_account():
+    authority = key(3)
+    table = AddressLookupTableAccount.from_account_data(key(100), table_data([key(1), key(2)], authority))
+    assert table.addresses == [key(1), key(2)]
+    assert table.authority == authority
+    assert table.is_active
+
+
+class FakeClient:
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.slot = 10
+        self.requests = 0
+
+    def get_account_info(self, public_key):
+        raise NotImplementedError
+
+    def build_and_send_request(self, method, params):
+        assert method == "getAccountInfo"
+        self.requests += 1
+        return {
+            "context": {"slot": self.slot},
+            "value": {"data": [b64encode(table_data(self.addresses)).decode("utf-8"), "base64"]},
+        }
+
+
+def test_cache_refetches_newer_slots_and_extended_tables():
+    client = FakeClient([key(10 + i) for i in range(10)])
+    cache = AddressLookupTableCache(client)
+
+    assert len(cache.get(key(100)).addresses) == 10
+    cache.get(key(100), min_slot=10)
+    assert client.requests == 1
+
+    client.slot = 20
+    cache.get(key(100), min_slot=15)
+    assert client.requests == 2
+
+    # The table was extended since it was cached
+    table = lookup_table()
+    transaction = many_accounts_transaction([table])
+    message = MessageV0.from_buffer(transaction.compile_transaction())
+    client.addresses = table.addresses
+    tables = cache.resolve(message)
+    assert client.requests == 3
+    assert len(message.resolve_account_keys(tables)) == 43
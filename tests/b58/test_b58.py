@@ -0,0 +1,40 @@
+import random
+
+import base58
+import pytest
+from solathon.core.b58 import b58decode, b58decode_many, b58encode, b58encode_many
+
+
+def values():
+    rng = random.Random(0)
+    cases = [b"", b"\0", bytes(32), bytes(64), b"\0\0\x01", b"\xff" * 32, b"\xff" * 64]
+    for length in (1, 5, 31, 32, 33, 64):
+        for zeros in (0, 1, 3):
+            for _ in range(50):
+                cases.append(bytes(zeros) + rng.randbytes(length))
+    return cases
+
+
+def test_matches_base58_package():
+    for value in values():
+        encoded = base58.b58encode(value).decode("utf-8")
+        assert b58encode(value) == encoded
+        assert b58decode(encoded) == value
+        assert b58decode(encoded.encode("utf-8")) == value
+
+
+def test_batch_api():
+    cases = values()
+    encoded = b58encode_many(cases)
+    assert encoded == [base58.b58encode(value).decode("utf-8") for value in cases]
+    assert b58decode_many(encoded) == cases
+
+
+@pytest.mark.parametrize("value", ["0OIl", "abc!", "☉"])
+def test_invalid_characters(value):
+    with pytest.raises(ValueError):
+        b58decode(value)
+
+
+def test_trailing_whitespace_is_ignored():
+    assert b58decode("11111111111111111111111111111111\n") == bytes(32)
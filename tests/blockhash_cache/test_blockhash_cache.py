@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+from solathon.blockhash_cache import BLOCKHASH_VALIDITY_BLOCKS, BlockhashCache
+from solathon.core.types import BlockHash
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_latest_blockhash(self, commitment=None):
+        self.calls += 1
+        return BlockHash({"blockhash": f"hash{self.calls}", "lastValidBlockHeight": 150 + self.calls})
+
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_latest_blockhash(self, commitment=None):
+        self.calls += 1
+        return {"result": {"value": {"blockhash": f"hash{self.calls}", "lastValidBlockHeight": 150}}}
+
+
+def test_serves_from_memory():
+    client = FakeClient()
+    cache = BlockhashCache(client)
+
+    assert cache.get().blockhash == "hash1"
+    assert cache.get().blockhash == "hash1"
+    assert client.calls == 1
+    assert cache.get().last_valid_block_height == 151
+
+
+def test_refreshes_when_older_than_interval():
+    client = FakeClient()
+    cache = BlockhashCache(client, refresh_interval=0)
+
+    cache.get()
+    time.sleep(0.001)
+    assert cache.get().blockhash == "hash2"
+
+
+def test_refreshes_near_expiry():
+    client = FakeClient()
+    cache = BlockhashCache(client, expiry_margin=BLOCKHASH_VALIDITY_BLOCKS)
+
+    cache.get()
+    assert cache.is_stale()
+    assert cache.get().blockhash == "hash2"
+
+
+def test_async_client_shares_concurrent_refresh():
+    client = FakeAsyncClient()
+    cache = BlockhashCache(client)
+
+    async def run():
+        return await asyncio.gather(*[cache.get_async() for _ in range(10)])
+
+    blockhashes = asyncio.run(run())
+    assert {blockhash.blockhash for blockhash in blockhashes} == {"hash1"}
+    assert client.calls == 1
+
+
+def test_background_thread_refreshes():
+    client = FakeClient()
+    cache = BlockhashCache(client, refresh_interval=0.02)
+    cache.start()
+    time.sleep(0.1)
+    cache.stop()
+
+    assert client.calls > 1
@@ -0,0 +1,272 @@
+import asyncio
+import random
+from base64 import b64decode
+
+import pytest
+from solathon import AddressLookupTableAccount, AsyncClient, Client, Keypair, Transaction
+from solathon.compute_budget import (
+    MAX_COMPUTE_UNIT_LIMIT,
+    PriorityFeeEstimator,
+    estimate_transaction,
+    percentile,
+    recommend_compute_unit_limit,
+    recommend_compute_unit_limits,
+    recommend_compute_unit_limits_async,
+    writable_accounts,
+)
+from solathon.core.instructions import (
+    AccountMeta,
+    Instruction,
+    advance_nonce_account,
+    set_compute_unit_limit,
+    set_compute_unit_price,
+    transfer,
+)
+from solathon.core.layouts import COMPUTE_BUDGET_PROGRAM_ID
+from solathon.core.types import PrioritizationFee
+from solathon.transaction import NonceInformation
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self, fees):
+        self.fees = fees
+        self.requests = []
+
+    def get_recent_prioritization_fees(self, accounts):
+        self.requests.append(accounts)
+        return [
+            PrioritizationFee({"slot": slot, "prioritizationFee": fee})
+            for slot, fee in enumerate(self.fees)
+        ]
+
+
+def test_compute_budget_instructions():
+    limit = set_compute_unit_limit(200_000)
+    price = set_compute_unit_price(1_000)
+
+    assert limit.program_id == COMPUTE_BUDGET_PROGRAM_ID
+    assert limit.data == bytes([2]) + (200_000).to_bytes(4, "little")
+    assert price.data == bytes([3]) + (1_000).to_bytes(8, "little")
+    assert limit.keys == [] and price.keys == []
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1), (25, 1), (50, 2), (75, 3), (100, 4)])
+def test_percentile(pct, expected):
+    assert percentile([4, 1, 3, 2], pct) == expected
+
+
+def test_percentile_empty_and_invalid():
+    assert percentile([], 50) == 0
+    with pytest.raises(ValueError):
+        percentile([1], 101)
+
+
+def test_writable_accounts_include_fee_payer():
+    sender, receiver = Keypair(), Keypair()
+    transaction = Transaction(
+        instructions=[set_compute_unit_limit(1), transfer(sender.public_key, receiver.public_key, 1)],
+        signers=[sender],
+    )
+    assert writable_accounts(transaction) == [str(sender.public_key), str(receiver.public_key)]
+
+
+def test_estimator_caches_per_account_set():
+    sender, receiver = Keypair(), Keypair()
+    instructions = [transfer(sender.public_key, receiver.public_key, 1)]
+    client = FakeClient([0, 10, 20, 30, 40])
+    estimator = PriorityFeeEstimator(client)
+
+    assert estimator.estimate(instructions, 50, fee_payer=sender.public_key) == 20
+    assert estimator.estimate_percentiles(instructions, (25, 95), fee_payer=sender.public_key) == {25: 10, 95: 40}
+    assert len(client.requests) == 1
+
+    # Same writable set in a different order shares the cache entry
+    estimator.estimate([transfer(receiver.public_key, sender.public_key, 1)])
+    assert len(client.requests) == 1
+
+    estimator.estimate([transfer(sender.public_key, Keypair().public_key, 1)])
+    assert len(client.requests) == 2
+
+
+def test_estimator_cache_expires():
+    client = FakeClient([5])
+    estimator = PriorityFeeEstimator(client, cache_slots=0)
+    estimator.get_fees(["a"])
+    estimator.get_fees(["a"])
+    assert len(client.requests) == 2
+
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+@pytest.mark.parametrize("with_tables", [False, True])
+def test_estimate_matches_serialized_size(with_tables):
+    rng = random.Random(0)
+    payer, other = Keypair(), Keypair()
+    accounts = [Keypair().public_key for _ in range(30)]
+    programs = [Keypair().public_key for _ in range(3)]
+    tables = [
+        AddressLookupTableAccount(key=Keypair().public_key, addresses=rng.sample(accounts + programs, 20))
+        for _ in range(2)
+    ] if with_tables else None
+    for _ in range(20):
+        instructions = [set_compute_unit_price(rng.randint(0, 10 ** 6))]
+        signers = [payer]
+        for _ in range(rng.randint(1, 4)):
+            keys = [AccountMeta(rng.choice(accounts), False, rng.random() < 0.5) for _ in range(rng.randint(0, 8))]
+            if rng.random() < 0.3:
+                keys.append(AccountMeta(other.public_key, True, rng.random() < 0.5))
+                signers = [payer, other]
+            instructions.append(Instruction(keys=keys, program_id=rng.choice(programs), data=bytes(rng.randint(0, 40))))
+        transaction = Transaction(
+            instructions=instructions, signers=signers, recent_blockhash=BLOCKHASH, address_lookup_tables=tables
+        )
+        estimate = estimate_transaction(instructions, signers, tables)
+        transaction.sign()
+        assert estimate.size == len(transaction.serialize(verify_signatures=False))
+        assert estimate_transaction(transaction) == estimate
+        assert estimate.num_signatures == len(signers)
+
+
+def test_estimate_fee():
+    payer = Keypair()
+    receiver = Keypair().public_key
+    estimate = estimate_transaction([transfer(payer.public_key, receiver, 1)], [payer])
+    assert (estimate.compute_unit_limit, estimate.fee) == (200_000, 5000)
+
+    estimate = estimate_transaction(
+        [set_compute_unit_limit(300), set_compute_unit_price(1_500_000), transfer(payer.public_key, receiver, 1)],
+        [payer],
+    )
+    assert (estimate.compute_unit_limit, estimate.compute_unit_price) == (300, 1_500_000)
+    assert (estimate.base_fee, estimate.priority_fee, estimate.fee) == (5000, 450, 5450)
+    assert estimate.fits
+
+
+def simulation_response(data, units_consumed=1000, err=None):
+    return {
+        "jsonrpc": "2.0",
+        "id": data["id"],
+        "result": {
+            "context": {"slot": 1},
+            "value": {
+                "err": err,
+                "logs": ["Program 11111111111111111111111111111111 success"],
+                "accounts": None,
+                "unitsConsumed": units_consumed,
+                "returnData": None,
+                "replacementBlockhash": {"blockhash": BLOCKHASH, "lastValidBlockHeight": 10},
+            },
+        },
+    }
+
+
+def test_simulate_transaction_request():
+    payer, receiver = Keypair(), Keypair().public_key
+    client = Client("http://localhost:8899", local=True)
+    requests = []
+
+    def send(data):
+        requests.append(data)
+        return simulation_response(data)
+
+    client.http.send = send
+    transaction = Transaction(instructions=[transfer(payer.public_key, receiver, 1)], signers=[payer.public_key])
+    result = client.simulate_transaction(transaction, replace_recent_blockhash=True, accounts=[receiver])
+
+    wire, config = requests[0]["params"]
+    assert requests[0]["method"] == "simulateTransaction"
+    assert config == {
+        "encoding": "base64",
+        "sigVerify": False,
+        "replaceRecentBlockhash": True,
+        "accounts": {"encoding": "base64", "addresses": [str(receiver)]},
+    }
+    # Unsigned, the signature is sent as zeros and the blockhash left unset
+    assert b64decode(wire)[1:65] == bytes(64)
+    assert transaction.recent_blockhash is None
+    assert (result.err, result.units_consumed, result.replacement_blockhash) == (None, 1000, BLOCKHASH)
+
+    with pytest.raises(ValueError):
+        client.simulate_transaction(transaction, sig_verify=True, replace_recent_blockhash=True)
+
+
+def test_recommend_compute_unit_limit():
+    assert recommend_compute_unit_limit(1000) == 1100
+    assert recommend_compute_unit_limit(1000, 0) == 1000
+    assert recommend_compute_unit_limit(1_390_000) == MAX_COMPUTE_UNIT_LIMIT
+    with pytest.raises(ValueError):
+        recommend_compute_unit_limit(1000, -0.1)
+
+
+def make_simulated_transactions(payer):
+    receiver = Keypair().public_key
+    return [
+        Transaction(
+            instructions=[set_compute_unit_limit(10), transfer(payer.public_key, receiver, lamports)],
+            signers=[payer],
+        )
+        for lamports in range(1, 5)
+    ]
+
+
+def simulated_units(data):
+    # The lamports transferred by the simulated transaction, times 1000 units
+    transaction = Transaction.from_buffer(b64decode(data["params"][0]))
+    limit, transfer_instruction = transaction.instructions
+    assert limit.data == set_compute_unit_limit(MAX_COMPUTE_UNIT_LIMIT).data
+    return int.from_bytes(transfer_instruction.data[4:12], "little") * 1000
+
+
+def test_recommend_compute_unit_limits():
+    transactions = make_simulated_transactions(Keypair())
+    client = Client("http://localhost:8899", local=True)
+    client.http.send = lambda data: simulation_response(
+        data, simulated_units(data), err={"InstructionError": [1, "Custom"]} if simulated_units(data) == 3000 else None
+    )
+
+    recommendations = recommend_compute_unit_limits(client, transactions, margin=0.5, max_workers=4)
+    assert [r.compute_unit_limit for r in recommendations] == [1500, 3000, None, 6000]
+    assert [r.ok for r in recommendations] == [True, True, False, True]
+    # The transactions themselves are left as they were
+    assert all(t.instructions[0].data == set_compute_unit_limit(10).data for t in transactions)
+    assert all(t.recent_blockhash is None for t in transactions)
+
+
+def test_recommend_compute_unit_limit_keeps_nonce_instruction_first():
+    payer = Keypair()
+    advance = advance_nonce_account(Keypair().public_key, payer.public_key)
+    transaction = Transaction(
+        instructions=[advance, transfer(payer.public_key, Keypair().public_key, 2)],
+        signers=[payer],
+        nonce_info=NonceInformation(nonce=BLOCKHASH, nonce_instruction=advance),
+    )
+    simulated = []
+
+    def send(data):
+        simulated.append(Transaction.from_buffer(b64decode(data["params"][0])).instructions)
+        return simulation_response(data)
+
+    client = Client("http://localhost:8899", local=True)
+    client.http.send = send
+    assert recommend_compute_unit_limits(client, [transaction])[0].ok
+
+    advance_instruction, limit, transfer_instruction = simulated[0]
+    assert advance_instruction.data == advance.data
+    assert limit.data == set_compute_unit_limit(MAX_COMPUTE_UNIT_LIMIT).data
+    assert transfer_instruction.data == transaction.instructions[1].data
+
+
+def test_recommend_compute_unit_limits_async():
+    transactions = make_simulated_transactions(Keypair())
+    client = AsyncClient("http://localhost:8899", local=True)
+
+    async def send(data):
+        await asyncio.sleep(0)
+        return simulation_response(data, simulated_units(data))
+
+    client.http.send = send
+    recommendations = asyncio.run(recommend_compute_unit_limits_async(client, transactions, max_concurrency=2))
+    assert [r.compute_unit_limit for r in recommendations] == [1100, 2200, 3300, 4400]
@@ -0,0 +1,109 @@
+import pytest
+from solathon.confirmation import (
+    MAX_SIGNATURE_STATUSES,
+    ConfirmationTracker,
+    TransactionExpiredError,
+)
+from solathon.core.types import SignatureStatus
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self, block_height=100):
+        self.block_height = block_height
+        self.statuses = {}
+        self.requests = []
+
+    def get_block_height(self):
+        return self.block_height
+
+    def get_signature_statuses(self, signatures):
+        self.requests.append(list(signatures))
+        return [self.statuses.get(signature) for signature in signatures]
+
+
+def make_status(confirmation_status, err=None):
+    return SignatureStatus({
+        "slot": 1,
+        "confirmations": 0,
+        "err": err,
+        "confirmationStatus": confirmation_status,
+    })
+
+
+def test_polls_in_batches():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client)
+    tracker.track_many([f"sig{i}" for i in range(600)])
+    tracker.poll()
+
+    assert [len(request) for request in client.requests] == [
+        MAX_SIGNATURE_STATUSES, MAX_SIGNATURE_STATUSES, 600 - 2 * MAX_SIGNATURE_STATUSES
+    ]
+
+
+def test_resolves_at_requested_commitment():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client, commitment="finalized")
+    future = tracker.track("sig")
+
+    client.statuses["sig"] = make_status("confirmed")
+    assert tracker.poll() == 0
+    assert not future.done()
+
+    client.statuses["sig"] = make_status("finalized")
+    assert tracker.poll() == 1
+    assert future.result().confirmation_status == "finalized"
+    assert len(tracker) == 0
+
+
+def test_failed_transaction_resolves_with_error():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client)
+    future = tracker.track("sig")
+    client.statuses["sig"] = make_status("confirmed", err={"InstructionError": [0, "Custom"]})
+
+    tracker.poll()
+    assert future.result().err is not None
+
+
+def test_expires_past_last_valid_block_height():
+    client = FakeClient(block_height=150)
+    tracker = ConfirmationTracker(client)
+    live = tracker.track("live", last_valid_block_height=150)
+    expired = tracker.track("expired", last_valid_block_height=149)
+
+    tracker.poll()
+    assert not live.done()
+    with pytest.raises(TransactionExpiredError):
+        expired.result()
+
+
+def test_interval_backs_off_and_resets():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client, min_interval=1, max_interval=4, backoff=2)
+    tracker.track("sig")
+
+    tracker.poll()
+    tracker.poll()
+    tracker.poll()
+    assert tracker.interval == 4
+
+    client.statuses["sig"] = make_status("confirmed")
+    tracker.poll()
+    assert tracker.interval == 1
+
+
+def test_tracking_same_signature_returns_same_future():
+    tracker = ConfirmationTracker(FakeClient())
+    assert tracker.track("sig") is tracker.track("sig")
+    assert len(tracker) == 1
+
+
+def test_untrack_cancels_and_forgets_signature():
+    tracker = ConfirmationTracker(FakeClient())
+    future = tracker.track("sig")
+    tracker.untrack("sig")
+    tracker.untrack("missing")
+    assert future.cancelled() and len(tracker) == 0
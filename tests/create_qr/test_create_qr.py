@@ -0,0 +1,47 @@
+import importlib
+import os
+from xml.etree import ElementTree
+
+import pytest
+from PIL import Image
+from solathon.solana_pay import create_qr, create_qrs
+
+create_qr_module = importlib.import_module("solathon.solana_pay.create_qr")
+
+URL = "solana:mvines9iiHiQTysrwkJjGf2gb9Ex9jXJX8ns3qwf2kN?amount=1&reference=6DgHPm8gQp2mvQs5wuYTbJCH5KkkdJ7i4P76M31aegCQ"
+
+
+def test_png_keeps_working_directory():
+    cwd = os.getcwd()
+    image = Image.open(create_qr(URL, size=4))
+    assert os.getcwd() == cwd
+    assert image.format == "PNG" and image.mode == "RGB"
+    # The logo is resized once per size
+    create_qr(URL + "1", size=4)
+    assert create_qr_module._resized_logo.cache_info().currsize >= 1
+    assert create_qr_module._resized_logo.cache_info().hits >= 1
+
+
+def test_svg_and_terminal():
+    svg = create_qr(URL, size=4, format="svg").getvalue().decode()
+    assert svg.startswith("<svg") and "data:image/png;base64," in svg
+    terminal = create_qr(URL, format="terminal")
+    assert isinstance(terminal, str) and "█" in terminal
+    with pytest.raises(ValueError):
+        create_qr(URL, format="jpeg")
+
+
+def test_svg_is_well_formed_with_any_color():
+    svg = create_qr(URL, size=4, format="svg", color='"/><script/>', background="#fff").getvalue()
+    root = ElementTree.fromstring(svg)
+    assert root.find("{http://www.w3.org/2000/svg}path").get("fill") == '"/><script/>'
+    image = root.find("{http://www.w3.org/2000/svg}image")
+    assert image.get("{http://www.w3.org/1999/xlink}href") == image.get("href")
+
+
+def test_create_qrs_matches_create_qr():
+    links = [f"{URL}&memo={i}" for i in range(3)]
+    expected = [create_qr(link, size=4).getvalue() for link in links]
+    assert [qr.getvalue() for qr in create_qrs(links, size=4, max_workers=1)] == expected
+    assert [qr.getvalue() for qr in create_qrs(links, size=4, max_workers=2)] == expected
+    assert create_qrs([]) == []
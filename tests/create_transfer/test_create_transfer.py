@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from solathon import AsyncClient, BlockhashCache, Client, Keypair
+from solathon.core.system_program import Transfer, decode_system_instruction
+from solathon.solana_pay import create_transfer, create_transfer_async
+from solathon.utils import RPCRequestError
+
+BLOCKHASH = "GfVcyD4kkTrj4bKc7WA9sZCin9JDbdT4Zkd3EittNR1W"
+
+
+def account(lamports, owner="11111111111111111111111111111111"):
+    return {"lamports": lamports, "owner": owner, "executable": False, "rentEpoch": 0, "data": ["", "base64"]}
+
+
+def respond(batches, accounts):
+    def send_batch(data):
+        batches.append(data)
+        responses = []
+        for request in data:
+            if request["method"] == "getMultipleAccounts":
+                value = [accounts.get(key) for key in request["params"][0]]
+            else:
+                value = {"blockhash": BLOCKHASH, "lastValidBlockHeight": 100}
+            responses.append({"jsonrpc": "2.0", "id": request["id"], "result": {"context": {"slot": 1}, "value": value}})
+        return responses
+    return send_batch
+
+
+def test_create_transfer_takes_one_round_trip():
+    sender, recipient, reference = Keypair(), Keypair().public_key, Keypair().public_key
+    client = Client("http://localhost:8899", local=True)
+    batches = []
+    client.http.send_batch = respond(batches, {
+        str(sender.public_key): account(2_000_000_000), str(recipient): account(0),
+    })
+
+    fields = {"recipient": recipient, "amount": 1.5, "reference": reference, "memo": "order-1"}
+    transaction = create_transfer(client, sender, fields, commitment="confirmed")
+    assert [[request["method"] for request in batch] for batch in batches] == [["getMultipleAccounts", "getLatestBlockhash"]]
+    assert batches[0][0]["params"][1] == {"encoding": "base64", "commitment": "confirmed"}
+    assert transaction.recent_blockhash == BLOCKHASH
+    assert decode_system_instruction(transaction.instructions[1]) == Transfer(sender.public_key, recipient, 1_500_000_000)
+    assert transaction.instructions[1].keys[2].public_key == reference
+    assert transaction.instructions[0].data == b"order-1"
+
+    with pytest.raises(ValueError, match="Insufficient funds"):
+        create_transfer(client, sender, {**fields, "amount": 3})
+    with pytest.raises(RPCRequestError, match="not found"):
+        create_transfer(client, sender, {**fields, "recipient": Keypair().public_key})
+    batches.clear()
+    with pytest.raises(ValueError, match="Amount"):
+        create_transfer(client, sender, {"recipient": recipient})
+    assert batches == []
+
+
+def test_create_transfer_uses_and_fills_the_blockhash_cache():
+    sender, recipient = Keypair(), Keypair().public_key
+    client = Client("http://localhost:8899", local=True)
+    batches = []
+    client.http.send_batch = respond(batches, {
+        str(sender.public_key): account(10), str(recipient): account(0, owner=str(Keypair().public_key)),
+    })
+    cache = BlockhashCache(client)
+    with pytest.raises(ValueError, match="Invalid recipient"):
+        create_transfer(client, sender, {"recipient": recipient, "amount": 0}, blockhash_cache=cache)
+    # The blockhash fetched in the batch refreshed the cache, the next batch leaves it out
+    assert not cache.is_stale()
+    with pytest.raises(ValueError):
+        create_transfer(client, sender, {"recipient": recipient, "amount": 0}, blockhash_cache=cache)
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+def test_create_transfer_async():
+    sender, recipient = Keypair(), Keypair().public_key
+    client = AsyncClient("http://localhost:8899", local=True)
+    batches = []
+    send_batch = respond(batches, {str(sender.public_key): account(10), str(recipient): account(0)})
+
+    async def send_batch_async(data):
+        return send_batch(data)
+
+    client.http.send_batch = send_batch_async
+    transaction = asyncio.run(create_transfer_async(client, sender, {"recipient": recipient, "amount": 0.000000005}))
+    assert transaction.recent_blockhash == BLOCKHASH
+    assert decode_system_instruction(transaction.instructions[0]).lamports == 5
+    assert len(batches) == 1
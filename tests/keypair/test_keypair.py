@@ -0,0 +1,34 @@
+import pytest
+from solathon import Keypair
+from solathon.keypair import KeypairBatch, derive_private_key
+
+# SLIP-0010 test vector 1 for ed25519
+SEED = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+
+
+def test_derive_private_key_matches_slip10_vectors():
+    assert derive_private_key(SEED, "m").hex() == "2b4be7f19ee27bbf30c667b642d5f4aa69fd169872f8fc3059c08ebae2eb19e7"
+    assert derive_private_key(SEED, "m/0'").hex() == "68e0fe46dfb67e368c75379acec591dad19df3cde26e63b93a8e704f1dade7a3"
+    assert derive_private_key(SEED, "m/0'/1'").hex() == "b1d0bad404bf35da785a64ca1ac54b2617211d2777696fbffaf208f746ae84f2"
+    with pytest.raises(ValueError):
+        derive_private_key(SEED, "m/0'/1")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_derive_batch_matches_single_derivation(max_workers):
+    batch = KeypairBatch.derive(SEED, 5, start=3, max_workers=max_workers, chunk_size=2)
+
+    assert len(batch) == 5
+    for position, index in enumerate(range(3, 8)):
+        assert batch.seed(position) == derive_private_key(SEED, f"m/44'/501'/{index}'/0'")
+        assert batch[position].public_key == batch.public_key(position)
+
+
+def test_generate_batch_builds_keypairs_lazily():
+    batch = KeypairBatch.generate(7, max_workers=2, chunk_size=3)
+
+    assert len(batch.seeds) == len(batch.public_keys) == 7 * 32
+    assert [keypair.public_key for keypair in batch] == [batch.public_key(i) for i in range(7)]
+    assert isinstance(batch[-1], Keypair)
+    with pytest.raises(IndexError):
+        batch.public_key(7)
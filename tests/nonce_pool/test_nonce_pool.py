@@ -0,0 +1,126 @@
+import asyncio
+from base64 import b64encode
+
+import pytest
+from solathon import Keypair, NoncePool, Transaction
+from solathon.core.instructions import advance_nonce_account, transfer
+from solathon.core.layouts import NONCE_ACCOUNT_LAYOUT
+from solathon.core.system_program import AdvanceNonceAccount, decode_system_instruction
+from solathon.core.types import AccountInfo
+from solathon.nonce_pool import decode_nonce_account
+from solathon.transaction import NonceInformation
+
+
+def nonce_data(authority, nonce):
+    return NONCE_ACCOUNT_LAYOUT.build(dict(
+        version=1, state=1, authority=bytes(authority), nonce=bytes(nonce), lamports_per_signature=5000,
+    ))
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self, authority):
+        self.authority = authority
+        self.nonces = {}
+        self.requests = []
+
+    def account(self, key):
+        return {
+            "lamports": 1_447_680, "owner": "11111111111111111111111111111111", "executable": False,
+            "rentEpoch": 0, "data": [b64encode(nonce_data(self.authority, self.nonces[key])).decode(), "base64"],
+        }
+
+    def get_multiple_accounts(self, pubkeys, commitment=None):
+        self.requests.append(list(pubkeys))
+        return [AccountInfo(self.account(key)) for key in pubkeys]
+
+
+class FakeAsyncClient(FakeClient):
+    async def get_multiple_accounts(self, pubkeys, commitment=None):
+        self.requests.append(list(pubkeys))
+        return {"result": {"context": {"slot": 1}, "value": [self.account(key) for key in pubkeys]}}
+
+
+def make_pool(count, client_class=FakeClient):
+    authority = Keypair()
+    client = client_class(authority.public_key)
+    accounts = [str(Keypair().public_key) for _ in range(count)]
+    for account in accounts:
+        client.nonces[account] = Keypair().public_key
+    return authority, client, NoncePool(client, accounts, authority)
+
+
+def test_decode_nonce_account():
+    authority, nonce = Keypair().public_key, Keypair().public_key
+    account = decode_nonce_account("11111111111111111111111111111111", nonce_data(authority, nonce))
+    assert (account.authority, account.nonce, account.lamports_per_signature) == (authority, str(nonce), 5000)
+    with pytest.raises(ValueError):
+        decode_nonce_account("11111111111111111111111111111111", bytes(80))
+
+
+def test_refresh_fetches_in_chunks_of_100():
+    _, client, pool = make_pool(250)
+    assert len(pool.refresh()) == 250
+    assert [len(request) for request in client.requests] == [100, 100, 50]
+    assert pool.available == 250
+    # Nothing is stale until an account is released after use
+    assert pool.refresh() == []
+
+
+def test_assign_and_release():
+    authority, client, pool = make_pool(3)
+    pool.refresh()
+    receiver = Keypair().public_key
+    transactions = [
+        Transaction(instructions=[transfer(authority.public_key, receiver, i + 1)], signers=[authority])
+        for i in range(2)
+    ]
+    accounts = pool.assign(transactions)
+    assert len({str(account.public_key) for account in accounts}) == 2
+    assert pool.available == 1
+
+    for transaction, account in zip(transactions, accounts):
+        assert transaction.recent_blockhash == account.nonce
+        transaction.sign()
+        # The nonce advance is compiled in as the first instruction
+        decoded = Transaction.from_buffer(transaction.serialize())
+        assert decode_system_instruction(decoded.instructions[0]) == AdvanceNonceAccount(
+            account.public_key, authority.public_key
+        )
+        assert len(decoded.instructions) == 2
+
+    with pytest.raises(ValueError):
+        pool.assign(transactions)
+    with pytest.raises(ValueError):
+        pool.assign([Transaction(instructions=[transfer(receiver, receiver, 1)], signers=[receiver])])
+
+    pool.release(accounts[0], used=False)
+    pool.release(accounts[1])
+    assert pool.available == 2
+    assert [str(account.public_key) for account in pool.refresh()] == [str(accounts[1].public_key)]
+    assert pool.available == 3
+
+
+def test_nonce_instruction_is_not_added_twice():
+    authority = Keypair()
+    nonce_account, nonce = Keypair().public_key, str(Keypair().public_key)
+    advance = advance_nonce_account(nonce_account, authority.public_key)
+    transaction = Transaction(
+        instructions=[advance, transfer(authority.public_key, nonce_account, 1)],
+        signers=[authority],
+        nonce_info=NonceInformation(nonce=nonce, nonce_instruction=advance),
+    )
+    transaction.sign()
+    assert len(Transaction.from_buffer(transaction.serialize()).instructions) == 2
+
+
+def test_refresh_async_rejects_other_authority():
+    _, client, pool = make_pool(150, FakeAsyncClient)
+    assert len(asyncio.run(pool.refresh_async())) == 150
+    assert len(client.requests) == 2
+
+    client.authority = Keypair().public_key
+    pool.release(pool.acquire())
+    with pytest.raises(ValueError):
+        asyncio.run(pool.refresh_async())
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from solathon import Keypair
+from solathon.core.instructions import AccountMeta, Instruction, set_compute_unit_limit, transfer
+from solathon.packer import InstructionPacker, pack_instructions
+from solathon.transaction import PACKET_DATA_SIZE
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def wire_sizes(transactions):
+    sizes = []
+    for transaction in transactions:
+        transaction.sign()
+        sizes.append(len(transaction.serialize(verify_signatures=False)))
+    return sizes
+
+
+def test_packs_transfers_into_full_transactions():
+    payer = Keypair()
+    instructions = [transfer(payer.public_key, Keypair().public_key, i + 1) for i in range(100)]
+    transactions = pack_instructions(instructions, [payer], BLOCKHASH)
+
+    sizes = wire_sizes(transactions)
+    assert max(sizes) <= PACKET_DATA_SIZE
+    # One more transfer (a new account and a 14 byte instruction) would not fit
+    assert all(size + 32 + 14 > PACKET_DATA_SIZE for size in sizes[:-1])
+    assert [instruction for transaction in transactions for instruction in transaction.instructions] == instructions
+
+
+@pytest.mark.parametrize("max_open", [1, 8])
+def test_sizes_are_exact_with_extra_signers(max_open):
+    rng = random.Random(0)
+    payer, *others = [Keypair() for _ in range(4)]
+    accounts = [Keypair().public_key for _ in range(40)]
+    program_id = Keypair().public_key
+    instructions = []
+    for _ in range(120):
+        keys = [AccountMeta(rng.choice(accounts), False, rng.random() < 0.5) for _ in range(rng.randint(0, 6))]
+        if rng.random() < 0.2:
+            keys.append(AccountMeta(rng.choice(others).public_key, True, False))
+        instructions.append(Instruction(keys=keys, program_id=program_id, data=bytes(rng.randint(0, 200))))
+
+    packer = InstructionPacker([payer, *others], BLOCKHASH, max_open=max_open)
+    transactions = []
+    for instruction in instructions:
+        transactions.extend(packer.add(instruction))
+    transactions.extend(packer.flush())
+
+    assert max(wire_sizes(transactions)) <= PACKET_DATA_SIZE
+    assert sorted(id(i) for t in transactions for i in t.instructions) == sorted(id(i) for i in instructions)
+    for transaction in transactions:
+        # Only the signers the instructions need, the fee payer first
+        assert transaction.signers[0] is payer
+
+
+def test_respects_compute_and_account_limits():
+    payer = Keypair()
+    instructions = [transfer(payer.public_key, Keypair().public_key, 1) for _ in range(10)]
+
+    transactions = pack_instructions(
+        instructions, [payer], BLOCKHASH, compute_units=300, compute_unit_limit=1000, compute_unit_price=5
+    )
+    # 150 units for each compute budget instruction, then two transfers of 300
+    assert [len(transaction.instructions) - 2 for transaction in transactions] == [2, 2, 2, 2, 2]
+    assert transactions[0].instructions[0] == set_compute_unit_limit(900)
+
+    transactions = pack_instructions(instructions, [payer], BLOCKHASH, max_accounts=5)
+    assert [len(transaction.instructions) for transaction in transactions] == [3, 3, 3, 1]
+
+    with pytest.raises(ValueError):
+        pack_instructions([transfer(Keypair().public_key, payer.public_key, 1)], [payer], BLOCKHASH)
@@ -0,0 +1,77 @@
+import pickle
+
+import base58
+import pytest
+from solathon import Keypair, PublicKey, Transaction
+from solathon.core.instructions import transfer
+from solathon.publickey import PublicKeyPool, _find_program_address, find_program_addresses
+from solathon.transaction import decode_transactions
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def test_hashable_and_equal_by_value():
+    public_key = Keypair().public_key
+    same = PublicKey(str(public_key))
+
+    assert same == public_key and same is not public_key
+    assert len({public_key, same}) == 1
+    assert {public_key: 1}[same] == 1
+
+
+def test_base58_matches_reference_encoding():
+    for public_key in [Keypair().public_key, PublicKey(bytes(32)), PublicKey(bytes([0, 0, 1]) + bytes(29))]:
+        expected = base58.b58encode(public_key.byte_value)
+        assert public_key.base58_encode() == expected
+        assert str(public_key) == expected.decode("utf-8")
+        assert str(PublicKey(public_key.byte_value)) == str(public_key)
+
+
+def test_slotted_and_picklable():
+    public_key = Keypair().public_key
+    assert not hasattr(public_key, "__dict__")
+    assert pickle.loads(pickle.dumps(public_key)) == public_key
+
+
+def test_pool_interns_keys_across_transactions():
+    sender = Keypair()
+    receiver = Keypair().public_key
+    wire_transactions = []
+    for lamports in (1, 2):
+        transaction = Transaction(
+            instructions=[transfer(sender.public_key, receiver, lamports)],
+            signers=[sender],
+            recent_blockhash=BLOCKHASH,
+        )
+        transaction.sign()
+        wire_transactions.append(transaction.serialize())
+
+    pool = PublicKeyPool()
+    first, second = decode_transactions(wire_transactions, key_pool=pool)
+    assert first.fee_payer is second.fee_payer
+    assert first.instructions[0].keys[1].public_key is second.instructions[0].keys[1].public_key
+    assert len(pool) == 3
+    assert pool.get(str(receiver)) is first.instructions[0].keys[1].public_key
+
+
+def test_find_program_address_is_cached():
+    program_id = Keypair().public_key
+    seeds = [b"vault", bytes(Keypair().public_key)]
+    hits = _find_program_address.cache_info().hits
+
+    address, bump = PublicKey.find_program_address(seeds, program_id)
+    assert PublicKey.find_program_address([bytearray(seed) for seed in seeds], program_id) == (address, bump)
+    assert _find_program_address.cache_info().hits == hits + 1
+    assert PublicKey.create_program_address([*seeds, bytes([bump])], program_id) == address
+
+
+def test_find_program_addresses_matches_single_derivation():
+    program_id = Keypair().public_key
+    owners = [bytes(Keypair().public_key) for _ in range(6)]
+    items = [([b"vault", owner], program_id) for owner in owners + owners[:2]]
+    expected = [PublicKey.find_program_address(seeds, program_id) for seeds, _ in items]
+
+    assert find_program_addresses(items, max_workers=1) == expected
+    assert find_program_addresses(items, max_workers=2, chunk_size=2) == expected
+    with pytest.raises(ValueError):
+        find_program_addresses([([bytes(33)], program_id)])
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from solathon.core.http import _order_batch
+from solathon.solana_pay import ReferenceExpiredError, ReferenceWatcher
+from solathon.solana_pay import reference_watcher
+
+
+def make_signature(name):
+    return {
+        "signature": name, "slot": 1, "err": None, "memo": None,
+        "blockTime": None, "confirmationStatus": "confirmed",
+    }
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self):
+        # Signatures of each reference, newest first
+        self.signatures = {}
+        self.batches = []
+
+    def response(self, params):
+        reference, options = params
+        signatures = self.signatures.get(reference, [])
+        if "before" in options:
+            signatures = signatures[signatures.index(options["before"]) + 1:]
+        if "until" in options and options["until"] in signatures:
+            signatures = signatures[:signatures.index(options["until"])]
+        return {"jsonrpc": "2.0", "id": 1, "result": [make_signature(s) for s in signatures[:options["limit"]]]}
+
+    def build_and_send_batch_request(self, method, params):
+        assert method == "getSignaturesForAddress"
+        self.batches.append(params)
+        return [self.response(request_params) for request_params in params]
+
+
+class FakeAsyncClient(FakeClient):
+    async def build_and_send_batch_request_async(self, method, params):
+        return self.build_and_send_batch_request(method, params)
+
+
+def test_polls_due_references_in_batches():
+    client = FakeClient()
+    watcher = ReferenceWatcher(client, batch_size=100)
+    futures = watcher.watch_many([f"ref{i}" for i in range(250)])
+    assert watcher.poll() == 0
+    assert [len(batch) for batch in client.batches] == [100, 100, 50]
+
+    # Nothing is due again before the first interval
+    assert watcher.poll() == 0
+    assert len(client.batches) == 3
+
+    client.signatures["ref7"] = ["new", "old"]
+    watcher.notify("ref7")
+    assert watcher.poll() == 1
+    assert futures[7].result().signature == "old"
+    assert len(watcher) == 249
+
+
+def test_interval_backs_off_per_reference():
+    watcher = ReferenceWatcher(FakeClient(), min_interval=1, max_interval=3, backoff=2)
+    watcher.watch("ref")
+    intervals = []
+    for _ in range(4):
+        watcher.poll(force=True)
+        intervals.append(watcher._pending["ref"].interval)
+    assert intervals == [2, 3, 3, 3]
+    assert 0 < watcher.next_poll_in() <= 3
+
+
+def test_pages_back_to_the_oldest_signature():
+    client = FakeClient()
+    client.signatures["ref"] = [f"sig{i}" for i in range(7, 0, -1)] + ["before-checkout"]
+    watcher = ReferenceWatcher(client, page_limit=3)
+    found = []
+    future = watcher.watch("ref", callback=found.append, until="before-checkout")
+
+    assert watcher.poll() == 1
+    assert future.result().signature == "sig1"
+    assert [s.signature for s in found] == ["sig1"]
+    # Pages of 3, 3 and 1 signatures, each after the oldest seen so far
+    assert [batch[0][1].get("before") for batch in client.batches] == [None, "sig5", "sig2"]
+    assert all(batch[0][1]["until"] == "before-checkout" for batch in client.batches)
+
+
+def test_reference_expires():
+    watcher = ReferenceWatcher(FakeClient())
+    future = watcher.watch("ref", timeout=0)
+    assert watcher.poll() == 1
+    with pytest.raises(ReferenceExpiredError):
+        future.result()
+
+
+def test_errors_are_retried():
+    client = FakeClient()
+    client.build_and_send_batch_request = lambda method, params: [
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "busy"}} for _ in params
+    ]
+    watcher = ReferenceWatcher(client)
+    future = watcher.watch("ref")
+    assert watcher.poll() == 0
+    assert not future.done() and watcher.last_error is not None
+
+
+def test_failed_page_resolves_with_oldest_signature_found():
+    client = FakeClient()
+    client.signatures["ref"] = ["sig3", "sig2", "sig1"]
+    respond = client.response
+    client.response = lambda params: (
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "busy"}}
+        if "before" in params[1] else respond(params)
+    )
+    watcher = ReferenceWatcher(client, page_limit=2)
+    future = watcher.watch("ref", timeout=0)
+    assert watcher.poll() == 1
+    assert future.result().signature == "sig2"
+    assert watcher.last_error is not None
+
+
+def test_failed_subscription_is_requested_again():
+    watcher = ReferenceWatcher(FakeAsyncClient())
+    requests, subscriptions = {1: "ref"}, {}
+    watcher._handle_message(
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32602, "message": "Invalid params"}},
+        requests, subscriptions,
+    )
+    assert requests == {} and subscriptions == {}
+    assert watcher.last_error is not None
+
+
+def test_notify_from_another_thread_wakes_the_loop():
+    client = FakeAsyncClient()
+    watcher = ReferenceWatcher(client, min_interval=60, max_interval=60)
+    future = watcher.watch("ref")
+
+    async def run():
+        task = asyncio.get_running_loop().create_task(watcher.run_async())
+        await asyncio.sleep(0.01)
+        client.signatures["ref"] = ["sig"]
+        thread = threading.Thread(target=watcher.notify, args=("ref",))
+        thread.start()
+        thread.join()
+        result = await asyncio.wait_for(asyncio.wrap_future(future), 1)
+        task.cancel()
+        return result
+
+    assert asyncio.run(run()).signature == "sig"
+
+
+def test_async_polling_and_websocket_notifications():
+    client = FakeAsyncClient()
+    watcher = ReferenceWatcher(client, min_interval=60, max_interval=60)
+    future = watcher.watch("ref")
+
+    async def run():
+        task = asyncio.get_running_loop().create_task(watcher.run_async())
+        await asyncio.sleep(0.01)
+        client.signatures["ref"] = ["sig"]
+        # A logs notification for the subscription makes the reference due at once
+        requests, subscriptions = {1: "ref"}, {}
+        watcher._handle_message({"jsonrpc": "2.0", "id": 1, "result": 42}, requests, subscriptions)
+        watcher._handle_message(
+            {"jsonrpc": "2.0", "method": "logsNotification", "params": {"subscription": 42, "result": {}}},
+            requests, subscriptions,
+        )
+        result = await asyncio.wait_for(asyncio.wrap_future(future), 1)
+        task.cancel()
+        return result
+
+    started = time.monotonic()
+    assert asyncio.run(run()).signature == "sig"
+    assert time.monotonic() - started < 1
+    assert len(client.batches) == 2
+
+
+def test_websocket_mode_requires_websockets(monkeypatch):
+    monkeypatch.setattr(reference_watcher, "websockets", None)
+    with pytest.raises(ImportError):
+        asyncio.run(ReferenceWatcher(FakeAsyncClient()).run_async("ws://localhost:8900"))
+
+
+def test_batch_responses_are_ordered_by_id():
+    requests = [{"id": 1}, {"id": 2}, {"id": 3}]
+    responses = _order_batch(requests, [{"id": 3, "result": "c"}, {"id": 1, "result": "a"}])
+    assert [response.get("result") for response in responses] == ["a", None, "c"]
+    assert "error" in responses[1]
+    assert _order_batch(requests, {"error": {"code": -32600}}) == [{"error": {"code": -32600}}] * 3
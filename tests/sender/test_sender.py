@@ -0,0 +1,134 @@
+import asyncio
+
+from base58 import b58encode
+from solathon import Keypair, Transaction
+from solathon.core.instructions import transfer
+from solathon.sender import TransactionSender
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+class FakeAsyncClient:
+    blockhash_cache = None
+
+    def __init__(self, land=True, block_height=100):
+        self.land = land
+        self.block_height = block_height
+        self.sent = []
+        self.landed = set()
+
+    async def get_latest_blockhash(self, commitment=None):
+        return {"result": {"value": {"blockhash": BLOCKHASH, "lastValidBlockHeight": 150}}}
+
+    async def get_block_height(self):
+        self.block_height += 1
+        return {"result": self.block_height}
+
+    async def build_and_send_request_async(self, method, params):
+        assert method == "sendTransaction"
+        wire = params[0]
+        signature = b58encode(wire[1:65]).decode("utf-8")
+        self.sent.append(signature)
+        if self.land:
+            self.landed.add(signature)
+        return {"result": signature}
+
+    async def get_signature_statuses(self, signatures):
+        return {"result": {"value": [
+            {"slot": 1, "confirmations": 1, "err": None, "confirmationStatus": "confirmed"}
+            if signature in self.landed else None
+            for signature in signatures
+        ]}}
+
+
+def make_transactions(count, sender):
+    receiver = Keypair().public_key
+    return [
+        Transaction(instructions=[transfer(sender.public_key, receiver, lamports)], signers=[sender])
+        for lamports in range(1, count + 1)
+    ]
+
+
+def test_sends_and_confirms_transactions():
+    client = FakeAsyncClient()
+    sender = TransactionSender(client, max_concurrency=4, rebroadcast_interval=0)
+    report = asyncio.run(sender.send(make_transactions(10, Keypair())))
+
+    assert report.confirmed == 10
+    assert report.tps > 0
+    assert all(result.transaction.recent_blockhash == BLOCKHASH for result in report.results)
+
+
+def test_deduplicates_by_signature():
+    client = FakeAsyncClient()
+    transactions = make_transactions(3, Keypair())
+    report = asyncio.run(TransactionSender(client).send(transactions + transactions[:1]))
+
+    assert report.count("duplicate") == 1
+    assert len(set(client.sent)) == 3
+
+
+def test_rebroadcasts_until_expiry():
+    client = FakeAsyncClient(land=False, block_height=148)
+    sender = TransactionSender(client, rebroadcast_interval=0)
+    report = asyncio.run(sender.send(make_transactions(2, Keypair())))
+
+    assert report.count("expired") == 2
+    assert all(result.attempts > 1 for result in report.results)
+
+
+def test_consumes_queue_until_sentinel():
+    async def run():
+        queue = asyncio.Queue()
+        for transaction in make_transactions(2, Keypair()):
+            queue.put_nowait(transaction)
+        queue.put_nowait(None)
+        return await TransactionSender(FakeAsyncClient()).send(queue)
+
+    assert asyncio.run(run()).confirmed == 2
+
+
+def test_keeps_caller_blockhash_and_drops_after_max_pending_time():
+    client = FakeAsyncClient(land=False)
+    caller_blockhash = "EETubP5AKHgjPAhzPAFcb8BAY1hMH639CWCFTqi3hq1k"
+    transactions = make_transactions(2, Keypair())
+    for transaction in transactions:
+        transaction.recent_blockhash = caller_blockhash
+    sender = TransactionSender(client, rebroadcast_interval=0, max_pending_time=0.5)
+    report = asyncio.run(sender.send(transactions))
+
+    assert report.count("dropped") == 2
+    assert all(result.transaction.recent_blockhash == caller_blockhash for result in report.results)
+
+
+class FlakyAsyncClient(FakeAsyncClient):
+    async def build_and_send_request_async(self, method, params):
+        if not self.sent:
+            self.sent.append(None)
+            raise ConnectionError("connection reset")
+        return await super().build_and_send_request_async(method, params)
+
+
+def test_retries_after_transport_error():
+    client = FlakyAsyncClient()
+    sender = TransactionSender(client, rebroadcast_interval=0)
+    report = asyncio.run(sender.send(make_transactions(1, Keypair())))
+
+    assert report.confirmed == 1
+    assert report.results[0].attempts == 2
+
+
+class FailingStatusClient(FakeAsyncClient):
+    async def get_signature_statuses(self, signatures):
+        raise ConnectionError("RPC unavailable")
+
+
+def test_drops_after_max_pending_time_while_polls_fail():
+    client = FailingStatusClient(land=False)
+    transactions = make_transactions(2, Keypair())
+    for transaction in transactions:
+        transaction.recent_blockhash = BLOCKHASH
+    sender = TransactionSender(client, rebroadcast_interval=0, max_pending_time=0.5)
+    report = asyncio.run(asyncio.wait_for(sender.send(transactions), 5))
+
+    assert report.count("dropped") == 2
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+import time
+from base64 import b64encode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from solathon import AsyncClient, Client, Keypair, PublicKey, Transaction
+from solathon.core.instructions import transfer
+from solathon.solana_pay import (
+    configure_http_pool,
+    fetch_transaction,
+    fetch_transaction_async,
+    fetch_transactions,
+    fetch_transactions_async,
+)
+from solathon.solana_pay.fetch_transaction import DEFAULT_FETCH_TIMEOUT
+
+BLOCKHASH = "GfVcyD4kkTrj4bKc7WA9sZCin9JDbdT4Zkd3EittNR1W"
+
+
+@pytest.fixture
+def merchant():
+    # A merchant server keeping connections alive, which records the port of each client connection
+    state = {"connections": set(), "requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            account = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["account"]
+            state["connections"].add(self.client_address[1])
+            state["requests"] += 1
+            if self.path == "/slow":
+                time.sleep(1)
+            data = json.dumps({"transaction": b64encode(unsigned(account)).decode()}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def unsigned(account):
+    # A transaction only `account` has to sign, so it gets a fresh blockhash
+    account = PublicKey(account)
+    transaction = Transaction(
+        instructions=[transfer(account, Keypair().public_key, 1)],
+        signers=[account],
+        recent_blockhash="4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM",
+    )
+    return transaction.serialize(verify_signatures=False)
+
+
+class BlockhashClient:
+    clean_response = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_latest_blockhash(self, commitment=None):
+        self.calls += 1
+        return {"jsonrpc": "2.0", "id": 1, "result": {"context": {"slot": 1}, "value": {"blockhash": BLOCKHASH}}}
+
+
+def test_fetch_transaction_reuses_connections(merchant):
+    client, wallet = BlockhashClient(), Keypair().public_key
+    configure_http_pool(max_connections=4)
+    for _ in range(5):
+        assert fetch_transaction(client, wallet, merchant["url"] + "/pay").recent_blockhash == BLOCKHASH
+    assert len(merchant["connections"]) == 1
+
+    # The connection pool of the RPC client can be shared
+    rpc = Client("http://127.0.0.1:1", local=True)
+    fetch_transaction(client, wallet, merchant["url"] + "/pay", http=rpc.http.client)
+    assert len(merchant["connections"]) == 2
+    configure_http_pool()
+
+
+def test_configure_http_pool_keeps_previous_pool_usable(merchant):
+    client, wallet = BlockhashClient(), Keypair().public_key
+    previous = configure_http_pool()
+    configure_http_pool()
+    # A thread still holding the previous pool can finish its request
+    assert fetch_transaction(client, wallet, merchant["url"] + "/pay", http=previous).recent_blockhash == BLOCKHASH
+    previous.close()
+
+
+def test_fetch_transactions(merchant):
+    client, wallet = BlockhashClient(), Keypair().public_key
+    links = [merchant["url"] + "/pay"] * 6 + [merchant["url"] + "/slow"]
+    with httpx.Client() as http:
+        results = fetch_transactions(client, wallet, links, http=http, timeout=0.3, max_workers=4, return_exceptions=True)
+        assert all(transaction.recent_blockhash == BLOCKHASH for transaction in results[:6])
+        assert isinstance(results[6], httpx.TimeoutException)
+        # Transactions needing a blockhash share one request
+        assert client.calls == 1
+        with pytest.raises(httpx.TimeoutException):
+            fetch_transactions(client, wallet, links[-1:], http=http, timeout=0.3)
+
+
+def test_fetch_transactions_async(merchant):
+    wallet = Keypair().public_key
+    client = AsyncClient("http://127.0.0.1:1", local=True)
+
+    async def get_latest_blockhash(commitment=None):
+        return {"jsonrpc": "2.0", "id": 1, "result": {"context": {"slot": 1}, "value": {"blockhash": BLOCKHASH}}}
+
+    client.get_latest_blockhash = get_latest_blockhash
+
+    async def main():
+        try:
+            return await fetch_transactions_async(client, wallet, [merchant["url"] + "/pay"] * 10, max_concurrency=2)
+        finally:
+            await client.http.client.aclose()
+
+    results = asyncio.run(main())
+    assert [transaction.recent_blockhash for transaction in results] == [BLOCKHASH] * 10
+    assert len(merchant["connections"]) <= 2
+
+
+def test_async_fetch_defaults_to_fetch_timeout():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        account = json.loads(request.content)["account"]
+        return httpx.Response(200, json={"transaction": b64encode(unsigned(account)).decode()})
+
+    client = AsyncClient("http://127.0.0.1:1", local=True)
+
+    async def get_latest_blockhash(commitment=None):
+        return {"jsonrpc": "2.0", "id": 1, "result": {"context": {"slot": 1}, "value": {"blockhash": BLOCKHASH}}}
+
+    client.get_latest_blockhash = get_latest_blockhash
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            await fetch_transaction_async(client, Keypair().public_key, "http://merchant/pay", http=http)
+            await fetch_transactions_async(client, Keypair().public_key, ["http://merchant/pay"], http=http, timeout=2.0)
+
+    asyncio.run(main())
+    assert timeouts == [DEFAULT_FETCH_TIMEOUT, 2.0]
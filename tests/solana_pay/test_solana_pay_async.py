@@ -0,0 +1,220 @@
+import asyncio
+import json
+import threading
+from base64 import b64encode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from solathon import AsyncClient, Keypair, Transaction
+from solathon.core.b58 import b58encode
+from solathon.core.instructions import transfer
+from solathon.solana_pay import (
+    create_transfer_async,
+    fetch_transaction_async,
+    find_reference_async,
+    validate_transfer_async,
+)
+
+BLOCKHASH = "GfVcyD4kkTrj4bKc7WA9sZCin9JDbdT4Zkd3EittNR1W"
+SYSTEM = "11111111111111111111111111111111"
+
+
+class StandInRPC:
+    """An in-memory cluster answering the JSON-RPC methods used by solana_pay."""
+
+    def __init__(self):
+        self.accounts = {}
+        self.transactions = {}
+        self.references = {}
+        self.merchant_transaction = None
+        self.requests = 0
+        self.round_trips = 0
+
+    def land(self, transaction: Transaction) -> str:
+        # Records a signed transaction as confirmed, moving the lamports of its transfers
+        decoded = Transaction.from_buffer(transaction.serialize())
+        message = decoded._message
+        keys = [str(key) for key in message.account_keys]
+        pre = [self.accounts.get(key, {}).get("lamports", 0) for key in keys]
+        post = list(pre)
+        for instruction in message.instructions:
+            if keys[instruction.program_id_index] == SYSTEM:
+                lamports = int.from_bytes(instruction.raw_data[4:12], "little")
+                post[instruction.accounts[0]] -= lamports
+                post[instruction.accounts[1]] += lamports
+            for index in instruction.accounts:
+                self.references.setdefault(keys[index], [])
+        signature = b58encode(decoded.signatures[0].signature)
+        for key in keys:
+            self.references.setdefault(key, []).insert(0, signature)
+        self.transactions[signature] = {
+            "slot": 1, "blockTime": None,
+            "transaction": {"signatures": [signature], "message": {
+                "accountKeys": keys,
+                "header": {
+                    "numRequiredSignatures": message.header.num_required_signatures,
+                    "numReadonlySignedAccounts": message.header.num_readonly_signed_accounts,
+                    "numReadonlyUnsignedAccounts": message.header.num_readonly_unsigned_accounts,
+                },
+                "instructions": [
+                    {"programIdIndex": i.program_id_index, "accounts": list(i.accounts), "data": i.data}
+                    for i in message.instructions
+                ],
+                "recentBlockhash": BLOCKHASH,
+            }},
+            "meta": {
+                "err": None, "fee": 5000, "innerInstructions": [], "logMessages": [],
+                "preBalances": pre, "postBalances": post, "preTokenBalances": [], "postTokenBalances": [],
+                "rewards": [], "status": {"Ok": None},
+            },
+        }
+        return signature
+
+    def result(self, method, params):
+        if method == "getMultipleAccounts":
+            return {"context": {"slot": 1}, "value": [self.accounts.get(key) for key in params[0]]}
+        if method == "getLatestBlockhash":
+            return {"context": {"slot": 1}, "value": {"blockhash": BLOCKHASH, "lastValidBlockHeight": 200}}
+        if method == "getSignaturesForAddress":
+            return [
+                {"signature": s, "slot": 1, "err": None, "memo": None, "blockTime": None, "confirmationStatus": "confirmed"}
+                for s in self.references.get(params[0], [])
+            ]
+        if method == "getTransaction":
+            assert params[1]["maxSupportedTransactionVersion"] == 0
+            return self.transactions.get(params[0])
+        raise AssertionError(method)
+
+    def handle(self, request):
+        self.requests += 1
+        return {"jsonrpc": "2.0", "id": request["id"], "result": self.result(request["method"], request["params"])}
+
+
+@pytest.fixture
+def stand_in():
+    rpc = StandInRPC()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            rpc.round_trips += 1
+            if self.path == "/pay":
+                payload = {"transaction": b64encode(rpc.merchant_transaction(body["account"])).decode()}
+            elif isinstance(body, list):
+                payload = [rpc.handle(request) for request in body]
+            else:
+                payload = rpc.handle(body)
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        # The default backlog of 5 resets connections when every checkout connects at once
+        request_queue_size = 128
+
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    rpc.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield rpc
+    server.shutdown()
+    server.server_close()
+
+
+def account(lamports):
+    return {"lamports": lamports, "owner": SYSTEM, "executable": False, "rentEpoch": 0, "data": ["", "base64"]}
+
+
+def test_concurrent_checkouts(stand_in):
+    merchant = Keypair().public_key
+    stand_in.accounts[str(merchant)] = account(0)
+    customers = [Keypair() for _ in range(20)]
+    for customer in customers:
+        stand_in.accounts[str(customer.public_key)] = account(1_000_000_000)
+
+    async def checkout(client, customer):
+        reference = Keypair().public_key
+        fields = {"recipient": merchant, "amount": 0.1, "reference": reference, "memo": "order"}
+        transaction = await create_transfer_async(client, customer, fields)
+        transaction.sign()
+        stand_in.land(transaction)
+        found = await find_reference_async(client, reference)
+        return await validate_transfer_async(client, found.signature, fields)
+
+    async def main():
+        client = AsyncClient(stand_in.url + "/rpc", local=True)
+        try:
+            return await asyncio.gather(*(checkout(client, customer) for customer in customers))
+        finally:
+            await client.http.client.aclose()
+
+    results = asyncio.run(main())
+    assert len(results) == 20 and all(result.meta.err is None for result in results)
+    # One round trip to create, one to find and one to validate each payment
+    assert stand_in.round_trips == 20 * 3
+    assert stand_in.requests == 20 * 4
+
+
+def test_fetch_transaction_async(stand_in):
+    merchant, wallet = Keypair(), Keypair()
+
+    def merchant_transaction(account):
+        assert account == str(wallet.public_key)
+        transaction = Transaction(
+            instructions=[transfer(wallet.public_key, merchant.public_key, 10),
+                          transfer(merchant.public_key, wallet.public_key, 1)],
+            signers=[wallet.public_key, merchant],
+            fee_payer=wallet.public_key,
+            recent_blockhash="4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM",
+        )
+        # Only the merchant signs, the wallet signature is left empty
+        transaction.signatures[1].signature = merchant.sign(transaction.compile_transaction()).signature
+        return transaction.serialize(verify_signatures=False)
+
+    stand_in.merchant_transaction = merchant_transaction
+
+    async def main():
+        client = AsyncClient(stand_in.url + "/rpc", local=True)
+        try:
+            return await fetch_transaction_async(client, wallet.public_key, stand_in.url + "/pay")
+        finally:
+            await client.http.client.aclose()
+
+    transaction = asyncio.run(main())
+    # Partially signed by the merchant, so its blockhash is kept
+    assert transaction.recent_blockhash == "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+    assert stand_in.round_trips == 1
+    transaction.signers = [wallet, merchant]
+    transaction.sign()
+
+
+def test_fetch_transaction_async_replaces_blockhash(stand_in):
+    wallet = Keypair()
+
+    def merchant_transaction(account):
+        transaction = Transaction(
+            instructions=[transfer(wallet.public_key, Keypair().public_key, 10)],
+            signers=[wallet.public_key],
+            recent_blockhash="4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM",
+        )
+        return transaction.serialize(verify_signatures=False)
+
+    stand_in.merchant_transaction = merchant_transaction
+
+    async def main(account):
+        client = AsyncClient(stand_in.url + "/rpc", local=True)
+        try:
+            return await fetch_transaction_async(client, account, stand_in.url + "/pay")
+        finally:
+            await client.http.client.aclose()
+
+    # Only the wallet signs, so the blockhash is replaced with a fresh one
+    assert asyncio.run(main(wallet.public_key)).recent_blockhash == BLOCKHASH
+    with pytest.raises(ValueError, match="Missing Signature"):
+        asyncio.run(main(Keypair().public_key))
@@ -0,0 +1,153 @@
+import pytest
+from solathon import Keypair, Transaction
+from solathon.core import system_program
+from solathon.core.b58 import b58encode
+from solathon.core.instructions import create_account, create_account_with_seed, set_compute_unit_price, transfer
+from solathon.core.layouts import SYSTEM_INSTRUCTIONS_LAYOUT, InstructionType
+from solathon.core.message import Message
+from solathon.core.types.block import Block
+
+BASE = bytes(Keypair().public_key)
+PROGRAM_ID = bytes(Keypair().public_key)
+
+
+def rust_string(value):
+    return dict(length=len(value.encode("utf-8")), chars=value)
+
+
+# (instruction type, construct arguments, struct encoder arguments)
+CASES = [
+    (InstructionType.CREATE_ACCOUNT, dict(lamports=2039280, space=165, program_id=PROGRAM_ID), (2039280, 165, PROGRAM_ID)),
+    (InstructionType.ASSIGN, dict(program_id=PROGRAM_ID), (PROGRAM_ID,)),
+    (InstructionType.TRANSFER, dict(lamports=2 ** 64 - 1), (2 ** 64 - 1,)),
+    (
+        InstructionType.CREATE_ACCOUNT_WITH_SEED,
+        dict(base=BASE, seed=rust_string("vault"), lamports=1, space=2, program_id=PROGRAM_ID),
+        (BASE, "vault", 1, 2, PROGRAM_ID),
+    ),
+    (InstructionType.ADVANCE_NONCE_ACCOUNT, None, ()),
+    (InstructionType.WITHDRAW_NONCE_ACCOUNT, dict(lamports=5000), (5000,)),
+    (InstructionType.INITIALIZE_NONCE_ACCOUNT, dict(authorized=BASE), (BASE,)),
+    (InstructionType.AUTHORIZE_NONCE_ACCOUNT, dict(authorized=BASE), (BASE,)),
+    (InstructionType.ALLOCATE, dict(space=10240), (10240,)),
+    (
+        InstructionType.ALLOCATE_WITH_SEED,
+        dict(base=BASE, seed=rust_string("été"), space=8, program_id=PROGRAM_ID),
+        (BASE, "été", 8, PROGRAM_ID),
+    ),
+    (
+        InstructionType.ASSIGN_WITH_SEED,
+        dict(base=BASE, seed=rust_string(""), program_id=PROGRAM_ID),
+        (BASE, "", PROGRAM_ID),
+    ),
+    (
+        InstructionType.TRANSFER_WITH_SEED,
+        dict(lamports=7, from_seed=rust_string("seed"), from_owner=PROGRAM_ID),
+        (7, "seed", PROGRAM_ID),
+    ),
+]
+
+
+@pytest.mark.parametrize("instruction_type, layout_args, args", CASES)
+def test_encoders_match_construct_layout(instruction_type, layout_args, args):
+    encoder = getattr(system_program, f"encode_{instruction_type.name.lower()}")
+    data = encoder(*args)
+
+    assert data == SYSTEM_INSTRUCTIONS_LAYOUT.build(dict(type=instruction_type, args=layout_args))
+    decoded_type, decoded = system_program.decode_system_instruction_data(data)
+    assert decoded_type == instruction_type
+    assert tuple(decoded.values()) == args
+
+
+def test_builders_use_struct_encoders():
+    sender = Keypair().public_key
+    assert transfer(sender, Keypair().public_key, 1000).data == bytes.fromhex("02000000e803000000000000")
+    # The seed used to be passed to the construct layout as a plain string and failed
+    instruction = create_account_with_seed(sender, Keypair().public_key, sender, "seed", 1, 2, sender)
+    assert system_program.decode_system_instruction_data(instruction.data)[1]["seed"] == "seed"
+
+
+def test_invalid_arguments_and_data():
+    with pytest.raises(ValueError):
+        system_program.encode_transfer(-1)
+    with pytest.raises(ValueError):
+        system_program.decode_system_instruction_data(bytes.fromhex("02000000e803"))
+    with pytest.raises(ValueError):
+        system_program.decode_system_instruction_data(bytes.fromhex("0c000000"))
+
+
+def block_transaction(transaction, err=None, inner_instructions=()):
+    # JSON encoded transaction, as returned by getBlock
+    transaction.sign()
+    message = Message.from_buffer(transaction.compile_transaction())
+    return {
+        "meta": {
+            "err": err, "fee": 5000, "innerInstructions": list(inner_instructions), "logMessages": [],
+            "postBalances": [], "postTokenBalances": [], "preBalances": [], "preTokenBalances": [], "rewards": None,
+        },
+        "transaction": {
+            "message": {
+                "accountKeys": [str(key) for key in message.account_keys],
+                "header": {
+                    "numRequiredSignatures": message.header.num_required_signatures,
+                    "numReadonlySignedAccounts": message.header.num_readonly_signed_accounts,
+                    "numReadonlyUnsignedAccounts": message.header.num_readonly_unsigned_accounts,
+                },
+                "instructions": [
+                    {"programIdIndex": instruction.program_id_index, "accounts": list(instruction.accounts),
+                     "data": instruction.data}
+                    for instruction in message.instructions
+                ],
+                "recentBlockhash": message.recent_blockhash,
+            },
+            "signatures": [b58encode(pair.signature) for pair in transaction.signatures],
+        },
+    }
+
+
+def test_decode_system_instruction():
+    sender, receiver = Keypair().public_key, Keypair().public_key
+    assert system_program.decode_system_instruction(transfer(sender, receiver, 42)) == system_program.Transfer(
+        from_public_key=sender, to_public_key=receiver, lamports=42
+    )
+    with pytest.raises(ValueError):
+        system_program.decode_system_instruction(set_compute_unit_price(1))
+
+
+def test_decode_block_system_instructions():
+    payer, receiver, new_account = Keypair(), Keypair(), Keypair()
+    BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+    with_system = Transaction(
+        instructions=[
+            set_compute_unit_price(1000),
+            transfer(payer.public_key, receiver.public_key, 5),
+            create_account(payer.public_key, new_account.public_key, 10, 165, receiver.public_key),
+        ],
+        signers=[payer, new_account],
+        recent_blockhash=BLOCKHASH,
+    )
+    without_system = Transaction(instructions=[set_compute_unit_price(1)], signers=[payer], recent_blockhash=BLOCKHASH)
+    # The system program is at index 4 of the first transaction's keys
+    inner = {"index": 0, "instructions": [
+        {"programIdIndex": 4, "accounts": [0, 2], "data": b58encode(system_program.encode_transfer(7))}
+    ]}
+    block = Block({
+        "blockHeight": 1, "blockTime": None, "blockhash": BLOCKHASH, "parentSlot": 0, "previousBlockhash": BLOCKHASH,
+        "transactions": [
+            block_transaction(with_system, inner_instructions=[inner]),
+            block_transaction(without_system),
+        ],
+    })
+    assert str(block.transactions[0].transaction.message.account_keys[4]) == "11111111111111111111111111111111"
+
+    decoded = system_program.decode_block_system_instructions(block)
+    assert [(item.instruction_index, item.inner_index) for item in decoded] == [(1, None), (2, None), (0, 0)]
+    assert decoded[0].instruction == system_program.Transfer(payer.public_key, receiver.public_key, 5)
+    assert decoded[1].instruction.new_account_public_key == new_account.public_key
+    assert decoded[2].instruction.lamports == 7
+    assert decoded[0].signature == b58encode(with_system.signatures[0].signature) and not decoded[0].failed
+
+    transfers = system_program.decode_block_system_instructions(
+        block, instruction_types=[InstructionType.TRANSFER], include_inner=False
+    )
+    assert [item.instruction.lamports for item in transfers] == [5]
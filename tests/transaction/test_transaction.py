@@ -0,0 +1,172 @@
+import hashlib
+from base64 import b64encode
+
+import pytest
+from nacl.public import PrivateKey as NaclPrivateKey
+from solathon import Keypair, Transaction
+from solathon.core.instructions import AccountMeta, Instruction, allocate, assign, transfer
+from solathon.core.layouts import SYSTEM_PROGRAM_ID
+from solathon.core.b58 import b58encode
+from solathon.core.message import CompiledInstruction, Message
+from solathon.transaction import decode_transactions, sign_many, verify_transactions
+
+BLOCKHASH = "4uQeVj5tqViQh7yWWGStvkEG1Zmhx6uasJtWCJziofM"
+
+
+def keypair(seed):
+    return Keypair(NaclPrivateKey(bytes([seed]) * 32))
+
+
+def key(seed):
+    return keypair(seed).public_key
+
+
+def simple_transaction():
+    sender = keypair(1)
+    return Transaction(
+        instructions=[transfer(sender.public_key, key(2), 1000)],
+        signers=[sender],
+        recent_blockhash=BLOCKHASH,
+    )
+
+
+def many_instructions_transaction():
+    signers = [keypair(i) for i in range(1, 4)]
+    program = key(50)
+    instructions = []
+    for i in range(20):
+        source = signers[i % 3].public_key
+        instructions.append(transfer(source, key(10 + i % 7), i + 1))
+        instructions.append(Instruction(
+            keys=[
+                AccountMeta(key(30 + i % 5), False, False),
+                AccountMeta(str(key(10 + i % 4)), False, i % 2 == 0),
+                AccountMeta(signers[(i + 1) % 3].public_key, True, False),
+            ],
+            program_id=program,
+            data=bytes(range(i)),
+        ))
+    instructions.append(assign(signers[1].public_key, program))
+    instructions.append(allocate(signers[2].public_key, 64))
+    return Transaction(instructions=instructions, signers=signers, recent_blockhash=BLOCKHASH)
+
+
+def program_also_writable_transaction():
+    sender = keypair(1)
+    program = key(60)
+    return Transaction(
+        instructions=[
+            Instruction(keys=[AccountMeta(program, False, False)], program_id=SYSTEM_PROGRAM_ID, data=b"\x01"),
+            transfer(sender.public_key, program, 5),
+            Instruction(keys=[], program_id=program, data=b""),
+        ],
+        signers=[sender],
+        recent_blockhash=BLOCKHASH,
+    )
+
+
+# Digests of the messages produced by the base58 string keyed compiler
+@pytest.mark.parametrize("build, digest", [
+    (simple_transaction, "4e533b7be8c5c801f4940073bfe70af2049e5d23849ffa568886772f9ebe1335"),
+    (many_instructions_transaction, "e284c5e3c92e51f1a76cc2d0c210e6ba3b1403c61b5cc13b06c05d96ccbd01de"),
+    (program_also_writable_transaction, "fd5467d8e2319cefceec7524078eff7316bb7dd9a86ae8f0a6196138f75b54b7"),
+])
+def test_compile_transaction_output_is_stable(build, digest):
+    assert hashlib.sha256(build().compile_transaction()).hexdigest() == digest
+
+
+def test_compile_does_not_mutate_instructions():
+    transaction = many_instructions_transaction()
+    before = [(a_m.is_signer, a_m.is_writable) for i in transaction.instructions for a_m in i.keys]
+    transaction.compile_transaction()
+    after = [(a_m.is_signer, a_m.is_writable) for i in transaction.instructions for a_m in i.keys]
+    assert before == after
+
+
+@pytest.mark.parametrize("build", [simple_transaction, program_also_writable_transaction])
+def test_wire_round_trip(build):
+    transaction = build()
+    transaction.sign()
+    wire_transaction = transaction.serialize()
+
+    decoded = Transaction.from_buffer(wire_transaction, transaction.signers)
+    assert decoded.serialize() == wire_transaction
+    assert [i.data for i in decoded.instructions] == [i.data for i in transaction.instructions]
+
+
+def test_message_round_trip():
+    message = many_instructions_transaction().compile_transaction()
+    assert Message.from_buffer(message).serialize() == message
+
+
+def test_compiled_instruction_data_is_base58():
+    transaction = simple_transaction()
+    message = Message.from_buffer(transaction.compile_transaction())
+    instruction = message.instructions[0]
+    assert instruction.raw_data == bytes(transaction.instructions[0].data)
+    assert instruction.data == b58encode(instruction.raw_data)
+    assert CompiledInstruction(instruction.accounts, instruction.program_id_index, instruction.data) == instruction
+
+
+def test_decode_transactions_from_base64():
+    wire_transactions = []
+    for build in (simple_transaction, program_also_writable_transaction):
+        transaction = build()
+        transaction.sign()
+        wire_transactions.append(transaction.serialize())
+
+    decoded = decode_transactions([
+        b64encode(wire_transactions[0]).decode("utf-8"),
+        [b64encode(wire_transactions[1]).decode("utf-8"), "base64"],
+    ])
+    assert [transaction.serialize() for transaction in decoded] == wire_transactions
+
+
+def test_populate_decodes_the_given_signature_encoding():
+    transaction = simple_transaction()
+    transaction.sign()
+    message = Message.from_buffer(transaction.compile_transaction())
+    signature = transaction.signatures[0].signature
+
+    from_json = Transaction.populate(message, [b58encode(signature)])
+    assert from_json.signatures[0].signature == signature
+    # Raw bytes are never mistaken for base58, even when they only hold base58 digits
+    digits = b"1" * 64
+    assert Transaction.populate(message, [digits], signature_encoding="raw").signatures[0].signature == digits
+    with pytest.raises(ValueError):
+        Transaction.populate(message, [signature[:32]], signature_encoding="raw")
+
+
+def test_truncated_buffer_is_rejected():
+    transaction = simple_transaction()
+    transaction.sign()
+    wire_transaction = transaction.serialize()
+
+    with pytest.raises(ValueError):
+        Transaction.from_buffer(wire_transaction[:-1])
+    with pytest.raises(ValueError):
+        Transaction.from_buffer(wire_transaction[:100])
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_sign_many_matches_sign(use_processes):
+    transactions = [simple_transaction(), many_instructions_transaction(), program_also_writable_transaction()]
+    sign_many(transactions, max_workers=2, use_processes=use_processes, chunk_size=1)
+
+    for build, transaction in zip(
+        (simple_transaction, many_instructions_transaction, program_also_writable_transaction), transactions
+    ):
+        expected = build()
+        expected.sign()
+        assert [pair.signature for pair in transaction.signatures] == [
+            pair.signature for pair in expected.signatures
+        ]
+
+
+def test_verify_transactions():
+    transactions = [simple_transaction(), many_instructions_transaction(), program_also_writable_transaction()]
+    sign_many(transactions)
+    transactions[1].signatures[2].signature = transactions[0].signatures[0].signature
+    transactions[2].signatures[0].signature = None
+
+    assert verify_transactions(transactions, max_workers=2, chunk_size=1) == [True, False, False]
@@ -1,5 +1,5 @@
 import pytest
-from solathon import utils
+from solathon import Keypair, utils
 
 
 def get_rounded_expectation(arg):
@@ -73,3 +73,16 @@ def test_lamport_to_sol_large_input():
     expected = get_rounded_expectation(arg)
     assert utils.lamport_to_sol(arg) == expected
     assert isinstance(expected, float)
+
+
+def test_verify_many():
+    signer = Keypair()
+    messages = [bytes([i]) * 10 for i in range(20)]
+    items = [(signer.public_key, message, signer.sign(message).signature) for message in messages]
+    items[3] = (signer.public_key, b"tampered", items[3][2])
+    items[7] = (str(Keypair().public_key), items[7][1], items[7][2])
+
+    expected = [i not in (3, 7) for i in range(20)]
+    assert utils.verify_many(items, chunk_size=4) == expected
+    assert utils.verify_many(items, max_workers=2, chunk_size=4) == expected
+    assert utils.get_verify_key(signer.public_key) is utils.get_verify_key(str(signer.public_key))
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+from solathon import Keypair, Transaction
+from solathon.core.instructions import AccountMeta, memo, transfer
+from solathon.core.types.block import TransactionElement
+from solathon.solana_pay import TransferValidator, check_transfer, validate_transfer
+
+BLOCKHASH = "GfVcyD4kkTrj4bKc7WA9sZCin9JDbdT4Zkd3EittNR1W"
+
+
+def transaction_json(instructions, signer, amounts, err=None):
+    # getTransaction JSON of a transaction, with the balance change of each account
+    transaction = Transaction(instructions=instructions, signers=[signer], recent_blockhash=BLOCKHASH)
+    transaction.sign()
+    message = Transaction.from_buffer(transaction.serialize())._message
+    keys = [str(key) for key in message.account_keys]
+    pre_balances = [10_000_000_000] * len(keys)
+    post_balances = [balance + amounts.get(key, 0) for key, balance in zip(keys, pre_balances)]
+    return {
+        "slot": 1,
+        "blockTime": None,
+        "transaction": {
+            "signatures": ["sig"],
+            "message": {
+                "accountKeys": keys,
+                "header": {
+                    "numRequiredSignatures": message.header.num_required_signatures,
+                    "numReadonlySignedAccounts": message.header.num_readonly_signed_accounts,
+                    "numReadonlyUnsignedAccounts": message.header.num_readonly_unsigned_accounts,
+                },
+                "instructions": [
+                    {
+                        "programIdIndex": instruction.program_id_index,
+                        "accounts": list(instruction.accounts),
+                        "data": instruction.data,
+                    }
+                    for instruction in message.instructions
+                ],
+                "recentBlockhash": BLOCKHASH,
+            },
+        },
+        "meta": {
+            "err": err, "fee": 5000, "innerInstructions": [], "logMessages": [],
+            "preBalances": pre_balances, "postBalances": post_balances,
+            "preTokenBalances": [], "postTokenBalances": [], "rewards": [], "status": {"Ok": None},
+        },
+    }
+
+
+def payment(amount=0.5, references=1, with_memo=None):
+    sender, recipient = Keypair(), Keypair().public_key
+    reference = [Keypair().public_key for _ in range(references)]
+    instruction = transfer(sender.public_key, recipient, int(amount * 1e9))
+    instruction.keys.extend(AccountMeta(key, False, False) for key in reference)
+    instructions = [memo(with_memo), instruction] if with_memo else [instruction]
+    result = transaction_json(instructions, sender, {str(recipient): int(amount * 1e9)})
+    fields = {"recipient": recipient, "amount": amount, "reference": reference}
+    if with_memo:
+        fields["memo"] = with_memo
+    return result, fields
+
+
+class FakeClient:
+    clean_response = True
+
+    def __init__(self):
+        self.transactions = {}
+        self.batches = []
+
+    def build_and_send_batch_request(self, method, params):
+        assert method == "getTransaction"
+        self.batches.append(params)
+        responses = []
+        for signature, options in params:
+            assert options["maxSupportedTransactionVersion"] == 0
+            if signature == "broken":
+                responses.append({"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "boom"}})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": 1, "result": self.transactions.get(signature)})
+        return responses
+
+    def get_transaction(self, signature, max_supported_transaction_version=0, commitment=None):
+        result = self.transactions.get(signature)
+        return TransactionElement(result) if result else None
+
+
+class FakeAsyncClient(FakeClient):
+    async def build_and_send_batch_request_async(self, method, params):
+        return self.build_and_send_batch_request(method, params)
+
+
+def test_check_transfer():
+    result, fields = payment(0.25, references=2, with_memo="order-42")
+    check_transfer(TransactionElement(result), fields)
+
+    with pytest.raises(ValueError, match="Amount"):
+        check_transfer(TransactionElement(result), {**fields, "amount": 0.26})
+    with pytest.raises(ValueError, match="references"):
+        check_transfer(TransactionElement(result), {**fields, "reference": fields["reference"][:1]})
+    with pytest.raises(ValueError, match="Invalid memo"):
+        check_transfer(TransactionElement(result), {**fields, "memo": "order-43"})
+    with pytest.raises(ValueError, match="Recipient"):
+        check_transfer(TransactionElement(result), {**fields, "recipient": Keypair().public_key})
+
+    failed, fields = payment()
+    failed["meta"]["err"] = {"InstructionError": [0, "Custom"]}
+    with pytest.raises(ValueError, match="Meta failed"):
+        check_transfer(TransactionElement(failed), fields)
+
+
+def test_check_transfer_rejects_malformed_indexes():
+    result, fields = payment()
+    result["transaction"]["message"]["instructions"][-1]["programIdIndex"] = 99
+    with pytest.raises(ValueError, match="account index"):
+        check_transfer(TransactionElement(result), fields)
+
+    result, fields = payment()
+    result["meta"]["postBalances"] = result["meta"]["postBalances"][:1]
+    with pytest.raises(ValueError, match="balance"):
+        check_transfer(TransactionElement(result), fields)
+
+
+def test_validate_transfer():
+    client = FakeClient()
+    client.transactions["sig"], fields = payment()
+    assert validate_transfer(client, "sig", fields).meta.err is None
+    with pytest.raises(ValueError, match="not found"):
+        validate_transfer(client, "missing", fields)
+
+
+def test_validate_many_batches_and_caches():
+    client = FakeClient()
+    payments = []
+    for i in range(5):
+        client.transactions[f"sig{i}"], fields = payment()
+        payments.append((f"sig{i}", fields))
+    payments[3] = ("sig3", {**payments[3][1], "amount": 1})
+    payments.append(("missing", payments[0][1]))
+    payments.append(("broken", payments[0][1]))
+
+    validator = TransferValidator(client, batch_size=3)
+    verdicts = validator.validate_many(payments)
+    assert [verdict.valid for verdict in verdicts] == [True, True, True, False, True, False, False]
+    assert verdicts[3].error == "Amount not transferred to recipient"
+    assert verdicts[5].error == "Transaction not found"
+    assert "boom" in verdicts[6].error
+    assert [len(batch) for batch in client.batches] == [3, 3, 1]
+
+    # Found finalized transactions are cached, missing and failed ones are fetched again
+    client.batches.clear()
+    assert [verdict.valid for verdict in validator.validate_many(payments)] == [True, True, True, False, True, False, False]
+    assert [[params[0] for params in batch] for batch in client.batches] == [["missing", "broken"]]
+
+
+def test_validate_many_async_does_not_cache_unfinalized():
+    client = FakeAsyncClient()
+    payments = []
+    for i in range(4):
+        client.transactions[f"sig{i}"], fields = payment(with_memo="hello")
+        payments.append((f"sig{i}", fields))
+
+    validator = TransferValidator(client, commitment="confirmed", batch_size=2)
+    verdicts = asyncio.run(validator.validate_many_async(payments))
+    assert all(verdict.valid for verdict in verdicts)
+    asyncio.run(validator.validate_many_async(payments))
+    assert len(client.batches) == 4